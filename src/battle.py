@@ -4,13 +4,136 @@ Battle System - Comprehensive Pokemon battle mechanics
 
 import random
 import math
-from typing import Optional, List, Tuple, Dict, Union
+from collections import deque
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict, Union, Callable
 from enum import Enum
-from .pokemon import Pokemon, StatusCondition, Move, PokemonType
+from .pokemon import (
+    Pokemon, StatusCondition, Move, PokemonType, EffectTag, TYPE_CHART, TYPE_INDEX,
+)
 from .items import Item, PokeballItem, get_item
 from .player import Player
 
 
+@lru_cache(maxsize=4096)
+def _damage_kernel(level: int, power: int, attack: int, defense: int,
+                   effectiveness: float, stab: float) -> int:
+    """Average-roll damage estimate used by the AI.
+
+    Pure function of its arguments, so repeated estimates for the same
+    matchup (every move scored on every AI turn) are cache hits.
+    """
+    damage = ((2 * level + 10) / 250) * (attack / defense) * power + 2
+    return int(damage * effectiveness * stab * 0.9)  # Average roll
+
+
+@lru_cache(maxsize=1024)
+def _type_matchup(attacker_types: Tuple[PokemonType, ...],
+                  defender_types: Tuple[PokemonType, ...]) -> float:
+    """Average effectiveness of each attacker type against the defender.
+
+    There are only a few hundred type combinations, so switch and move
+    scoring hit the cache almost every time.
+    """
+    if not attacker_types:
+        return 1.0
+
+    def_indices = [TYPE_INDEX[t] for t in defender_types]
+    total_effectiveness = 0.0
+    for att_type in attacker_types:
+        row = TYPE_CHART[TYPE_INDEX[att_type]]
+        effectiveness = 1.0
+        for d in def_indices:
+            effectiveness *= row[d]
+        total_effectiveness += effectiveness
+
+    return total_effectiveness / len(attacker_types)
+
+
+# 65536 / (255 / rate) ** 0.1875 == _CATCH_K * rate ** 0.1875
+_CATCH_K = 65536.0 / 255.0 ** 0.1875
+
+
+def _shake_count(modified_rate: float, rng: random.Random) -> int:
+    """Roll the four catch shake checks, returning how many passed (4 = caught).
+
+    Kept free of battle state so the whole roll is one small pure-Python
+    loop over locals.
+    """
+    shake_probability = _CATCH_K * max(1, modified_rate) ** 0.1875
+    getrandbits = rng.getrandbits
+    count = 0
+    while count < 4 and getrandbits(16) < shake_probability:
+        count += 1
+    return count
+
+
+def _tick_hail(combatants: Tuple[Pokemon, ...]) -> List[Pokemon]:
+    """Deal one turn of hail damage (1/16 max HP) to non-Ice combatants.
+
+    Returns the Pokemon that were hit so the caller can log them.
+    """
+    hit = []
+    ice = PokemonType.ICE
+    for pokemon in combatants:
+        if not pokemon.is_fainted and ice not in pokemon.types:
+            pokemon.take_damage(max(1, pokemon.stats["hp"] // 16))
+            hit.append(pokemon)
+    return hit
+
+
+def simulate_catch_batch(modified_rate: float, n: int,
+                         rng: Optional[random.Random] = None) -> List[int]:
+    """Sample n catch attempts at one modified catch rate, returning shake counts.
+
+    Meant for AI search that needs many outcomes at once. Each check passes
+    with the same probability p, so "at least k shakes" has probability
+    p ** k and a single uniform draw per attempt picks the count by
+    inverse CDF instead of rolling up to four times. A count of 4 means
+    the Pokemon was caught, as with _shake_count().
+    """
+    rng = rng or random
+    shake_probability = _CATCH_K * max(1, modified_rate) ** 0.1875
+    # Fraction of 16-bit rolls that pass the check in _shake_count()
+    p = min(65536, math.ceil(shake_probability)) / 65536
+    if p >= 1.0:
+        return [4] * n
+    log_p = math.log(p)
+    rand = rng.random
+    # count >= k exactly when u < p ** k, i.e. log(u) / log(p) > k
+    return [min(4, int(math.log(1.0 - rand()) / log_p)) for _ in range(n)]
+
+
+# Catch rate multiplier for the target's status condition (default 1.0)
+_STATUS_CATCH_BONUS: Dict[StatusCondition, float] = {
+    StatusCondition.ASLEEP: 2.0,
+    StatusCondition.FROZEN: 2.0,
+    StatusCondition.PARALYZED: 1.5,
+    StatusCondition.BURNED: 1.5,
+    StatusCondition.POISONED: 1.5,
+    StatusCondition.BADLY_POISONED: 1.5,
+}
+
+# Message after a failed catch, indexed by how many shakes passed (0-3)
+_BREAK_FREE_MESSAGES = (
+    "It didn't even shake!",
+    "It appeared to be caught!",
+    "Aargh! Almost had it!",
+    "Shoot! It was so close, too!",
+)
+
+_WEATHER_STOP_MESSAGES = {
+    "rain": "The rain stopped.",
+    "sun": "The sunlight faded.",
+    "hail": "The hail stopped.",
+}
+
+
+# Struggle is a 50 power physical move. It is only read by calculate_damage
+# and never spends PP, so one shared instance serves every battle.
+_STRUGGLE_MOVE = Move("Struggle", PokemonType.NORMAL, "physical", 50, 100, 999)
+
+
 class BattleType(Enum):
     """Types of battles."""
     WILD = "wild"
@@ -41,21 +164,29 @@ class BattleState(Enum):
 
 class TurnAction:
     """Represents an action to be taken during a turn."""
-    
-    def __init__(self, action_type: str, user: Pokemon, priority: int = 0, **kwargs):
+
+    __slots__ = ("action_type", "user", "priority",
+                 "move_index", "switch_index", "item_id", "target_index")
+
+    def __init__(self, action_type: str, user: Pokemon, priority: int = 0,
+                 move_index: Optional[int] = None, switch_index: Optional[int] = None,
+                 item_id: Optional[str] = None, target_index: int = 0):
         self.action_type = action_type
         self.user = user
         self.priority = priority
-        self.kwargs = kwargs
-    
-    def get_effective_priority(self) -> Tuple[int, int]:
-        """Get effective priority for turn order (priority, speed)."""
-        speed = self.user.get_modified_stat("speed") if self.user else 0
-        return (self.priority, speed)
+        self.move_index = move_index
+        self.switch_index = switch_index
+        self.item_id = item_id
+        self.target_index = target_index
 
 
 class Trainer:
     """Represents an AI trainer in battle."""
+
+    __slots__ = ("name", "trainer_class", "pokemon_team", "active_pokemon",
+                 "prize_money", "ai_level", "items")
+
+    is_trainer = True
     
     def __init__(self, name: str, pokemon_team: List[Pokemon], 
                  trainer_class: str = "Trainer", prize_money: int = 100,
@@ -67,7 +198,7 @@ class Trainer:
         self.prize_money = prize_money
         self.ai_level = ai_level  # 1-5, higher is smarter
         self.items = {}  # Trainer inventory
-    
+
     def get_first_healthy_pokemon(self) -> Optional[Pokemon]:
         """Get the first non-fainted Pokemon."""
         for pokemon in self.pokemon_team:
@@ -91,15 +222,31 @@ class Trainer:
 
 class Battle:
     """Comprehensive Pokemon battle system."""
+
+    LOG_MAX_LENGTH = 256
+
+    __slots__ = (
+        "player", "player_pokemon", "opponent", "opponent_pokemon", "battle_type",
+        "can_catch", "can_run", "rng", "turn", "battle_log", "log_count",
+        "log_enabled", "is_over", "winner", "state", "player_action",
+        "opponent_action", "weather", "weather_turns", "terrain", "terrain_turns",
+        "trick_room_turns", "last_used_move", "consecutive_move_count",
+        "catch_attempts", "shake_count",
+    )
     
     def __init__(self, player: Player, opponent: Union[Pokemon, Trainer], 
                  battle_type: BattleType = BattleType.WILD,
-                 can_catch: bool = True, can_run: bool = True):
+                 can_catch: bool = True, can_run: bool = True,
+                 seed: Optional[int] = None):
         self.player = player
+        # Every roll made during the battle (accuracy, crits, damage, status
+        # and AI choices) goes through this generator, so passing a seed makes
+        # a battle reproducible given the same starting Pokemon.
+        self.rng = random.Random(seed)
         self.player_pokemon = player.active_pokemon
         
         # Handle different opponent types
-        if isinstance(opponent, Pokemon):
+        if not opponent.is_trainer:
             self.opponent = None
             self.opponent_pokemon = opponent
             self.battle_type = BattleType.WILD
@@ -113,7 +260,14 @@ class Battle:
         
         # Battle state
         self.turn = 0
-        self.battle_log: List[str] = []
+        # Only the recent window is ever shown; older messages are dropped.
+        # log_count keeps counting past the cap so observers can still tell
+        # when new messages arrive.
+        self.battle_log: deque = deque(maxlen=self.LOG_MAX_LENGTH)
+        self.log_count = 0
+        # Headless simulations can switch this off to skip building the
+        # per-move messages altogether.
+        self.log_enabled = True
         self.is_over = False
         self.winner = None
         self.state = BattleState.SELECTING_ACTION
@@ -151,19 +305,30 @@ class Battle:
     
     def add_to_log(self, message: str):
         """Add message to battle log."""
-        if message.strip():
+        if self.log_enabled and message.strip():
             self.battle_log.append(message)
+            self.log_count += 1
+
+    def _log(self, fmt: str, *args):
+        """Format and log a message only when logging is enabled.
+
+        Hot paths call this instead of add_to_log with an f-string so the
+        message is never built when nobody reads the log.
+        """
+        if self.log_enabled:
+            self.battle_log.append(fmt % args if args else fmt)
+            self.log_count += 1
     
     def get_valid_actions(self) -> List[BattleAction]:
         """Get list of valid actions for current state."""
         actions = [BattleAction.FIGHT]
         
         # Check if player has usable items
-        if any(count > 0 for count in self.player.inventory.values()):
+        if self.player.inventory.nonzero_count > 0:
             actions.append(BattleAction.BAG)
         
         # Check if player can switch Pokemon
-        if any(p != self.player_pokemon and not p.is_fainted 
+        if any(p != self.player_pokemon and not p.is_fainted
                for p in self.player.pokemon_team):
             actions.append(BattleAction.POKEMON)
         
@@ -175,11 +340,8 @@ class Battle:
     
     def get_valid_moves(self) -> List[Tuple[int, Move]]:
         """Get list of valid moves for the active Pokemon."""
-        valid_moves = []
-        for i, move in enumerate(self.player_pokemon.moves):
-            if move.current_pp > 0:
-                valid_moves.append((i, move))
-        return valid_moves
+        moves = self.player_pokemon.moves
+        return [(i, moves[i]) for i in self.player_pokemon.get_valid_move_indices()]
     
     def get_switchable_pokemon(self) -> List[Tuple[int, Pokemon]]:
         """Get list of Pokemon that can be switched to."""
@@ -254,15 +416,15 @@ class Battle:
     
     def _get_wild_pokemon_move(self) -> TurnAction:
         """Get move for wild Pokemon (simple AI)."""
-        valid_moves = [(i, m) for i, m in enumerate(self.opponent_pokemon.moves) 
-                       if m.current_pp > 0]
+        valid_indices = self.opponent_pokemon.get_valid_move_indices()
         
-        if not valid_moves:
+        if not valid_indices:
             # Struggle if no PP
             return TurnAction("struggle", self.opponent_pokemon)
         
         # Random move selection for wild Pokemon
-        move_index, move = random.choice(valid_moves)
+        move_index = self.rng.choice(valid_indices)
+        move = self.opponent_pokemon.moves[move_index]
         return TurnAction(
             "move", self.opponent_pokemon,
             priority=move.priority,
@@ -304,16 +466,18 @@ class Battle:
         
         current = self.opponent_pokemon
         player = self.player_pokemon
+        current_hp = current.current_hp
+        current_hp_max = current.stats["hp"]
         
         # Switch if current Pokemon has bad type matchup
         effectiveness = self._calculate_type_matchup(player.types, current.types)
-        if effectiveness >= 2.0 and current.current_hp > current.stats["hp"] * 0.5:
-            return random.random() < 0.7  # 70% chance to switch
+        if effectiveness >= 2.0 and current_hp > current_hp_max * 0.5:
+            return self.rng.random() < 0.7  # 70% chance to switch
         
         # Switch if current Pokemon is at low HP and not faster
-        if (current.current_hp < current.stats["hp"] * 0.25 and 
+        if (current_hp < current_hp_max * 0.25 and
             current.get_modified_stat("speed") < player.get_modified_stat("speed")):
-            return random.random() < 0.8  # 80% chance to switch
+            return self.rng.random() < 0.8  # 80% chance to switch
         
         return False
     
@@ -323,26 +487,28 @@ class Battle:
             return None
         
         player = self.player_pokemon
+        player_types = player.types
+        player_speed = player.get_modified_stat("speed")
+        active = self.opponent_pokemon
         best_score = -999
         best_index = None
         
         for i, pokemon in enumerate(self.opponent.pokemon_team):
-            if pokemon.is_fainted or pokemon == self.opponent_pokemon:
+            if pokemon.is_fainted or pokemon is active:
                 continue
             
             # Calculate switch score
             score = 0
             
             # Type effectiveness
-            effectiveness = self._calculate_type_matchup(pokemon.types, player.types)
+            effectiveness = self._calculate_type_matchup(pokemon.types, player_types)
             score += (2 - effectiveness) * 50  # Favor good defensive matchups
             
             # HP percentage
-            hp_percent = pokemon.current_hp / pokemon.stats["hp"]
-            score += hp_percent * 30
+            score += pokemon.current_hp / pokemon.stats["hp"] * 30
             
             # Speed advantage
-            if pokemon.get_modified_stat("speed") > player.get_modified_stat("speed"):
+            if pokemon.get_modified_stat("speed") > player_speed:
                 score += 20
             
             # Status condition penalty
@@ -371,87 +537,98 @@ class Battle:
         opp_pokemon = self.opponent_pokemon
         player_pokemon = self.player_pokemon
         
-        valid_moves = [(i, m) for i, m in enumerate(opp_pokemon.moves) 
-                       if m.current_pp > 0]
+        valid_indices = opp_pokemon.get_valid_move_indices()
         
-        if not valid_moves:
+        if not valid_indices:
             return TurnAction("struggle", opp_pokemon)
         
+        moves = opp_pokemon.moves
         if ai_level == 1:
             # Level 1: Random moves
-            move_index, move = random.choice(valid_moves)
+            move_index = self.rng.choice(valid_indices)
+            move = moves[move_index]
             return TurnAction("move", opp_pokemon, priority=move.priority, move_index=move_index)
         
         # Level 2+: Smarter move selection
         best_score = -999
         best_move_index = 0
-        best_move = valid_moves[0][1]
+        best_move = moves[valid_indices[0]]
+
+        # Move numbers are cached per moveset; defender type columns are
+        # resolved once so each move's effectiveness is a couple of indexes
+        profiles = opp_pokemon.get_move_profiles()
+        def_indices = [TYPE_INDEX[t] for t in player_pokemon.types]
+
+        # Stats and HP ratios don't change between candidate moves
+        att_phys = opp_pokemon.get_modified_stat("attack")
+        att_spec = opp_pokemon.get_modified_stat("sp_attack")
+        def_phys = max(1, player_pokemon.get_modified_stat("defense"))
+        def_spec = max(1, player_pokemon.get_modified_stat("sp_defense"))
+        opp_hp_percent = opp_pokemon.current_hp / opp_pokemon.stats["hp"]
+        player_hp_percent = player_pokemon.current_hp / player_pokemon.stats["hp"]
 
-        for move_index, move in valid_moves:
+        for move_index in valid_indices:
+            move = moves[move_index]
             score = 0
             effectiveness = 1.0  # Default for status moves and type-neutral
+            type_index, power, accuracy, stab = profiles[move_index]
 
             # Base power
             if move.category != "status":
-                score += move.power
+                score += power
 
                 # Type effectiveness
-                effectiveness = opp_pokemon.get_type_effectiveness(move.type, player_pokemon.types)
+                row = TYPE_CHART[type_index]
+                for d in def_indices:
+                    effectiveness *= row[d]
                 score *= effectiveness
 
                 # STAB bonus
-                if move.type in opp_pokemon.types:
-                    score *= 1.5
+                score *= stab
 
                 # Category matchup
                 if move.category == "physical":
-                    defense_stat = max(1, player_pokemon.get_modified_stat("defense"))
-                    attack_ratio = opp_pokemon.get_modified_stat("attack") / defense_stat
+                    attack, defense = att_phys, def_phys
                 else:
-                    sp_defense_stat = max(1, player_pokemon.get_modified_stat("sp_defense"))
-                    attack_ratio = opp_pokemon.get_modified_stat("sp_attack") / sp_defense_stat
-                score *= attack_ratio
+                    attack, defense = att_spec, def_spec
+                score *= attack / defense
 
             # Status moves
             else:
                 # Prioritize status moves when appropriate
-                if move.effect == "paralysis" and player_pokemon.status == StatusCondition.NONE:
+                tag = move.effect_tag
+                if tag == EffectTag.PARALYSIS and player_pokemon.status == StatusCondition.NONE:
                     score += 60
-                elif move.effect == "sleep" and player_pokemon.status == StatusCondition.NONE:
+                elif tag == EffectTag.SLEEP and player_pokemon.status == StatusCondition.NONE:
                     score += 80
-                elif move.effect == "burn" and player_pokemon.status == StatusCondition.NONE:
+                elif tag == EffectTag.BURN and player_pokemon.status == StatusCondition.NONE:
                     score += 50
-                elif move.effect and "raise" in move.effect:
-                    # Extract stat name from effect
-                    stat_parts = move.effect.split("_")
-                    if len(stat_parts) >= 2:
-                        stat_name = "_".join(stat_parts[1:])
-                        if stat_name in opp_pokemon.stat_stages and opp_pokemon.stat_stages[stat_name] < 2:
-                            score += 40
+                elif tag.is_stat_raise:
+                    if opp_pokemon.stat_stages[tag.raised_stat] < 2:
+                        score += 40
             
             # AI level adjustments
             if ai_level >= 3:
                 # Consider accuracy
-                score *= (move.accuracy / 100)
+                score *= (accuracy / 100)
                 
                 # Avoid ineffective moves
                 if move.category != "status" and effectiveness == 0:
                     score = -1000
             
             if ai_level >= 4:
-                # Consider HP thresholds
-                opp_hp_percent = opp_pokemon.current_hp / opp_pokemon.stats["hp"]
-                player_hp_percent = player_pokemon.current_hp / player_pokemon.stats["hp"]
-                
                 # Prioritize finishing moves
                 if move.category != "status":
-                    estimated_damage = self._estimate_damage(move, opp_pokemon, player_pokemon)
+                    # Stats, effectiveness and STAB are already in hand, so
+                    # go straight to the kernel
+                    estimated_damage = _damage_kernel(opp_pokemon.level, power, attack,
+                                                      defense, effectiveness, stab)
                     if estimated_damage >= player_pokemon.current_hp:
                         score += 100
                 
                 # Use setup moves when safe
                 if opp_hp_percent > 0.7 and player_hp_percent < 0.3:
-                    if move.effect and "raise" in move.effect:
+                    if move.effect_tag.is_stat_raise:
                         score += 50
             
             if score > best_score:
@@ -461,84 +638,43 @@ class Battle:
         
         return TurnAction("move", opp_pokemon, priority=best_move.priority, move_index=best_move_index)
     
-    def _estimate_damage(self, move: Move, attacker: Pokemon, defender: Pokemon) -> int:
-        """Estimate damage for AI calculations."""
-        if move.category == "status":
-            return 0
-        
-        # Simplified damage calculation for AI
-        if move.category == "physical":
-            attack = attacker.get_modified_stat("attack")
-            defense = max(1, defender.get_modified_stat("defense"))
-        else:
-            attack = attacker.get_modified_stat("sp_attack")
-            defense = max(1, defender.get_modified_stat("sp_defense"))
-
-        damage = ((2 * attacker.level + 10) / 250) * (attack / defense) * move.power + 2
-        
-        # Type effectiveness
-        effectiveness = attacker.get_type_effectiveness(move.type, defender.types)
-        damage *= effectiveness
-        
-        # STAB
-        if move.type in attacker.types:
-            damage *= 1.5
-        
-        return int(damage * 0.9)  # Average roll
-    
     def _calculate_type_matchup(self, attacker_types: List[PokemonType],
                                 defender_types: List[PokemonType]) -> float:
         """Calculate overall type matchup advantage using the actual type chart."""
-        from .pokemon import TYPE_EFFECTIVENESS
-
-        total_effectiveness = 0
-        count = 0
-
-        for att_type in attacker_types:
-            effectiveness = 1.0
-            for def_type in defender_types:
-                if att_type in TYPE_EFFECTIVENESS and def_type in TYPE_EFFECTIVENESS[att_type]:
-                    effectiveness *= TYPE_EFFECTIVENESS[att_type][def_type]
-            total_effectiveness += effectiveness
-            count += 1
-
-        return total_effectiveness / count if count > 0 else 1.0
+        return _type_matchup(tuple(attacker_types), tuple(defender_types))
     
     def _execute_turn(self):
         """Execute the turn with both actions."""
         self.turn += 1
         turn_actions = []
-        
-        # Collect actions
+
+        # Trick room reverses speed order within the same priority bracket
+        speed_sign = -1 if self.trick_room_turns > 0 else 1
+
+        # Collect actions as (order_key, actor, action). Priority and speed
+        # are packed into one int (priority above bit 20, signed speed below)
+        # so the sort compares a single number; speeds are far below 2**20.
+        # On a full tie "player" sorts ahead of "opponent", as before.
         if self.player_action:
-            turn_actions.append(("player", self.player_action))
+            p_speed = self.player_pokemon.get_modified_stat("speed")
+            turn_actions.append(((self.player_action.priority << 20) + speed_sign * p_speed,
+                                 "player", self.player_action))
         if self.opponent_action:
-            turn_actions.append(("opponent", self.opponent_action))
-        
+            o_speed = self.opponent_pokemon.get_modified_stat("speed")
+            turn_actions.append(((self.opponent_action.priority << 20) + speed_sign * o_speed,
+                                 "opponent", self.opponent_action))
+
         # Sort by priority and speed
-        turn_actions.sort(key=lambda x: x[1].get_effective_priority(), reverse=True)
-        
-        # Apply trick room effect
-        if self.trick_room_turns > 0:
-            # Reverse speed order within same priority
-            # This is simplified - would need more complex sorting
-            pass
-        
+        turn_actions.sort(reverse=True)
+
         # Execute actions in order
-        for actor, action in turn_actions:
+        for _, actor, action in turn_actions:
             if self.is_over:
                 break
             
-            if action.action_type == "move":
-                self._execute_move(actor, action)
-            elif action.action_type == "item":
-                self._execute_item(actor, action)
-            elif action.action_type == "switch":
-                self._execute_switch(actor, action)
-            elif action.action_type == "run":
-                self._execute_run(actor, action)
-            elif action.action_type == "struggle":
-                self._execute_struggle(actor, action)
+            handler = _ACTION_HANDLERS.get(action.action_type)
+            if handler is not None:
+                handler(self, actor, action)
         
         # End of turn effects
         if not self.is_over:
@@ -558,28 +694,29 @@ class Battle:
         defender = self.opponent_pokemon if actor == "player" else self.player_pokemon
         
         # Check if attacker can move
-        can_move, status_events = attacker.process_status()
-        for event in status_events:
-            self.add_to_log(event)
+        can_move, status_events = attacker.process_status(self.rng)
+        if self.log_enabled:
+            for event in status_events:
+                self.add_to_log(event)
         
         if not can_move:
             return
         
         # Check flinch
         if getattr(attacker, 'flinched', False):
-            self.add_to_log(f"{attacker.nickname} flinched and couldn't move!")
+            self._log("%s flinched and couldn't move!", attacker.nickname)
             attacker.flinched = False  # Flinch only lasts one turn
             return
         
         # Get and use move
-        move_index = action.kwargs["move_index"]
+        move_index = action.move_index
         move = attacker.moves[move_index]
         
         if not move.use():
-            self.add_to_log(f"{attacker.nickname} has no PP left for {move.name}!")
+            self._log("%s has no PP left for %s!", attacker.nickname, move.name)
             return
         
-        self.add_to_log(f"{attacker.nickname} used {move.name}!")
+        self._log("%s used %s!", attacker.nickname, move.name)
         
         # Calculate hit/miss
         accuracy = move.accuracy
@@ -587,8 +724,8 @@ class Battle:
             accuracy *= attacker.get_accuracy_multiplier()
             accuracy *= defender.get_evasion_multiplier()
             
-            if random.randint(1, 100) > accuracy:
-                self.add_to_log("But it missed!")
+            if self.rng.randrange(100) + 1 > accuracy:
+                self._log("But it missed!")
                 return
         
         # Execute move effect
@@ -607,22 +744,24 @@ class Battle:
     def _execute_damage_move(self, attacker: Pokemon, defender: Pokemon, move: Move):
         """Execute a damaging move."""
         # Calculate damage
-        damage, effectiveness, events = attacker.calculate_damage(move, defender)
+        damage, effectiveness, events = attacker.calculate_damage(move, defender, rng=self.rng)
         
         # Apply damage
         if damage > 0:
-            for event in events:
-                self.add_to_log(event)
+            log_enabled = self.log_enabled
+            if log_enabled:
+                for event in events:
+                    self.add_to_log(event)
             
             damage_events = defender.take_damage(damage)
-            self.add_to_log(f"{defender.nickname} took {damage} damage!")
-            
-            for event in damage_events:
-                self.add_to_log(event)
+            if log_enabled:
+                self._log("%s took %d damage!", defender.nickname, damage)
+                for event in damage_events:
+                    self.add_to_log(event)
             
             # Check for additional effects
             if move.effect and move.effect_chance > 0:
-                if random.randint(1, 100) <= move.effect_chance:
+                if self.rng.randrange(100) + 1 <= move.effect_chance:
                     self._apply_move_effect(move.effect, attacker, defender)
             
             # Check if defender fainted
@@ -634,165 +773,67 @@ class Battle:
         if move.effect:
             self._apply_move_effect(move.effect, attacker, defender)
         else:
-            self.add_to_log("But nothing happened!")
+            self._log("But nothing happened!")
     
     def _apply_move_effect(self, effect: str, attacker: Pokemon, target: Pokemon):
         """Apply a move's additional effect."""
-        if effect == "paralysis":
-            if target.apply_status(StatusCondition.PARALYZED):
-                self.add_to_log(f"{target.nickname} was paralyzed!")
-            else:
-                self.add_to_log(f"{target.nickname} is already affected by a status condition!")
-        
-        elif effect == "burn":
-            if target.apply_status(StatusCondition.BURNED):
-                self.add_to_log(f"{target.nickname} was burned!")
-        
-        elif effect == "freeze":
-            if target.apply_status(StatusCondition.FROZEN):
-                self.add_to_log(f"{target.nickname} was frozen solid!")
-        
-        elif effect == "poison":
-            if target.apply_status(StatusCondition.POISONED):
-                self.add_to_log(f"{target.nickname} was poisoned!")
-        
-        elif effect == "sleep":
-            if target.apply_status(StatusCondition.ASLEEP):
-                self.add_to_log(f"{target.nickname} fell asleep!")
-        
-        elif effect == "confusion":
-            if target.confusion_turns == 0:
-                target.confusion_turns = random.randint(1, 4)
-                self.add_to_log(f"{target.nickname} became confused!")
-        
-        elif effect == "flinch":
-            # Flinch is a volatile status; track separately to avoid overwriting
-            # the main status (burn, poison, etc.)
-            target.flinched = True
-        
-        elif effect == "lower_attack":
-            success, message = target.modify_stat_stage("attack", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_defense":
-            success, message = target.modify_stat_stage("defense", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_speed":
-            success, message = target.modify_stat_stage("speed", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_sp_attack":
-            success, message = target.modify_stat_stage("sp_attack", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_sp_defense":
-            success, message = target.modify_stat_stage("sp_defense", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_accuracy":
-            success, message = target.modify_stat_stage("accuracy", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "lower_evasion":
-            success, message = target.modify_stat_stage("evasion", -1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_attack":
-            success, message = attacker.modify_stat_stage("attack", 1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_defense":
-            success, message = attacker.modify_stat_stage("defense", 1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_speed":
-            success, message = attacker.modify_stat_stage("speed", 1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_sp_attack":
-            success, message = attacker.modify_stat_stage("sp_attack", 1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_sp_defense":
-            success, message = attacker.modify_stat_stage("sp_defense", 1)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_defense_sharply":
-            success, message = attacker.modify_stat_stage("defense", 2)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_sp_attack_sharply":
-            success, message = attacker.modify_stat_stage("sp_attack", 2)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_sp_defense_sharply":
-            success, message = attacker.modify_stat_stage("sp_defense", 2)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "raise_speed_sharply":
-            success, message = attacker.modify_stat_stage("speed", 2)
-            if success:
-                self.add_to_log(message)
-        
-        elif effect == "dragon_dance":
-            success1, message1 = attacker.modify_stat_stage("attack", 1)
-            success2, message2 = attacker.modify_stat_stage("speed", 1)
-            if success1:
-                self.add_to_log(message1)
-            if success2:
-                self.add_to_log(message2)
-        
-        elif effect == "shell_smash":
-            # Lower defenses
-            attacker.modify_stat_stage("defense", -1)
-            attacker.modify_stat_stage("sp_defense", -1)
-            # Raise offenses and speed
-            success1, message1 = attacker.modify_stat_stage("attack", 2)
-            success2, message2 = attacker.modify_stat_stage("sp_attack", 2)
-            success3, message3 = attacker.modify_stat_stage("speed", 2)
-            if success1 or success2 or success3:
-                self.add_to_log(f"{attacker.nickname} broke its shell!")
-        
-        elif effect == "heal":
-            amount = attacker.stats["hp"] // 2
-            if attacker.heal(amount):
-                self.add_to_log(f"{attacker.nickname} restored its HP!")
-        
-        elif effect == "weather_rain":
-            self.weather = "rain"
-            self.weather_turns = 5
-            self.add_to_log("It started to rain!")
-        
-        elif effect == "weather_sun":
-            self.weather = "sun"
-            self.weather_turns = 5
-            self.add_to_log("The sunlight turned harsh!")
-        
-        elif effect == "weather_hail":
-            self.weather = "hail"
-            self.weather_turns = 5
-            self.add_to_log("It started to hail!")
+        handler = _EFFECT_HANDLERS.get(effect)
+        if handler is not None:
+            handler(self, attacker, target)
+
+    def _apply_status_effect(self, target: Pokemon, status: StatusCondition,
+                             message: str, failure_message: Optional[str] = None):
+        """Inflict a major status condition and log the outcome."""
+        if target.apply_status(status, self.rng):
+            self._log("%s %s", target.nickname, message)
+        elif failure_message:
+            self._log("%s %s", target.nickname, failure_message)
+
+    def _apply_stat_change(self, pokemon: Pokemon, stat: str, stages: int):
+        """Change a stat stage, logging only when it actually changed."""
+        success, message = pokemon.modify_stat_stage(stat, stages)
+        if success:
+            self._log(message)
+
+    def _effect_confusion(self, attacker: Pokemon, target: Pokemon):
+        if target.confusion_turns == 0:
+            target.confusion_turns = self.rng.randint(1, 4)
+            self._log("%s became confused!", target.nickname)
+
+    def _effect_flinch(self, attacker: Pokemon, target: Pokemon):
+        # Flinch is a volatile status; track separately to avoid overwriting
+        # the main status (burn, poison, etc.)
+        target.flinched = True
+
+    def _effect_dragon_dance(self, attacker: Pokemon, target: Pokemon):
+        self._apply_stat_change(attacker, "attack", 1)
+        self._apply_stat_change(attacker, "speed", 1)
+
+    def _effect_shell_smash(self, attacker: Pokemon, target: Pokemon):
+        # Lower defenses
+        attacker.modify_stat_stage("defense", -1)
+        attacker.modify_stat_stage("sp_defense", -1)
+        # Raise offenses and speed
+        success1, _ = attacker.modify_stat_stage("attack", 2)
+        success2, _ = attacker.modify_stat_stage("sp_attack", 2)
+        success3, _ = attacker.modify_stat_stage("speed", 2)
+        if success1 or success2 or success3:
+            self._log("%s broke its shell!", attacker.nickname)
+
+    def _effect_heal(self, attacker: Pokemon, target: Pokemon):
+        amount = attacker.stats["hp"] // 2
+        if attacker.heal(amount):
+            self._log("%s restored its HP!", attacker.nickname)
+
+    def _start_weather(self, weather: str, message: str):
+        self.weather = weather
+        self.weather_turns = 5
+        self._log(message)
     
     def _execute_item(self, actor: str, action: TurnAction):
         """Execute an item use."""
-        item_id = action.kwargs["item_id"]
-        target_index = action.kwargs.get("target_index", 0)
+        item_id = action.item_id
+        target_index = action.target_index
         
         if actor == "player":
             item = get_item(item_id)
@@ -835,12 +876,7 @@ class Battle:
         catch_rate = 45  # Base catch rate (would come from species data)
         
         # Status bonus
-        status_bonus = 1.0
-        if target.status in [StatusCondition.ASLEEP, StatusCondition.FROZEN]:
-            status_bonus = 2.0
-        elif target.status in [StatusCondition.PARALYZED, StatusCondition.BURNED, 
-                               StatusCondition.POISONED, StatusCondition.BADLY_POISONED]:
-            status_bonus = 1.5
+        status_bonus = _STATUS_CATCH_BONUS.get(target.status, 1.0)
         
         # Calculate modified catch rate
         modified_rate = (((3 * max_hp - 2 * current_hp) * catch_rate * pokeball.catch_rate_modifier * status_bonus) / (3 * max_hp))
@@ -851,30 +887,15 @@ class Battle:
             return
         
         # Shake checks (4 shakes = catch)
-        modified_rate = max(1, modified_rate)
-        shake_probability = 65536 / (255 / modified_rate) ** 0.1875
-        
-        self.shake_count = 0
-        for i in range(4):
-            if random.randint(0, 65535) < shake_probability:
-                self.shake_count += 1
-                if i < 3:
-                    self.add_to_log("*shake*")
-            else:
-                break
+        self.shake_count = _shake_count(modified_rate, self.rng)
+        for _ in range(min(self.shake_count, 3)):
+            self._log("*shake*")
         
         if self.shake_count >= 4:
             self._catch_success()
         else:
             self.add_to_log(f"Oh no! The Pokemon broke free!")
-            if self.shake_count == 0:
-                self.add_to_log("It didn't even shake!")
-            elif self.shake_count == 1:
-                self.add_to_log("It appeared to be caught!")
-            elif self.shake_count == 2:
-                self.add_to_log("Aargh! Almost had it!")
-            elif self.shake_count == 3:
-                self.add_to_log("Shoot! It was so close, too!")
+            self.add_to_log(_BREAK_FREE_MESSAGES[self.shake_count])
     
     def _catch_success(self):
         """Handle successful Pokemon catch."""
@@ -891,7 +912,7 @@ class Battle:
     
     def _execute_switch(self, actor: str, action: TurnAction):
         """Execute a Pokemon switch."""
-        switch_index = action.kwargs["switch_index"]
+        switch_index = action.switch_index
         
         if actor == "player":
             old_pokemon = self.player_pokemon
@@ -922,7 +943,7 @@ class Battle:
             opponent_speed_divisor = max(1, opponent_speed // 4)
             escape_chance = ((player_speed * 32) // opponent_speed_divisor) % 256 + 30 * (self.turn - 1)
             
-            if escape_chance >= 256 or random.randint(0, 255) < escape_chance:
+            if escape_chance >= 256 or self.rng.getrandbits(8) < escape_chance:
                 self.add_to_log("Got away safely!")
                 self.end_battle("ran")
             else:
@@ -936,9 +957,7 @@ class Battle:
         self.add_to_log(f"{attacker.nickname} has no moves left!")
         self.add_to_log(f"{attacker.nickname} used Struggle!")
         
-        # Struggle is a 50 power physical move
-        struggle_move = Move("Struggle", PokemonType.NORMAL, "physical", 50, 100, 999)
-        damage, _, _ = attacker.calculate_damage(struggle_move, defender)
+        damage, _, _ = attacker.calculate_damage(_STRUGGLE_MOVE, defender, rng=self.rng)
         
         defender.take_damage(damage)
         self.add_to_log(f"{defender.nickname} took {damage} damage!")
@@ -1002,29 +1021,24 @@ class Battle:
     
     def _process_end_of_turn(self):
         """Process end-of-turn effects."""
+        if self.is_over:
+            return
+        combatants = (self.player_pokemon, self.opponent_pokemon)
+
         # Weather effects
         if self.weather:
             self.weather_turns -= 1
             
             if self.weather == "hail":
-                # Hail damages non-Ice types
-                for pokemon in [self.player_pokemon, self.opponent_pokemon]:
-                    if not pokemon.is_fainted and PokemonType.ICE not in pokemon.types:
-                        damage = max(1, pokemon.stats["hp"] // 16)
-                        pokemon.take_damage(damage)
-                        self.add_to_log(f"{pokemon.nickname} is buffeted by the hail!")
+                for pokemon in _tick_hail(combatants):
+                    self._log("%s is buffeted by the hail!", pokemon.nickname)
             
             if self.weather_turns <= 0:
-                if self.weather == "rain":
-                    self.add_to_log("The rain stopped.")
-                elif self.weather == "sun":
-                    self.add_to_log("The sunlight faded.")
-                elif self.weather == "hail":
-                    self.add_to_log("The hail stopped.")
+                self.add_to_log(_WEATHER_STOP_MESSAGES.get(self.weather, ""))
                 self.weather = None
         
         # Status damage
-        for pokemon in [self.player_pokemon, self.opponent_pokemon]:
+        for pokemon in combatants:
             if not pokemon.is_fainted:
                 damage_events = pokemon.apply_end_turn_damage()
                 for event in damage_events:
@@ -1038,7 +1052,9 @@ class Battle:
         """End the battle with given result."""
         self.is_over = True
         self.winner = result
+        self.state = BattleState.BATTLE_END
         
+        # Running away ("ran") needs no closing messages
         if result == "player":
             self.add_to_log("You won!")
             
@@ -1053,12 +1069,6 @@ class Battle:
             if self.opponent:
                 self.add_to_log(f"You blacked out!")
                 # Could teleport to Pokemon Center here
-        
-        elif result == "ran":
-            # Successfully ran away
-            pass
-        
-        self.state = BattleState.BATTLE_END
     
     def get_battle_status(self) -> Dict:
         """Get current battle status for UI."""
@@ -1069,7 +1079,7 @@ class Battle:
                 "hp": self.player_pokemon.current_hp,
                 "max_hp": self.player_pokemon.stats["hp"],
                 "status": self.player_pokemon.status.value,
-                "types": [t.value for t in self.player_pokemon.types]
+                "types": self.player_pokemon.type_values
             },
             "opponent_pokemon": {
                 "name": self.opponent_pokemon.species_name,
@@ -1077,7 +1087,7 @@ class Battle:
                 "hp": self.opponent_pokemon.current_hp,
                 "max_hp": self.opponent_pokemon.stats["hp"],
                 "status": self.opponent_pokemon.status.value,
-                "types": [t.value for t in self.opponent_pokemon.types]
+                "types": self.opponent_pokemon.type_values
             },
             "turn": self.turn,
             "is_over": self.is_over,
@@ -1086,4 +1096,55 @@ class Battle:
             "can_run": self.can_run,
             "weather": self.weather,
             "state": self.state.value
-        }
\ No newline at end of file
+        }
+
+
+# TurnAction.action_type -> executor(battle, actor, action)
+_ACTION_HANDLERS: Dict[str, Callable[[Battle, str, TurnAction], None]] = {
+    "move": Battle._execute_move,
+    "item": Battle._execute_item,
+    "switch": Battle._execute_switch,
+    "run": Battle._execute_run,
+    "struggle": Battle._execute_struggle,
+}
+
+# Move effect name -> handler(battle, attacker, target). Looked up once per
+# effect instead of walking a long elif chain of string comparisons.
+_EFFECT_HANDLERS: Dict[str, Callable[[Battle, Pokemon, Pokemon], None]] = {
+    "paralysis": lambda b, a, t: b._apply_status_effect(
+        t, StatusCondition.PARALYZED, "was paralyzed!",
+        "is already affected by a status condition!"),
+    "burn": lambda b, a, t: b._apply_status_effect(t, StatusCondition.BURNED, "was burned!"),
+    "freeze": lambda b, a, t: b._apply_status_effect(t, StatusCondition.FROZEN, "was frozen solid!"),
+    "poison": lambda b, a, t: b._apply_status_effect(t, StatusCondition.POISONED, "was poisoned!"),
+    "sleep": lambda b, a, t: b._apply_status_effect(t, StatusCondition.ASLEEP, "fell asleep!"),
+    "confusion": Battle._effect_confusion,
+    "flinch": Battle._effect_flinch,
+    "dragon_dance": Battle._effect_dragon_dance,
+    "shell_smash": Battle._effect_shell_smash,
+    "heal": Battle._effect_heal,
+    "weather_rain": lambda b, a, t: b._start_weather("rain", "It started to rain!"),
+    "weather_sun": lambda b, a, t: b._start_weather("sun", "The sunlight turned harsh!"),
+    "weather_hail": lambda b, a, t: b._start_weather("hail", "It started to hail!"),
+}
+
+
+def _make_stat_handler(stat: str, stages: int, target_is_attacker: bool):
+    """Build an effect handler that shifts one stat stage on the user or target."""
+    if target_is_attacker:
+        def handler(battle: Battle, attacker: Pokemon, target: Pokemon):
+            battle._apply_stat_change(attacker, stat, stages)
+    else:
+        def handler(battle: Battle, attacker: Pokemon, target: Pokemon):
+            battle._apply_stat_change(target, stat, stages)
+    return handler
+
+
+# Stat-stage effects: "lower_<stat>" hits the target, "raise_<stat>" the
+# user, and a "_sharply" suffix doubles the stage change.
+for _stat in ("attack", "defense", "speed", "sp_attack", "sp_defense", "accuracy", "evasion"):
+    for _prefix, _stages in (("lower", -1), ("lower", -2), ("raise", 1), ("raise", 2)):
+        _key = f"{_prefix}_{_stat}" + ("_sharply" if abs(_stages) == 2 else "")
+        _EFFECT_HANDLERS[_key] = _make_stat_handler(_stat, _stages,
+                                                    target_is_attacker=(_prefix == "raise"))
+del _stat, _prefix, _stages, _key
@@ -5,6 +5,7 @@ Battle Animation System - Visual effects for moves and attacks
 import pygame
 import math
 import random
+from collections import deque
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
@@ -35,6 +36,43 @@ class AnimationType(Enum):
     FAIRY = "fairy"
 
 
+# (color, radius, hole) -> pre-drawn full-alpha particle sprite, see _circle_sprite()
+_CIRCLE_CACHE: Dict[tuple, pygame.Surface] = {}
+_CIRCLE_CACHE_MAX = 2048
+
+
+def _circle_sprite(color: Tuple[int, int, int], radius: int,
+                   hole: int = 0) -> pygame.Surface:
+    """Get a cached, fully opaque SRCALPHA circle sprite.
+
+    The sprite is (2 * radius + 2) pixels square with the circle centred at
+    (radius + 1, radius + 1). A nonzero hole leaves a transparent centre of
+    that radius for a separately faded core. The sprite is shared, so fade it
+    with set_alpha() right before blitting rather than drawing a new circle
+    for every alpha.
+    """
+    key = (color, radius, hole)
+    sprite = _CIRCLE_CACHE.get(key)
+    if sprite is None:
+        if len(_CIRCLE_CACHE) >= _CIRCLE_CACHE_MAX:
+            _CIRCLE_CACHE.clear()
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        center = (radius + 1, radius + 1)
+        pygame.draw.circle(sprite, color, center, radius)
+        if hole:
+            pygame.draw.circle(sprite, (0, 0, 0, 0), center, hole)
+        _CIRCLE_CACHE[key] = sprite
+    return sprite
+
+
+def _blit_circle(screen: pygame.Surface, color: Tuple[int, int, int],
+                 radius: int, alpha: int, center: Tuple[int, int], hole: int = 0):
+    """Draw a cached circle sprite centred on center at the given alpha."""
+    sprite = _circle_sprite(color, radius, hole)
+    sprite.set_alpha(alpha)
+    screen.blit(sprite, (center[0] - radius - 1, center[1] - radius - 1))
+
+
 class BattleAnimation:
     """Base class for battle animations."""
 
@@ -186,43 +224,90 @@ class DamagePopup(BattleAnimation):
             screen.blit(eff_text, eff_rect)
 
 
+class _Particle:
+    """A single moving particle with a short position trail."""
+
+    __slots__ = ('x', 'y', 'vx', 'vy', 'size', 'color', 'gravity', 'trail')
+
+    def __init__(self, x: float, y: float, vx: float, vy: float, size: float,
+                 color: Tuple[int, int, int], gravity: float, trail_length: int = 4):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+        self.color = color
+        self.gravity = gravity
+        self.trail: deque = deque(maxlen=trail_length)
+
+
 class HitAnimation(BattleAnimation):
     """Impact animation with expanding ring, star burst, and SRCALPHA particles."""
 
+    # Unrotated unit star: 10 points starting straight up, alternating
+    # between the outer radius and a 0.35 inner radius
+    _STAR_UNIT = tuple(
+        (math.cos(i / 10 * 2 * math.pi - math.pi / 2) * (1 if i % 2 == 0 else 0.35),
+         math.sin(i / 10 * 2 * math.pi - math.pi / 2) * (1 if i % 2 == 0 else 0.35))
+        for i in range(10)
+    )
+
+    # Full-size (radius 30) unrotated star, built on first use
+    _STAR_MAX_SIZE = 30
+    _star_surface: Optional[pygame.Surface] = None
+
+    @classmethod
+    def _get_star_surface(cls) -> pygame.Surface:
+        if cls._star_surface is None:
+            size = cls._STAR_MAX_SIZE
+            surf_size = size * 3
+            center = surf_size // 2
+            surface = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
+            # The glow layer the star used to draw first was always covered by
+            # the identical core polygon, so only the core is kept
+            pygame.draw.polygon(
+                surface, (255, 255, 100, 255),
+                [(center + ux * size, center + uy * size) for ux, uy in cls._STAR_UNIT])
+            cls._star_surface = surface
+        return cls._star_surface
+
     def __init__(self, target_pos: Tuple[int, int]):
         super().__init__(target_pos, 0.65)
-        self.particles = []
-        for _ in range(16):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(100, 250)
-            self.particles.append({
-                'x': float(target_pos[0]),
-                'y': float(target_pos[1]),
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': random.uniform(3, 10),
-                'color': random.choice([
-                    (255, 255, 140),
-                    (255, 230, 80),
-                    (255, 200, 60),
-                    (255, 180, 40),
-                ]),
-                'gravity': random.uniform(120, 250),
-                'trail': [],
-            })
+        # Roll each field for all particles in one comprehension rather than
+        # interleaving a handful of random calls per particle
+        n = 16
+        uniform = random.uniform
+        angles = [uniform(0, 2 * math.pi) for _ in range(n)]
+        speeds = [uniform(100, 250) for _ in range(n)]
+        sizes = [uniform(3, 10) for _ in range(n)]
+        colors = random.choices([
+            (255, 255, 140),
+            (255, 230, 80),
+            (255, 200, 60),
+            (255, 180, 40),
+        ], k=n)
+        gravities = [uniform(120, 250) for _ in range(n)]
+        x, y = float(target_pos[0]), float(target_pos[1])
+        self.particles = [
+            _Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                      size, color, gravity)
+            for angle, speed, size, color, gravity
+            in zip(angles, speeds, sizes, colors, gravities)
+        ]
         self.ring_count = 2
 
     def update(self, dt: float):
         super().update(dt)
+        shrink = dt * 14
         for particle in self.particles:
-            # Store trail positions
-            particle['trail'].append((particle['x'], particle['y']))
-            if len(particle['trail']) > 4:
-                particle['trail'].pop(0)
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
-            particle['vy'] += particle['gravity'] * dt
-            particle['size'] = max(0, particle['size'] - dt * 14)
+            x, y, vy = particle.x, particle.y, particle.vy
+            # Store trail positions (the deque keeps the last 4)
+            particle.trail.append((x, y))
+            particle.x = x + particle.vx * dt
+            particle.y = y + vy * dt
+            particle.vy = vy + particle.gravity * dt
+            size = particle.size - shrink
+            particle.size = size if size > 0 else 0
 
     def render(self, screen: pygame.Surface):
         if not self.active:
@@ -257,71 +342,37 @@ class HitAnimation(BattleAnimation):
             size = int(30 * (1 - star_progress))
             rotation = star_progress * math.pi * 0.5
             if size > 2:
-                points = []
-                for i in range(10):
-                    angle = (i / 10) * 2 * math.pi - math.pi / 2 + rotation
-                    r = size if i % 2 == 0 else size * 0.35
-                    px = self.target_pos[0] + math.cos(angle) * r
-                    py = self.target_pos[1] + math.sin(angle) * r
-                    points.append((px, py))
-                if len(points) >= 3:
-                    alpha_val = int(255 * (1 - star_progress))
-                    surf_size = size * 3
-                    star_surface = pygame.Surface(
-                        (surf_size, surf_size), pygame.SRCALPHA)
-                    offset_points = [
-                        (p[0] - self.target_pos[0] + surf_size // 2,
-                         p[1] - self.target_pos[1] + surf_size // 2)
-                        for p in points]
-                    # Glow layer
-                    pygame.draw.polygon(
-                        star_surface,
-                        (255, 255, 180, alpha_val // 3),
-                        offset_points)
-                    # Core layer
-                    pygame.draw.polygon(
-                        star_surface,
-                        (255, 255, 100, alpha_val),
-                        offset_points)
-                    screen.blit(star_surface,
-                                (self.target_pos[0] - surf_size // 2,
-                                 self.target_pos[1] - surf_size // 2))
-
-        # Particles with trails
+                # Rotate and shrink the pre-rendered star in one C call
+                # (pygame angles run counter-clockwise, hence the minus)
+                star_surface = pygame.transform.rotozoom(
+                    self._get_star_surface(), -math.degrees(rotation),
+                    size / self._STAR_MAX_SIZE)
+                star_surface.set_alpha(int(255 * (1 - star_progress)))
+                screen.blit(star_surface,
+                            (self.target_pos[0] - star_surface.get_width() // 2,
+                             self.target_pos[1] - star_surface.get_height() // 2))
+
+        # Particles with trails, drawn from cached sprites
+        alpha_val = max(0, int(255 * (1 - progress)))
+        core_alpha = min(255, alpha_val + 50)
         for particle in self.particles:
-            if particle['size'] > 0.5:
-                alpha_val = max(0, int(255 * (1 - progress)))
-                s = int(particle['size'])
+            if particle.size > 0.5:
+                s = int(particle.size)
                 if s > 0:
-                    r, g, b = particle['color']
+                    color = particle.color
                     # Trail
-                    for ti, (tx, ty) in enumerate(particle['trail']):
-                        trail_alpha = alpha_val * (ti + 1) // (len(particle['trail']) + 2)
-                        trail_size = max(1, s * (ti + 1) // (len(particle['trail']) + 1))
+                    trail = particle.trail
+                    for ti, (tx, ty) in enumerate(trail):
+                        trail_alpha = alpha_val * (ti + 1) // (len(trail) + 2)
+                        trail_size = max(1, s * (ti + 1) // (len(trail) + 1))
                         if trail_size > 0 and trail_alpha > 0:
-                            ts = pygame.Surface(
-                                (trail_size * 2, trail_size * 2), pygame.SRCALPHA)
-                            pygame.draw.circle(
-                                ts, (r, g, b, trail_alpha),
-                                (trail_size, trail_size), trail_size)
-                            screen.blit(ts,
-                                        (int(tx) - trail_size,
-                                         int(ty) - trail_size))
-                    # Main particle
-                    particle_surface = pygame.Surface(
-                        (s * 2 + 2, s * 2 + 2), pygame.SRCALPHA)
-                    pygame.draw.circle(
-                        particle_surface, (r, g, b, alpha_val),
-                        (s + 1, s + 1), s)
-                    # Bright core
-                    core_s = max(1, s // 2)
-                    pygame.draw.circle(
-                        particle_surface,
-                        (255, 255, 255, min(255, alpha_val + 50)),
-                        (s + 1, s + 1), core_s)
-                    screen.blit(particle_surface,
-                                (int(particle['x']) - s - 1,
-                                 int(particle['y']) - s - 1))
+                            _blit_circle(screen, color, trail_size, trail_alpha,
+                                         (int(tx), int(ty)))
+                    # Main particle with bright core
+                    center = (int(particle.x), int(particle.y))
+                    core = max(1, s // 2)
+                    _blit_circle(screen, color, s, alpha_val, center, core)
+                    _blit_circle(screen, (255, 255, 255), core, core_alpha, center)
 
 
 class SlashAnimation(BattleAnimation):
@@ -375,66 +426,86 @@ class SlashAnimation(BattleAnimation):
             if alpha <= 0:
                 continue
 
-            # Calculate bounding box
-            min_x = int(min(sx, cx)) - 15
-            min_y = int(min(sy, cy)) - 15
-            max_x = int(max(sx, cx)) + 15
-            max_y = int(max(sy, cy)) + 15
-            w = max(1, max_x - min_x)
-            h = max(1, max_y - min_y)
-
-            slash_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-            local_start = (sx - min_x, sy - min_y)
-            local_end = (cx - min_x, cy - min_y)
-
-            # Outer glow
-            pygame.draw.line(
-                slash_surface,
-                (200, 200, 255, alpha // 4),
-                local_start, local_end, trail['width_glow'])
-
-            # Mid glow
-            pygame.draw.line(
-                slash_surface,
-                (220, 220, 255, alpha // 2),
-                local_start, local_end, trail['width_glow'] // 2 + 2)
-
-            # Main slash line
-            pygame.draw.line(
-                slash_surface,
-                (255, 255, 255, alpha),
-                local_start, local_end, trail['width_main'])
-
-            # Bright core
-            pygame.draw.line(
-                slash_surface,
-                (255, 255, 255, min(255, alpha + 30)),
-                local_start, local_end, max(1, trail['width_main'] // 2))
-
-            screen.blit(slash_surface, (min_x, min_y))
+            if draw_progress < 1.0:
+                slash_surface, origin = self._draw_slash(trail, sx, sy, cx, cy, alpha)
+            else:
+                # Fully drawn: the shape no longer changes, only the fade,
+                # so render it once at full strength and fade via surface alpha
+                if 'surface' not in trail:
+                    trail['surface'] = self._draw_slash(trail, sx, sy, ex, ey, 255)
+                slash_surface, origin = trail['surface']
+                slash_surface.set_alpha(alpha)
+            screen.blit(slash_surface, origin)
 
             # Spark at the tip
             if draw_progress < 0.9:
                 spark_alpha = int(alpha * 0.7)
                 spark_size = 6
-                spark_surf = pygame.Surface(
-                    (spark_size * 2, spark_size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    spark_surf, (255, 255, 220, spark_alpha),
-                    (spark_size, spark_size), spark_size)
-                pygame.draw.circle(
-                    spark_surf, (255, 255, 255, min(255, spark_alpha + 40)),
-                    (spark_size, spark_size), max(1, spark_size // 2))
-                screen.blit(spark_surf,
-                            (int(cx) - spark_size, int(cy) - spark_size))
+                spark_core = max(1, spark_size // 2)
+                _blit_circle(screen, (255, 255, 220), spark_size, spark_alpha,
+                             (int(cx), int(cy)), spark_core)
+                _blit_circle(screen, (255, 255, 255), spark_core,
+                             min(255, spark_alpha + 40), (int(cx), int(cy)))
+
+    @staticmethod
+    def _draw_slash(trail: dict, sx: float, sy: float, cx: float, cy: float,
+                    alpha: int) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Draw one slash line from (sx, sy) to (cx, cy); returns (surface, origin)."""
+        # Calculate bounding box
+        min_x = int(min(sx, cx)) - 15
+        min_y = int(min(sy, cy)) - 15
+        max_x = int(max(sx, cx)) + 15
+        max_y = int(max(sy, cy)) + 15
+        w = max(1, max_x - min_x)
+        h = max(1, max_y - min_y)
+
+        slash_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+        local_start = (sx - min_x, sy - min_y)
+        local_end = (cx - min_x, cy - min_y)
+
+        # Outer glow
+        pygame.draw.line(
+            slash_surface,
+            (200, 200, 255, alpha // 4),
+            local_start, local_end, trail['width_glow'])
+
+        # Mid glow
+        pygame.draw.line(
+            slash_surface,
+            (220, 220, 255, alpha // 2),
+            local_start, local_end, trail['width_glow'] // 2 + 2)
+
+        # Main slash line
+        pygame.draw.line(
+            slash_surface,
+            (255, 255, 255, alpha),
+            local_start, local_end, trail['width_main'])
+
+        # Bright core
+        pygame.draw.line(
+            slash_surface,
+            (255, 255, 255, min(255, alpha + 30)),
+            local_start, local_end, max(1, trail['width_main'] // 2))
+
+        return slash_surface, (min_x, min_y)
 
 
 class ElectricAnimation(BattleAnimation):
     """Electric shock with flash overlay, multi-layer lightning bolts."""
 
+    BOLT_POOL_SIZE = 16
+    BOLT_PAD = 12
+
     def __init__(self, target_pos: Tuple[int, int]):
         super().__init__(target_pos, 0.85)
-        self.bolts: List[List[Tuple[int, int]]] = []
+        # Bolt groups (a bolt plus its optional branch) are generated once;
+        # each flicker just draws a fresh random handful from the pool.
+        # Paths are stored ready to draw as ((min_x, min_y), (w, h),
+        # local_points).
+        self._bolt_pool = [self._generate_bolt_group()
+                           for _ in range(self.BOLT_POOL_SIZE)]
+        self.bolts: List[Tuple[Tuple[int, int], Tuple[int, int],
+                               List[Tuple[int, int]]]] = []
         self.bolt_timer = 0.0
         self.flash_intensity = 0
         self.bolt_regen_interval = 0.04
@@ -444,39 +515,49 @@ class ElectricAnimation(BattleAnimation):
         self.bolt_timer += dt
         if self.bolt_timer > self.bolt_regen_interval:
             self.bolt_timer = 0
-            self.bolts = self._generate_bolts()
+            groups = random.sample(self._bolt_pool, random.randint(3, 6))
+            self.bolts = [path for group in groups for path in group]
             self.flash_intensity = 220
 
         self.flash_intensity = max(0, self.flash_intensity - 900 * dt)
 
-    def _generate_bolts(self) -> List[List[Tuple[int, int]]]:
-        """Generate random lightning bolt paths with branching."""
-        bolts = []
-        count = random.randint(3, 6)
-        for _ in range(count):
-            bolt = []
-            x = self.target_pos[0] + random.randint(-30, 30)
-            y = self.target_pos[1] - 80
-
-            while y < self.target_pos[1] + 40:
-                bolt.append((x, y))
-                x += random.randint(-22, 22)
-                y += random.randint(8, 16)
-            bolt.append((x, y))
-            bolts.append(bolt)
+    def _generate_bolt_group(self) -> list:
+        """Generate one random lightning bolt path, with an occasional branch."""
+        randint = random.randint
+        bolt = []
+        x = self.target_pos[0] + randint(-30, 30)
+        y = self.target_pos[1] - 80
 
-            # Occasional branch from a mid-point
-            if len(bolt) > 3 and random.random() < 0.4:
-                branch_start = random.randint(1, len(bolt) - 2)
-                bx, by = bolt[branch_start]
-                branch = [(bx, by)]
-                for _ in range(random.randint(2, 4)):
-                    bx += random.randint(-18, 18)
-                    by += random.randint(6, 14)
-                    branch.append((bx, by))
-                bolts.append(branch)
-
-        return bolts
+        while y < self.target_pos[1] + 40:
+            bolt.append((x, y))
+            x += randint(-22, 22)
+            y += randint(8, 16)
+        bolt.append((x, y))
+        group = [self._prepare_path(bolt)]
+
+        # Occasional branch from a mid-point
+        if len(bolt) > 3 and random.random() < 0.4:
+            branch_start = randint(1, len(bolt) - 2)
+            bx, by = bolt[branch_start]
+            branch = [(bx, by)]
+            for _ in range(randint(2, 4)):
+                bx += randint(-18, 18)
+                by += randint(6, 14)
+                branch.append((bx, by))
+            group.append(self._prepare_path(branch))
+
+        return group
+
+    def _prepare_path(self, points: List[Tuple[int, int]]) -> tuple:
+        """Compute a path's padded bounds and its points local to them."""
+        pad = self.BOLT_PAD
+        min_x = min(p[0] for p in points) - pad
+        min_y = min(p[1] for p in points) - pad
+        max_x = max(p[0] for p in points) + pad
+        max_y = max(p[1] for p in points) + pad
+        size = (max(1, max_x - min_x), max(1, max_y - min_y))
+        local_points = [(p[0] - min_x, p[1] - min_y) for p in points]
+        return (min_x, min_y), size, local_points
 
     def render(self, screen: pygame.Surface):
         if not self.active:
@@ -506,23 +587,8 @@ class ElectricAnimation(BattleAnimation):
                          self.target_pos[1] - flash_radius))
 
         # Draw lightning bolts with three layers
-        for bolt in self.bolts:
-            if len(bolt) < 2:
-                continue
-
-            # Calculate bounds for the bolt surface
-            xs = [p[0] for p in bolt]
-            ys = [p[1] for p in bolt]
-            pad = 12
-            min_x = min(xs) - pad
-            min_y = min(ys) - pad
-            max_x = max(xs) + pad
-            max_y = max(ys) + pad
-            w = max(1, max_x - min_x)
-            h = max(1, max_y - min_y)
-
-            bolt_surface = pygame.Surface((w, h), pygame.SRCALPHA)
-            local_points = [(p[0] - min_x, p[1] - min_y) for p in bolt]
+        for origin, size, local_points in self.bolts:
+            bolt_surface = pygame.Surface(size, pygame.SRCALPHA)
 
             for i in range(len(local_points) - 1):
                 p1 = local_points[i]
@@ -543,7 +609,7 @@ class ElectricAnimation(BattleAnimation):
                     (255, 255, 240, min(255, base_alpha + 30)),
                     p1, p2, 1)
 
-            screen.blit(bolt_surface, (min_x, min_y))
+            screen.blit(bolt_surface, origin)
 
         # Small electric sparks around the target
         if progress < 0.8:
@@ -565,42 +631,63 @@ class ElectricAnimation(BattleAnimation):
 class FireAnimation(BattleAnimation):
     """Fire effect with layered flames: white-core-to-red gradient, respawning."""
 
+    FLAME_COUNT = 30
+
     def __init__(self, target_pos: Tuple[int, int]):
         super().__init__(target_pos, 1.0)
-        self.flames = []
-        for _ in range(30):
-            self.flames.append(self._new_flame())
-
-    def _new_flame(self) -> dict:
-        return {
-            'x': self.target_pos[0] + random.uniform(-28, 28),
-            'y': self.target_pos[1] + random.uniform(-5, 18),
-            'vy': random.uniform(-90, -160),
-            'vx': random.uniform(-18, 18),
-            'life': random.uniform(0, 0.3),
-            'max_life': random.uniform(0.35, 0.65),
-            'size': random.uniform(5, 15),
-            'wobble_phase': random.uniform(0, 2 * math.pi),
-            'wobble_speed': random.uniform(8, 15),
-        }
+        # Flames are stored as parallel per-field lists (index i is flame i)
+        # so update() runs one tight loop over plain floats instead of
+        # hashing dict keys for every field of every flame.
+        n = self.FLAME_COUNT
+        self.flame_x = [0.0] * n
+        self.flame_y = [0.0] * n
+        self.flame_vx = [0.0] * n
+        self.flame_vy = [0.0] * n
+        self.flame_life = [0.0] * n
+        self.flame_max_life = [0.0] * n
+        self.flame_size = [0.0] * n
+        self.flame_wobble_phase = [0.0] * n
+        self.flame_wobble_speed = [0.0] * n
+        # Stagger the first flames so they don't all burn out together
+        for i in range(n):
+            self._spawn_flame(i, random.uniform(0, 0.3))
+
+    def _spawn_flame(self, i: int, life: float):
+        """(Re)start flame i at the given age."""
+        uniform = random.uniform
+        self.flame_x[i] = self.target_pos[0] + uniform(-28, 28)
+        self.flame_y[i] = self.target_pos[1] + uniform(-5, 18)
+        self.flame_vy[i] = uniform(-90, -160)
+        self.flame_vx[i] = uniform(-18, 18)
+        self.flame_life[i] = life
+        self.flame_max_life[i] = uniform(0.35, 0.65)
+        self.flame_size[i] = uniform(5, 15)
+        self.flame_wobble_phase[i] = uniform(0, 2 * math.pi)
+        self.flame_wobble_speed[i] = uniform(8, 15)
 
     def update(self, dt: float):
         super().update(dt)
         # Determine if we should still spawn new flames
-        overall_progress = self.elapsed / self.duration
-        for flame in self.flames:
-            flame['y'] += flame['vy'] * dt
-            wobble = math.sin(flame['wobble_phase'] + self.elapsed * flame['wobble_speed'])
-            flame['x'] += (flame['vx'] + wobble * 12) * dt
-            flame['life'] += dt
-
-            if flame['life'] > flame['max_life']:
-                if overall_progress < 0.75:
-                    new_flame = self._new_flame()
-                    new_flame['life'] = 0
-                    flame.update(new_flame)
+        respawn = self.elapsed / self.duration < 0.75
+        elapsed = self.elapsed
+        sin = math.sin
+        xs, ys = self.flame_x, self.flame_y
+        vxs, vys = self.flame_vx, self.flame_vy
+        lives, max_lives = self.flame_life, self.flame_max_life
+        phases, speeds = self.flame_wobble_phase, self.flame_wobble_speed
+        for i in range(self.FLAME_COUNT):
+            ys[i] += vys[i] * dt
+            wobble = sin(phases[i] + elapsed * speeds[i])
+            xs[i] += (vxs[i] + wobble * 12) * dt
+            life = lives[i] + dt
+
+            if life > max_lives[i]:
+                if respawn:
+                    self._spawn_flame(i, 0.0)
                 else:
-                    flame['life'] = flame['max_life']
+                    lives[i] = max_lives[i]
+            else:
+                lives[i] = life
 
     def render(self, screen: pygame.Surface):
         if not self.active:
@@ -614,8 +701,11 @@ class FireAnimation(BattleAnimation):
             fade = 1.0
         fade = max(0, min(1, fade))
 
-        for flame in self.flames:
-            life_ratio = min(1.0, flame['life'] / flame['max_life'])
+        blits = []
+        for x, y, life, max_life, flame_size in zip(
+                self.flame_x, self.flame_y, self.flame_life,
+                self.flame_max_life, self.flame_size):
+            life_ratio = min(1.0, life / max_life)
             alpha = max(0, int(255 * (1 - life_ratio * life_ratio) * fade))
 
             if alpha <= 0:
@@ -645,7 +735,7 @@ class FireAnimation(BattleAnimation):
                 g_c = int(65 - t * 40)
                 b_c = int(20 - t * 5)
 
-            size = max(1, int(flame['size'] * (1 - life_ratio * 0.6)))
+            size = max(1, int(flame_size * (1 - life_ratio * 0.6)))
             flame_surface = pygame.Surface(
                 (size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
 
@@ -673,9 +763,10 @@ class FireAnimation(BattleAnimation):
                     (255, 255, 255, core_alpha),
                     (size + 2, size + 2), core_size)
 
-            screen.blit(flame_surface,
-                        (int(flame['x']) - size - 2,
-                         int(flame['y']) - size - 2))
+            blits.append((flame_surface,
+                          (int(x) - size - 2, int(y) - size - 2)))
+        if blits:
+            screen.blits(blits, doreturn=False)
 
 
 class WaterAnimation(BattleAnimation):
@@ -683,24 +774,27 @@ class WaterAnimation(BattleAnimation):
 
     def __init__(self, target_pos: Tuple[int, int]):
         super().__init__(target_pos, 0.9)
-        self.drops = []
-        for _ in range(22):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(120, 280)
-            self.drops.append({
-                'x': float(target_pos[0] + random.randint(-15, 15)),
-                'y': float(target_pos[1]),
-                'vy': -abs(math.sin(angle)) * speed - 50,
-                'vx': math.cos(angle) * speed * 0.5,
-                'size': random.randint(4, 11),
-                'life': 0.0,
-                'shade': random.choice([
-                    (60, 130, 255),
-                    (80, 160, 255),
-                    (100, 180, 255),
-                    (50, 110, 230),
-                ]),
-            })
+        # Droplets as parallel per-field lists, like FireAnimation. They all
+        # spawn together, so one shared age (self.elapsed) replaces a
+        # per-drop life counter.
+        n = 22
+        uniform, randint = random.uniform, random.randint
+        angles = [uniform(0, 2 * math.pi) for _ in range(n)]
+        speeds = [uniform(120, 280) for _ in range(n)]
+        self.drop_x: List[float] = [float(target_pos[0] + randint(-15, 15))
+                                    for _ in range(n)]
+        self.drop_y: List[float] = [float(target_pos[1])] * n
+        self.drop_vx: List[float] = [math.cos(a) * v * 0.5
+                                     for a, v in zip(angles, speeds)]
+        self.drop_vy: List[float] = [-abs(math.sin(a)) * v - 50
+                                     for a, v in zip(angles, speeds)]
+        self.drop_size: List[int] = [randint(4, 11) for _ in range(n)]
+        self.drop_shade: List[Tuple[int, int, int]] = random.choices([
+            (60, 130, 255),
+            (80, 160, 255),
+            (100, 180, 255),
+            (50, 110, 230),
+        ], k=n)
         self.wave_rings = [
             {'radius': 0.0, 'speed': 130, 'delay': 0.0},
             {'radius': 0.0, 'speed': 100, 'delay': 0.08},
@@ -708,16 +802,19 @@ class WaterAnimation(BattleAnimation):
 
     def update(self, dt: float):
         super().update(dt)
+        elapsed = self.elapsed
         for ring in self.wave_rings:
-            local_elapsed = max(0, self.elapsed - ring['delay'])
+            local_elapsed = elapsed - ring['delay']
             if local_elapsed > 0:
                 ring['radius'] = local_elapsed * ring['speed']
 
-        for drop in self.drops:
-            drop['x'] += drop['vx'] * dt
-            drop['y'] += drop['vy'] * dt
-            drop['vy'] += 380 * dt  # gravity
-            drop['life'] += dt
+        xs, ys = self.drop_x, self.drop_y
+        vxs, vys = self.drop_vx, self.drop_vy
+        gravity = 380 * dt
+        for i in range(len(xs)):
+            xs[i] += vxs[i] * dt
+            ys[i] += vys[i] * dt
+            vys[i] += gravity
 
     def render(self, screen: pygame.Surface):
         if not self.active:
@@ -754,12 +851,13 @@ class WaterAnimation(BattleAnimation):
                                  self.target_pos[1] - radius // 2 - 3))
 
         # Water droplets
-        for drop in self.drops:
-            if drop['life'] < 0.75:
-                life_ratio = drop['life'] / 0.75
-                alpha = max(0, int(230 * (1 - life_ratio)))
-                size = max(1, int(drop['size'] * (1 - life_ratio * 0.4)))
-                r, g, b = drop['shade']
+        if self.elapsed < 0.75:
+            life_ratio = self.elapsed / 0.75
+            alpha = max(0, int(230 * (1 - life_ratio)))
+            blits = []
+            for x, y, drop_size, (r, g, b) in zip(
+                    self.drop_x, self.drop_y, self.drop_size, self.drop_shade):
+                size = max(1, int(drop_size * (1 - life_ratio * 0.4)))
 
                 drop_surface = pygame.Surface(
                     (size * 2 + 4, size * 2 + 4), pygame.SRCALPHA)
@@ -785,9 +883,9 @@ class WaterAnimation(BattleAnimation):
                     (210, 235, 255, min(255, alpha + 20)),
                     (size + 2 - hl_offset, size + 2 - hl_offset), hl_size)
 
-                screen.blit(drop_surface,
-                            (int(drop['x']) - size - 2,
-                             int(drop['y']) - size - 2))
+                blits.append((drop_surface,
+                              (int(x) - size - 2, int(y) - size - 2)))
+            screen.blits(blits, doreturn=False)
 
 
 class GrassAnimation(BattleAnimation):
@@ -1907,6 +2005,12 @@ class ShakeAnimation:
         self.duration = duration
         self.elapsed = 0.0
         self.active = True
+        # Full-strength offsets rolled up front, one pair per 60 fps frame
+        # (with headroom); get_offset() only picks one and scales it down
+        peak = int(intensity)
+        randint = random.randint
+        self._offsets = [(randint(-peak, peak), randint(-peak, peak))
+                         for _ in range(int(duration * 120) + 2)]
 
     def update(self, dt: float):
         self.elapsed += dt
@@ -1918,10 +2022,10 @@ class ShakeAnimation:
         if not self.active:
             return (0, 0)
 
-        current_intensity = self.intensity * (1 - self.elapsed / self.duration)
-        offset_x = random.randint(-int(current_intensity), int(current_intensity))
-        offset_y = random.randint(-int(current_intensity), int(current_intensity))
-        return (offset_x, offset_y)
+        offsets = self._offsets
+        offset_x, offset_y = offsets[min(int(self.elapsed * 60), len(offsets) - 1)]
+        falloff = 1 - self.elapsed / self.duration
+        return (int(offset_x * falloff), int(offset_y * falloff))
 
 
 # Animation type to class mapping
@@ -1948,6 +2052,14 @@ _ANIMATION_CLASS_MAP: Dict[AnimationType, type] = {
     AnimationType.FAIRY: FairyAnimation,
 }
 
+# Animation types that shake the screen instead of drawing an effect,
+# mapped to ShakeAnimation (intensity, duration)
+_SCREEN_SHAKE_PARAMS: Dict[AnimationType, Tuple[float, float]] = {
+    AnimationType.SHAKE: (10, 0.5),
+    # Flash is handled via shake with low intensity
+    AnimationType.FLASH: (3, 0.3),
+}
+
 
 class BattleAnimationManager:
     """Manages all battle animations."""
@@ -1960,11 +2072,9 @@ class BattleAnimationManager:
 
     def add_animation(self, animation_type: AnimationType, target_pos: Tuple[int, int]):
         """Add a new animation."""
-        if animation_type == AnimationType.SHAKE:
-            self.screen_shake = ShakeAnimation()
-        elif animation_type == AnimationType.FLASH:
-            # Flash is handled via shake with low intensity
-            self.screen_shake = ShakeAnimation(intensity=3, duration=0.3)
+        shake_params = _SCREEN_SHAKE_PARAMS.get(animation_type)
+        if shake_params is not None:
+            self.screen_shake = ShakeAnimation(*shake_params)
         else:
             anim_class = _ANIMATION_CLASS_MAP.get(animation_type, HitAnimation)
             self.animations.append(anim_class(target_pos))
@@ -1982,13 +2092,8 @@ class BattleAnimationManager:
 
     def update(self, dt: float):
         """Update all animations."""
-        self.animations = [a for a in self.animations if a.active]
-        for anim in self.animations:
-            anim.update(dt)
-
-        self.damage_popups = [p for p in self.damage_popups if p.active]
-        for popup in self.damage_popups:
-            popup.update(dt)
+        self._update_and_cull(self.animations, dt)
+        self._update_and_cull(self.damage_popups, dt)
 
         if self.screen_shake:
             self.screen_shake.update(dt)
@@ -2000,6 +2105,21 @@ class BattleAnimationManager:
             if not self.vs_screen.active:
                 self.vs_screen = None
 
+    @staticmethod
+    def _update_and_cull(animations: List[BattleAnimation], dt: float):
+        """Update each animation and drop finished ones in the same pass.
+
+        Survivors are compacted to the front of the list in place, so no new
+        list is built each frame.
+        """
+        write = 0
+        for anim in animations:
+            anim.update(dt)
+            if anim.active:
+                animations[write] = anim
+                write += 1
+        del animations[write:]
+
     def render(self, screen: pygame.Surface):
         """Render all animations."""
         for anim in self.animations:
@@ -3,249 +3,443 @@ Enhanced encounter effects and visual indicators
 """
 
 import pygame
+import pygame.gfxdraw
 import math
 import random
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from .ui.components import _to_display_format
+
+
+# Four-pointed sparkle star outline in thirds of the star's size: tips sit at
+# +-3/3, the waist vertices at +-1/3 (truncated toward zero)
+_SPARKLE_UNIT = ((0, -3), (1, -1), (3, 0), (1, 1),
+                 (0, 3), (-1, 1), (-3, 0), (-1, -1))
+
+# Initial (vx, vy) of the eight sparkles in a shiny burst, evenly spaced
+_SPARKLE_DIRS = tuple((math.cos(math.pi * 2 * i / 8) * 3,
+                       math.sin(math.pi * 2 * i / 8) * 3) for i in range(8))
+
+# size -> pre-drawn shiny sparkle star, see _sparkle_sprite()
+_SPARKLE_CACHE: Dict[int, pygame.Surface] = {}
+
+
+def _sparkle_sprite(size: int) -> pygame.Surface:
+    """Get the cached four-pointed sparkle star for a given size.
+
+    The sprite is (2 * size + 1) pixels square with the star centred at
+    (size, size), so sparkles are blitted at (x - size, y - size). Sparkle
+    sizes only ever take a handful of integer values, so every star drawn
+    in a frame comes from this cache and goes out in a single blits() call.
+    """
+    sprite = _SPARKLE_CACHE.get(size)
+    if sprite is None:
+        points = [(size + int(dx * size / 3), size + int(dy * size / 3))
+                  for dx, dy in _SPARKLE_UNIT]
+        sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(sprite, (255, 255, 0), points)
+        pygame.draw.polygon(sprite, (255, 255, 255), points, 1)
+        sprite = _to_display_format(sprite)
+        _SPARKLE_CACHE[size] = sprite
+    return sprite
+
+
+def _step_particles(xs: List[float], ys: List[float], vxs: List[float],
+                    vys: List[float], lives: List[float], extra: tuple,
+                    gravity: float, decel: float, fade: float) -> int:
+    """Advance a particle system stored as parallel lists by one frame.
+
+    Velocities are scaled by ``decel`` and ``gravity`` is added to vy, then
+    every particle loses ``fade`` life. Expired particles are removed from
+    all columns, including the ``extra`` per-particle columns, and the
+    number of live particles is returned.
+
+    Survivors are compacted in place as they are updated (write index w
+    trails read index i), so culling needs no copies and a single trailing
+    slice delete per column.
+    """
+    n = len(lives)
+    w = 0
+    for i in range(n):
+        life = lives[i] - fade
+        if life <= 0:
+            continue
+        vx = vxs[i]
+        vy = vys[i]
+        xs[w] = xs[i] + vx
+        ys[w] = ys[i] + vy
+        vxs[w] = vx * decel
+        vys[w] = vy * decel + gravity
+        lives[w] = life
+        if w != i:
+            for column in extra:
+                column[w] = column[i]
+        w += 1
+    if w < n:
+        for column in (xs, ys, vxs, vys, lives) + extra:
+            del column[w:]
+    return w
+
+
+# Exclamation bounce height, abs(sin(phase)) * 10 sampled over one period
+# (pi) so the per-frame bounce is an index instead of a libm call
+_BOUNCE_STEPS = 256
+_BOUNCE_LUT = tuple(abs(math.sin(math.pi * i / _BOUNCE_STEPS)) * 10
+                    for i in range(_BOUNCE_STEPS))
+_BOUNCE_SCALE = 10 * _BOUNCE_STEPS / math.pi
+
+
+# Colorkey for the transparent part of baked spiral frames (never drawn)
+_SPIRAL_KEY = (255, 0, 255)
+
+# EncounterEffects._active bits, one per effect that needs update/render
+_FX_TRANSITION = 1
+_FX_EXCLAMATION = 2
+_FX_FLASH = 4
+_FX_GRASS = 8
+_FX_SPARKLES = 16
 
 
 class EncounterEffects:
     """Manages visual effects for Pokemon encounters."""
     
+    SPIRAL_FRAMES = 30
+
+    __slots__ = (
+        "screen", "screen_width", "screen_height", "_active",
+        "transition_timer", "transition_duration", "transition_type",
+        "_half_white", "_spiral_frames",
+        "grass_x", "grass_y", "grass_vx", "grass_vy", "grass_life", "grass_size",
+        "max_grass_particles",
+        "exclamation_timer", "exclamation_duration", "exclamation_pos",
+        "_excl_text", "_excl_outline", "_excl_half_w", "_excl_half_h",
+        "flash_timer", "flash_duration", "flash_color", "_flash_surf", "_flash_surf_color",
+        "sparkle_x", "sparkle_y", "sparkle_vx", "sparkle_vy", "sparkle_life",
+        "sparkle_size", "sparkle_duration",
+    )
+
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.screen_width = screen.get_width()
         self.screen_height = screen.get_height()
+        # Bitmask of running effects (_FX_*). Nothing is running on almost
+        # every frame, so update() and render() return on a single test.
+        self._active = 0
         
         # Encounter transition effect
-        self.encounter_transition_active = False
         self.transition_timer = 0.0
         self.transition_duration = 1.5
         self.transition_type = "spiral"  # spiral, flash, zoom
+        # Constant half-transparent white layer for the "flash" transition,
+        # allocated on first use
+        self._half_white: Optional[pygame.Surface] = None
+        # Baked spiral key frames, filled in lazily by _spiral_frame()
+        self._spiral_frames: List[Optional[pygame.Surface]] = [None] * self.SPIRAL_FRAMES
         
-        # Grass rustling effect
-        self.grass_particles = []
+        # Grass rustling effect. Particles are stored as parallel per-field
+        # lists (index i is particle i) so update() runs over plain floats
+        # instead of hashing dict keys for every field of every particle.
+        self.grass_x = []
+        self.grass_y = []
+        self.grass_vx = []
+        self.grass_vy = []
+        self.grass_life = []
+        self.grass_size = []
         self.max_grass_particles = 20
         
         # Exclamation mark for trainer battles
-        self.exclamation_active = False
         self.exclamation_timer = 0.0
         self.exclamation_duration = 1.0
         self.exclamation_pos = (0, 0)
+        # The "!" glyphs never change, so rasterize them once
+        excl_font = pygame.font.Font(None, 48)
+        self._excl_text = _to_display_format(excl_font.render("!", True, (255, 255, 0)))
+        self._excl_outline = _to_display_format(excl_font.render("!", True, (0, 0, 0)))
+        self._excl_half_w = self._excl_text.get_width() // 2
+        self._excl_half_h = self._excl_text.get_height() // 2
         
         # Screen flash effect
-        self.flash_active = False
         self.flash_timer = 0.0
         self.flash_duration = 0.2
         self.flash_color = (255, 255, 255)
+        # Full-screen flash layer, allocated on the first flash and refilled
+        # only when the flash color changes
+        self._flash_surf: Optional[pygame.Surface] = None
+        self._flash_surf_color: Optional[Tuple[int, int, int]] = None
         
-        # Shiny sparkle effect
-        self.shiny_sparkles = []
+        # Shiny sparkle effect (same parallel-list layout as the grass)
+        self.sparkle_x = []
+        self.sparkle_y = []
+        self.sparkle_vx = []
+        self.sparkle_vy = []
+        self.sparkle_life = []
+        self.sparkle_size = 6
         self.sparkle_duration = 2.0
+
+    @property
+    def encounter_transition_active(self) -> bool:
+        return bool(self._active & _FX_TRANSITION)
+
+    @property
+    def exclamation_active(self) -> bool:
+        return bool(self._active & _FX_EXCLAMATION)
+
+    @property
+    def flash_active(self) -> bool:
+        return bool(self._active & _FX_FLASH)
         
     def start_encounter_transition(self, transition_type: str = "spiral"):
         """Start an encounter transition effect."""
-        self.encounter_transition_active = True
+        self._active |= _FX_TRANSITION
         self.transition_timer = 0.0
         self.transition_type = transition_type
         
     def start_exclamation(self, pos: Tuple[int, int]):
         """Start trainer encounter exclamation effect."""
-        self.exclamation_active = True
+        self._active |= _FX_EXCLAMATION
         self.exclamation_timer = 0.0
         self.exclamation_pos = pos
         
     def start_flash(self, color: Tuple[int, int, int] = (255, 255, 255)):
         """Start a screen flash effect."""
-        self.flash_active = True
+        self._active |= _FX_FLASH
         self.flash_timer = 0.0
         self.flash_color = color
         
     def add_grass_rustle(self, x: int, y: int):
         """Add grass rustling particles at position."""
-        for _ in range(5):
-            particle = {
-                'x': x + random.randint(-10, 10),
-                'y': y,
-                'vx': random.uniform(-1, 1),
-                'vy': random.uniform(-3, -1),
-                'life': 1.0,
-                'size': random.randint(2, 4)
-            }
-            self.grass_particles.append(particle)
+        # One column at a time, drawing straight from random.random(): the
+        # same distributions as randint(-10, 10), uniform(-1, 1),
+        # uniform(-3, -1) and randint(2, 4) without their Python-level wrappers
+        rand = random.random
+        burst = range(5)
+        self.grass_x.extend([x + int(rand() * 21) - 10 for _ in burst])
+        self.grass_y.extend([y] * 5)
+        self.grass_vx.extend([rand() * 2 - 1 for _ in burst])
+        self.grass_vy.extend([rand() * 2 - 3 for _ in burst])
+        self.grass_life.extend([1.0] * 5)
+        self.grass_size.extend([2 + int(rand() * 3) for _ in burst])
             
-        # Limit particles
-        if len(self.grass_particles) > self.max_grass_particles:
-            self.grass_particles = self.grass_particles[-self.max_grass_particles:]
+        self._active |= _FX_GRASS
+
+        # Limit particles (drop the oldest)
+        excess = len(self.grass_life) - self.max_grass_particles
+        if excess > 0:
+            for column in (self.grass_x, self.grass_y, self.grass_vx,
+                           self.grass_vy, self.grass_life, self.grass_size):
+                del column[:excess]
             
     def add_shiny_sparkle(self, x: int, y: int):
         """Add shiny Pokemon sparkle effect."""
-        for i in range(8):
-            angle = (math.pi * 2 * i) / 8
-            sparkle = {
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * 3,
-                'vy': math.sin(angle) * 3,
-                'life': 1.0,
-                'size': 6
-            }
-            self.shiny_sparkles.append(sparkle)
+        n = len(_SPARKLE_DIRS)
+        self.sparkle_x.extend([x] * n)
+        self.sparkle_y.extend([y] * n)
+        self.sparkle_vx.extend([vx for vx, _ in _SPARKLE_DIRS])
+        self.sparkle_vy.extend([vy for _, vy in _SPARKLE_DIRS])
+        self.sparkle_life.extend([1.0] * n)
+        self._active |= _FX_SPARKLES
             
     def update(self, dt: float):
         """Update all effects."""
+        active = self._active
+        if not active:
+            return
+
         # Update encounter transition
-        if self.encounter_transition_active:
+        if active & _FX_TRANSITION:
             self.transition_timer += dt
             if self.transition_timer >= self.transition_duration:
-                self.encounter_transition_active = False
+                active &= ~_FX_TRANSITION
                 
         # Update exclamation
-        if self.exclamation_active:
+        if active & _FX_EXCLAMATION:
             self.exclamation_timer += dt
             if self.exclamation_timer >= self.exclamation_duration:
-                self.exclamation_active = False
+                active &= ~_FX_EXCLAMATION
                 
         # Update flash
-        if self.flash_active:
+        if active & _FX_FLASH:
             self.flash_timer += dt
             if self.flash_timer >= self.flash_duration:
-                self.flash_active = False
+                active &= ~_FX_FLASH
                 
-        # Update grass particles
-        for particle in self.grass_particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['vy'] += 0.2  # Gravity
-            particle['life'] -= dt * 2
-        self.grass_particles = [p for p in self.grass_particles if p['life'] > 0]
-
-        # Update shiny sparkles
-        for sparkle in self.shiny_sparkles:
-            sparkle['x'] += sparkle['vx']
-            sparkle['y'] += sparkle['vy']
-            sparkle['vx'] *= 0.95  # Deceleration
-            sparkle['vy'] *= 0.95
-            sparkle['life'] -= dt / self.sparkle_duration
-        self.shiny_sparkles = [s for s in self.shiny_sparkles if s['life'] > 0]
+        # Update grass particles (gravity pulls them back down)
+        if active & _FX_GRASS:
+            if not _step_particles(self.grass_x, self.grass_y,
+                                   self.grass_vx, self.grass_vy,
+                                   self.grass_life, (self.grass_size,),
+                                   0.2, 1.0, dt * 2):
+                active &= ~_FX_GRASS
+
+        # Update shiny sparkles (decelerate as they spread out)
+        if active & _FX_SPARKLES:
+            if not _step_particles(self.sparkle_x, self.sparkle_y,
+                                   self.sparkle_vx, self.sparkle_vy,
+                                   self.sparkle_life, (),
+                                   0.0, 0.95, dt / self.sparkle_duration):
+                active &= ~_FX_SPARKLES
+
+        self._active = active
                 
     def render(self):
         """Render all active effects."""
+        active = self._active
+        if not active:
+            return
+
         # Render grass particles
-        for particle in self.grass_particles:
-            alpha = int(255 * particle['life'])
+        if active & _FX_GRASS:
+            # gfxdraw beats draw.circle for these few-pixel dots (it loses
+            # badly on large circles, so the spiral keeps pygame.draw)
+            filled_circle = pygame.gfxdraw.filled_circle
+            screen = self.screen
             color = (34, 139, 34)  # Green
-            size = int(particle['size'] * particle['life'])
-            if size > 0:
-                pygame.draw.circle(self.screen, color, 
-                                 (int(particle['x']), int(particle['y'])), size)
+            for px, py, base_size, life in zip(self.grass_x, self.grass_y,
+                                               self.grass_size, self.grass_life):
+                size = int(base_size * life)
+                if size > 0:
+                    filled_circle(screen, int(px), int(py), size, color)
                 
         # Render shiny sparkles
-        for sparkle in self.shiny_sparkles:
-            alpha = int(255 * sparkle['life'])
-            # Draw star shape
-            x, y = int(sparkle['x']), int(sparkle['y'])
-            size = int(sparkle['size'] * sparkle['life'])
-            if size > 0:
-                # Four-pointed star
-                points = [
-                    (x, y - size),
-                    (x + size//3, y - size//3),
-                    (x + size, y),
-                    (x + size//3, y + size//3),
-                    (x, y + size),
-                    (x - size//3, y + size//3),
-                    (x - size, y),
-                    (x - size//3, y - size//3)
-                ]
-                pygame.draw.polygon(self.screen, (255, 255, 0), points)
-                pygame.draw.polygon(self.screen, (255, 255, 255), points, 1)
+        if active & _FX_SPARKLES:
+            sparkle_blits = []
+            sparkle_size = self.sparkle_size
+            for sx, sy, life in zip(self.sparkle_x, self.sparkle_y, self.sparkle_life):
+                x, y = int(sx), int(sy)
+                size = int(sparkle_size * life)
+                if size > 0:
+                    sparkle_blits.append((_sparkle_sprite(size), (x - size, y - size)))
+            if sparkle_blits:
+                self.screen.blits(sparkle_blits, False)
                 
         # Render exclamation mark
-        if self.exclamation_active:
+        if active & _FX_EXCLAMATION:
             self._render_exclamation()
             
         # Render encounter transition
-        if self.encounter_transition_active:
+        if active & _FX_TRANSITION:
             self._render_transition()
             
         # Render flash
-        if self.flash_active:
+        if active & _FX_FLASH:
             self._render_flash()
             
     def _render_exclamation(self):
         """Render exclamation mark effect."""
         # Bounce animation
-        bounce = abs(math.sin(self.exclamation_timer * 10)) * 10
+        bounce = _BOUNCE_LUT[int(self.exclamation_timer * _BOUNCE_SCALE) & (_BOUNCE_STEPS - 1)]
         x, y = self.exclamation_pos
-        y -= bounce + 40
+        x -= self._excl_half_w
+        y -= bounce + 40 + self._excl_half_h
         
-        # Draw exclamation mark
-        font = pygame.font.Font(None, 48)
-        text = font.render("!", True, (255, 255, 0))
-        outline = font.render("!", True, (0, 0, 0))
-        
-        # Draw outline
-        for dx, dy in [(-2, -2), (2, -2), (-2, 2), (2, 2)]:
-            self.screen.blit(outline, (x + dx - text.get_width()//2, 
-                                      y + dy - text.get_height()//2))
-        
-        # Draw main text
-        self.screen.blit(text, (x - text.get_width()//2, 
-                               y - text.get_height()//2))
+        # Outline first, then the main text on top
+        outline = self._excl_outline
+        self.screen.blits([
+            (outline, (x - 2, y - 2)),
+            (outline, (x + 2, y - 2)),
+            (outline, (x - 2, y + 2)),
+            (outline, (x + 2, y + 2)),
+            (self._excl_text, (x, y)),
+        ], False)
         
     def _render_transition(self):
         """Render encounter transition effect."""
         progress = self.transition_timer / self.transition_duration
+        screen = self.screen
+        transition_type = self.transition_type
         
-        if self.transition_type == "spiral":
-            # Spiral wipe effect
-            num_circles = 20
-            max_radius = max(self.screen_width, self.screen_height)
-            
-            for i in range(num_circles):
-                angle = i * 0.5 + progress * math.pi * 4
-                radius = (1 - progress) * max_radius * (1 - i / num_circles)
-                x = self.screen_width // 2 + math.cos(angle) * radius * 0.3
-                y = self.screen_height // 2 + math.sin(angle) * radius * 0.3
-                
-                circle_radius = int(radius * 0.2)
-                if circle_radius > 0:
-                    pygame.draw.circle(self.screen, (0, 0, 0), 
-                                     (int(x), int(y)), circle_radius)
+        if transition_type == "spiral":
+            # Spiral wipe effect, drawn from baked key frames
+            frames = self.SPIRAL_FRAMES
+            screen.blit(self._spiral_frame(min(frames - 1, int(progress * frames))), (0, 0))
                     
-        elif self.transition_type == "zoom":
+        elif transition_type == "zoom":
             # Zoom effect
-            rect_width = int(self.screen_width * (1 - progress))
-            rect_height = int(self.screen_height * (1 - progress))
+            width, height = self.screen_width, self.screen_height
+            rect_width = int(width * (1 - progress))
+            rect_height = int(height * (1 - progress))
             if rect_width > 0 and rect_height > 0:
-                x = (self.screen_width - rect_width) // 2
-                y = (self.screen_height - rect_height) // 2
+                x = (width - rect_width) // 2
+                y = (height - rect_height) // 2
                 
-                # Draw black bars
-                pygame.draw.rect(self.screen, (0, 0, 0), 
-                               (0, 0, self.screen_width, y))
-                pygame.draw.rect(self.screen, (0, 0, 0), 
-                               (0, y + rect_height, self.screen_width, 
-                                self.screen_height - y - rect_height))
-                pygame.draw.rect(self.screen, (0, 0, 0), 
-                               (0, y, x, rect_height))
-                pygame.draw.rect(self.screen, (0, 0, 0), 
-                               (x + rect_width, y, 
-                                self.screen_width - x - rect_width, rect_height))
+                # Black bars around the shrinking window. Surface.fill is a
+                # straight SDL_FillRect, so only the border pixels are touched
+                # (a full-screen mask blit would blend every pixel).
+                fill = screen.fill
+                black = (0, 0, 0)
+                fill(black, (0, 0, width, y))
+                fill(black, (0, y + rect_height, width, height - y - rect_height))
+                fill(black, (0, y, x, rect_height))
+                fill(black, (x + rect_width, y, width - x - rect_width, rect_height))
                                 
-        elif self.transition_type == "flash":
+        elif transition_type == "flash":
             # Multiple flash effect
             if int(progress * 10) % 2 == 0:
-                flash_surface = pygame.Surface((self.screen_width, self.screen_height))
-                flash_surface.fill((255, 255, 255))
-                flash_surface.set_alpha(128)
-                self.screen.blit(flash_surface, (0, 0))
+                half_white = self._half_white
+                if half_white is None:
+                    half_white = _to_display_format(
+                        pygame.Surface((self.screen_width, self.screen_height)), alpha=False)
+                    half_white.fill((255, 255, 255))
+                    half_white.set_alpha(128)
+                    self._half_white = half_white
+                screen.blit(half_white, (0, 0))
+                
+    def _spiral_frame(self, index: int) -> pygame.Surface:
+        """Get a spiral key frame, baking it on first use.
+
+        The spiral is deterministic, so each of the SPIRAL_FRAMES frames is
+        drawn once and reused by every later transition. Frames are
+        colorkeyed with RLE acceleration: SDL run-length encodes them on the
+        first blit, which keeps the cache small and makes the blit skip the
+        transparent runs.
+        """
+        frame = self._spiral_frames[index]
+        if frame is None:
+            frame = _to_display_format(
+                pygame.Surface((self.screen_width, self.screen_height)), alpha=False)
+            frame.fill(_SPIRAL_KEY)
+            self._draw_spiral(frame, index / self.SPIRAL_FRAMES)
+            frame.set_colorkey(_SPIRAL_KEY, pygame.RLEACCEL)
+            self._spiral_frames[index] = frame
+        return frame
+
+    def _draw_spiral(self, surface: pygame.Surface, progress: float):
+        """Draw the spiral wipe circles for a given progress onto a surface."""
+        num_circles = 20
+        width, height = self.screen_width, self.screen_height
+        half_width, half_height = width // 2, height // 2
+        max_radius = max(width, height)
+        shrink = (1 - progress) * max_radius
+        spin = progress * math.pi * 4
+        cos, sin = math.cos, math.sin
+        draw_circle = pygame.draw.circle
+        
+        for i in range(num_circles):
+            radius = shrink * (1 - i / num_circles)
+            circle_radius = int(radius * 0.2)
+            if circle_radius <= 0:
+                # Radii shrink with i, so every later circle is empty too
+                break
+            angle = i * 0.5 + spin
+            x = int(half_width + cos(angle) * radius * 0.3)
+            y = int(half_height + sin(angle) * radius * 0.3)
+            if (x + circle_radius < 0 or x - circle_radius > width
+                    or y + circle_radius < 0 or y - circle_radius > height):
+                continue
+            draw_circle(surface, (0, 0, 0), (x, y), circle_radius)
                 
     def _render_flash(self):
         """Render screen flash effect."""
         alpha = int(255 * (1 - self.flash_timer / self.flash_duration))
-        flash_surface = pygame.Surface((self.screen_width, self.screen_height))
-        flash_surface.fill(self.flash_color)
+        flash_surface = self._flash_surf
+        if flash_surface is None:
+            flash_surface = _to_display_format(
+                pygame.Surface((self.screen_width, self.screen_height)), alpha=False)
+            self._flash_surf = flash_surface
+        color = self.flash_color
+        if self._flash_surf_color != color:
+            flash_surface.fill(color)
+            self._flash_surf_color = color
         flash_surface.set_alpha(alpha)
         self.screen.blit(flash_surface, (0, 0))
 
@@ -253,52 +447,79 @@ class EncounterEffects:
 class EncounterInfo:
     """Display information about encounters and chains."""
     
+    PANEL_CACHE_MAX = 32
+
+    __slots__ = ("font", "small_font", "_panel_cache", "_backgrounds")
+
     def __init__(self):
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 20)
-        
-    def render(self, screen: pygame.Surface, encounter_data: dict, x: int = 10, y: int = 10):
-        """Render encounter information HUD."""
-        # Determine content height dynamically
-        chain_species = encounter_data.get('chain_species')
-        chain_count = encounter_data.get('chain_count', 0)
-        repel_steps = encounter_data.get('repel_steps', 0)
+        # (area, chain_species, chain_count, repel_steps) -> the panel's
+        # pre-rendered layers as (surface, offset) pairs. The HUD only
+        # changes when one of those values does, so almost every frame is
+        # a cache hit; the oldest entry is evicted once the cache is full.
+        self._panel_cache: Dict[tuple, List[Tuple[pygame.Surface, Tuple[int, int]]]] = {}
+        # Line count -> rounded background box. Only the height varies, so
+        # the boxes are drawn once and shared by every cached panel.
+        self._backgrounds: Dict[int, pygame.Surface] = {}
+
+    def _background(self, lines: int) -> pygame.Surface:
+        """Get the semi-transparent rounded background for a panel height."""
+        bg_surf = self._backgrounds.get(lines)
+        if bg_surf is None:
+            info_width = 200
+            info_height = 10 + lines * 22 + 6
+            bg_surf = pygame.Surface((info_width, info_height), pygame.SRCALPHA)
+            pygame.draw.rect(bg_surf, (20, 20, 40, 180),
+                             (0, 0, info_width, info_height), border_radius=8)
+            pygame.draw.rect(bg_surf, (70, 70, 100, 170),
+                             (0, 0, info_width, info_height), width=1, border_radius=8)
+            bg_surf = _to_display_format(bg_surf)
+            self._backgrounds[lines] = bg_surf
+        return bg_surf
 
+    def _build_panel(self, area: str, chain_species, chain_count: int,
+                     repel_steps: int) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Render the HUD background and text lines for one set of values."""
+        # Determine content height dynamically
         lines = 1  # area name always shown
         if chain_species:
             lines += 1
         if repel_steps > 0:
             lines += 1
-
-        info_width = 200
-        info_height = 10 + lines * 22 + 6
-        bg_rect = pygame.Rect(x, y, info_width, info_height)
-
-        # Semi-transparent rounded background
-        bg_surf = pygame.Surface((info_width, info_height), pygame.SRCALPHA)
-        pygame.draw.rect(bg_surf, (20, 20, 40, 180),
-                         (0, 0, info_width, info_height), border_radius=8)
-        pygame.draw.rect(bg_surf, (70, 70, 100, 170),
-                         (0, 0, info_width, info_height), width=1, border_radius=8)
-        screen.blit(bg_surf, bg_rect.topleft)
+        layers = [(self._background(lines), (0, 0))]
 
         # Area name - format from map_id (e.g. "pallet_town" -> "Pallet Town")
-        raw_area = encounter_data.get('area', 'Unknown')
-        display_area = raw_area.replace('_', ' ').title()
+        display_area = area.replace('_', ' ').title()
         area_text = self.font.render(display_area, True, (240, 240, 250))
-        screen.blit(area_text, (x + 10, y + 6))
+        layers.append((_to_display_format(area_text), (10, 6)))
 
-        cur_y = y + 28
+        cur_y = 28
 
         # Chain info (only shown when an active chain exists)
         if chain_species:
             chain_text = self.small_font.render(f"Chain: #{chain_species} x{chain_count}",
                                               True, (255, 255, 0))
-            screen.blit(chain_text, (x + 10, cur_y))
+            layers.append((_to_display_format(chain_text), (10, cur_y)))
             cur_y += 22
 
         # Repel status
         if repel_steps > 0:
             repel_text = self.small_font.render(f"Repel: {repel_steps} steps",
                                               True, (100, 200, 255))
-            screen.blit(repel_text, (x + 10, cur_y))
\ No newline at end of file
+            layers.append((_to_display_format(repel_text), (10, cur_y)))
+        return layers
+        
+    def render(self, screen: pygame.Surface, encounter_data: dict, x: int = 10, y: int = 10):
+        """Render encounter information HUD."""
+        key = (encounter_data.get('area', 'Unknown'),
+               encounter_data.get('chain_species'),
+               encounter_data.get('chain_count', 0),
+               encounter_data.get('repel_steps', 0))
+        layers = self._panel_cache.get(key)
+        if layers is None:
+            if len(self._panel_cache) >= self.PANEL_CACHE_MAX:
+                del self._panel_cache[next(iter(self._panel_cache))]
+            layers = self._build_panel(*key)
+            self._panel_cache[key] = layers
+        screen.blits([(surface, (x + dx, y + dy)) for surface, (dx, dy) in layers], False)
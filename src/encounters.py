@@ -4,34 +4,71 @@ Wild Pokemon Encounter System - Comprehensive encounter tables and mechanics
 
 import random
 import math
+import bisect
+import time
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
-from datetime import datetime
-from enum import Enum
-from dataclasses import dataclass
+from enum import IntEnum
+from dataclasses import dataclass, field
+from itertools import accumulate
 
 if TYPE_CHECKING:
     from .pokemon import Pokemon
 
-from .pokemon import PokemonType, Nature, create_pokemon_from_species
+from .pokemon import PokemonType, Nature, POKEMON_DATA, create_pokemon_from_species
 
 
-class EncounterRarity(Enum):
-    """Rarity tiers for Pokemon encounters."""
-    COMMON = "common"       # 50% chance
-    UNCOMMON = "uncommon"   # 30% chance
-    RARE = "rare"          # 15% chance
-    VERY_RARE = "very_rare" # 4% chance
-    LEGENDARY = "legendary" # 1% chance
+# Stats that carry IVs, in the order Pokemon.ivs uses
+_STATS = ("hp", "attack", "defense", "sp_attack", "sp_defense", "speed")
 
 
-class TimeOfDay(Enum):
-    """Time periods for time-based encounters."""
-    MORNING = "morning"    # 4:00 - 9:59
-    DAY = "day"           # 10:00 - 19:59
-    NIGHT = "night"       # 20:00 - 3:59
+# Encounter requirement bits (EncounterData.req_mask / _player_mask())
+_REQ_PLAYER_DATA = 1      # player data was supplied at all
+_REQ_ELITE_FOUR = 2       # "elite_four_defeated"
+_REQ_ALL_BADGES = 4       # "has_all_badges"
+_REQUIREMENT_BITS = {
+    "elite_four_defeated": _REQ_ELITE_FOUR,
+    "has_all_badges": _REQ_ALL_BADGES,
+    # Add more requirement flags as needed
+}
 
 
-@dataclass
+def _player_mask(player_data: Optional[Dict]) -> int:
+    """Encode the requirement flags the player currently satisfies."""
+    if not player_data:
+        return 0
+    mask = _REQ_PLAYER_DATA
+    if player_data.get("elite_four_defeated", False):
+        mask |= _REQ_ELITE_FOUR
+    if player_data.get("badge_count", 0) >= 8:
+        mask |= _REQ_ALL_BADGES
+    return mask
+
+
+class EncounterRarity(IntEnum):
+    """Rarity tiers for Pokemon encounters.
+
+    Values are ordinals so per-rarity tables can be plain tuples indexed by
+    the member.
+    """
+    COMMON = 0      # 50% chance
+    UNCOMMON = 1    # 30% chance
+    RARE = 2        # 15% chance
+    VERY_RARE = 3   # 4% chance
+    LEGENDARY = 4   # 1% chance
+
+
+# get_area_info() key for each rarity, indexed by EncounterRarity
+_RARITY_VALUES = tuple(rarity.name.lower() for rarity in EncounterRarity)
+
+
+class TimeOfDay(IntEnum):
+    """Time periods for time-based encounters (ordinal values)."""
+    MORNING = 0    # 4:00 - 9:59
+    DAY = 1        # 10:00 - 19:59
+    NIGHT = 2      # 20:00 - 3:59
+
+
+@dataclass(slots=True)
 class EncounterData:
     """Data for a potential Pokemon encounter."""
     species_id: int
@@ -40,9 +77,21 @@ class EncounterData:
     rarity: EncounterRarity
     conditions: Optional[Dict[str, any]] = None  # Special conditions like time, weather, etc.
     shiny_boost: float = 1.0  # Multiplier for shiny chance
+    # `conditions` pre-decoded for filtering: the required time of day, and
+    # the _REQ_* bits the player mask must contain (see _player_mask())
+    req_time: Optional[TimeOfDay] = field(default=None, init=False, repr=False)
+    req_mask: int = field(default=0, init=False, repr=False)
 
+    def __post_init__(self):
+        if self.conditions:
+            self.req_time = self.conditions.get("time")
+            if "requirement" in self.conditions:
+                # Any requirement needs player data; known ones add their flag
+                self.req_mask = _REQ_PLAYER_DATA | _REQUIREMENT_BITS.get(
+                    self.conditions["requirement"], 0)
 
-@dataclass
+
+@dataclass(slots=True)
 class EncounterTable:
     """Encounter table for a specific area."""
     area_name: str
@@ -50,6 +99,98 @@ class EncounterTable:
     encounters: List[EncounterData]
     repel_effective: bool = True
     min_chain_encounters: int = 0  # Minimum encounters for chaining
+    # (time of day, player mask) -> encounters available under those
+    # conditions; filled in by EncounterSystem._get_bucket()
+    buckets: Dict[tuple, '_EncounterBucket'] = field(default_factory=dict, init=False,
+                                                     repr=False, compare=False)
+    # get_area_info() result, built on first request
+    _info_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
+
+    def roll_step(self, steps_in_grass: int, chain_count: int, time_modifier: float) -> bool:
+        """Roll whether a step in this area's grass triggers an encounter."""
+        # Increase rate based on consecutive steps (more realistic curve)
+        step_bonus = min(steps_in_grass * 1.5, 15)  # Max +15% from steps
+        
+        # Chain bonus - slightly higher encounter rate when chaining
+        chain_bonus = 0
+        if chain_count > 5:
+            chain_bonus = min(chain_count * 0.5, 10)  # Max +10% from chain
+        
+        # Calculate final rate
+        modified_rate = (self.base_encounter_rate + step_bonus + chain_bonus) * time_modifier
+        modified_rate = min(modified_rate, 45)  # Cap at 45%
+        
+        # A float roll in [0, 100) instead of randint(1, 100): one C call
+        # and fractional rates are honoured rather than truncated
+        return random.random() * 100.0 < modified_rate
+
+
+class _EncounterBucket:
+    """The encounters of a table available under one set of conditions.
+
+    Sampling only needs the weight tables and each entry's species and level
+    range, so those live in flat parallel tuples (the hot side); the
+    EncounterData objects with conditions and shiny_boost (the cold side) are
+    only read once an entry has been picked.
+    """
+
+    # Buckets up to this size sample by bisecting the cumulative weights,
+    # which beats the alias table's two draws at these sizes
+    BISECT_MAX = 16
+
+    __slots__ = ("encounters", "alias_prob", "alias_index", "cum_weights",
+                 "species_ids", "min_levels", "max_levels")
+
+    def __init__(self, encounters: List[EncounterData], weights: List[int]):
+        self.encounters = encounters
+        self.alias_prob, self.alias_index = _build_alias_table(weights)
+        self.cum_weights = tuple(accumulate(weights))
+        self.species_ids = tuple(enc.species_id for enc in encounters)
+        self.min_levels = tuple(enc.min_level for enc in encounters)
+        self.max_levels = tuple(enc.max_level for enc in encounters)
+
+    def roll(self) -> int:
+        """Pick the index of an available encounter, weighted by rarity."""
+        n = len(self.species_ids)
+        # No draw needed for a lone entry
+        if n == 1:
+            return 0
+        if n <= self.BISECT_MAX:
+            cum_weights = self.cum_weights
+            return bisect.bisect_right(cum_weights, random.randrange(cum_weights[-1]))
+        i = random.randrange(n)
+        if random.random() >= self.alias_prob[i]:
+            i = self.alias_index[i]
+        return i
+
+
+def _build_alias_table(weights: List[int]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+    """Build a Vose alias table for sampling indices in proportion to weights.
+
+    Sampling is then O(1): pick a column i uniformly and keep it with
+    probability prob[i], otherwise take alias[i].
+    """
+    n = len(weights)
+    if n == 0:
+        return (), ()
+    total = sum(weights)
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large.pop()
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] += scaled[s] - 1.0
+        if scaled[l] < 1.0:
+            small.append(l)
+        else:
+            large.append(l)
+    # Whatever is left is full up to float rounding and keeps prob 1.0
+    return tuple(prob), tuple(alias)
 
 
 class EncounterSystem:
@@ -57,15 +198,24 @@ class EncounterSystem:
     
     # Base shiny chance (1 in 4096 in modern games)
     BASE_SHINY_CHANCE = 1 / 4096
+
+    # Shiny chance multiplier indexed by chain count (capped at 40+, where
+    # the shiny charm effect tops out at 3x)
+    _CHAIN_SHINY_MULT = (1.0,) * 10 + (1.5,) * 10 + (2.0,) * 10 + (2.5,) * 10 + (3.0,)
+
+    # Shiny rolls compare a 16-bit personality value against a threshold;
+    # 1/4096 is exactly 16 values out of 65536
+    SHINY_ROLL_BITS = 16
+
+    # Encounter rate multiplier, indexed by TimeOfDay: 10% more encounters
+    # in the morning, 20% more at night
+    TIME_MODIFIERS = (1.1, 1.0, 1.2)
+
+    # Seconds a get_time_of_day() result stays valid
+    TIME_OF_DAY_TTL = 60.0
     
-    # Rarity weights
-    RARITY_WEIGHTS = {
-        EncounterRarity.COMMON: 50,
-        EncounterRarity.UNCOMMON: 30,
-        EncounterRarity.RARE: 15,
-        EncounterRarity.VERY_RARE: 4,
-        EncounterRarity.LEGENDARY: 1
-    }
+    # Rarity weights, indexed by EncounterRarity
+    RARITY_WEIGHTS = (50, 30, 15, 4, 1)
     
     def __init__(self):
         self.encounter_tables: Dict[str, EncounterTable] = self._create_encounter_tables()
@@ -73,6 +223,10 @@ class EncounterSystem:
         self.chain_species = None  # Current chain species
         self.chain_count = 0  # Current chain count
         self.last_encounter_area = None
+        # (monotonic timestamp, result) of the last get_time_of_day() lookup
+        self._time_of_day_cache: Tuple[float, Optional[TimeOfDay]] = (0.0, None)
+        # (shiny_boost, chain multiplier) -> personality value threshold
+        self._shiny_thresholds: Dict[Tuple[float, float], int] = {}
         
     def _create_encounter_tables(self) -> Dict[str, EncounterTable]:
         """Create all encounter tables for different areas."""
@@ -125,17 +279,36 @@ class EncounterSystem:
             encounters=[]
         )
         
+        # Catch species typos at startup rather than dropping encounters in play
+        for area, table in tables.items():
+            for enc in table.encounters:
+                if enc.species_id not in POKEMON_DATA:
+                    raise ValueError(
+                        f"Unknown Pokemon species ID {enc.species_id} in {area} encounters")
+        
         return tables
     
     def get_time_of_day(self) -> TimeOfDay:
-        """Get current time of day based on system time."""
-        hour = datetime.now().hour
+        """Get current time of day based on system time.
+
+        The period only changes on hour boundaries, so the result is reused
+        for TIME_OF_DAY_TTL seconds instead of reading the wall clock on
+        every step in grass.
+        """
+        now = time.monotonic()
+        cached_at, cached = self._time_of_day_cache
+        if cached is not None and now - cached_at < self.TIME_OF_DAY_TTL:
+            return cached
+
+        hour = time.localtime().tm_hour
         if 4 <= hour < 10:
-            return TimeOfDay.MORNING
+            result = TimeOfDay.MORNING
         elif 10 <= hour < 20:
-            return TimeOfDay.DAY
+            result = TimeOfDay.DAY
         else:
-            return TimeOfDay.NIGHT
+            result = TimeOfDay.NIGHT
+        self._time_of_day_cache = (now, result)
+        return result
     
     def use_repel(self, steps: int):
         """Activate repel effect for specified steps."""
@@ -152,129 +325,121 @@ class EncounterSystem:
     
     def should_encounter(self, area: str, steps_in_grass: int = 1) -> bool:
         """Determine if an encounter should occur."""
-        if area not in self.encounter_tables:
+        table = self.encounter_tables.get(area)
+        if table is None:
             return False
         
-        table = self.encounter_tables[area]
-        
-        # Dynamic encounter rate calculation
-        base_rate = table.base_encounter_rate
-        
-        # Increase rate based on consecutive steps (more realistic curve)
-        step_bonus = min(steps_in_grass * 1.5, 15)  # Max +15% from steps
-        
-        # Time of day modifier
-        time_modifier = 1.0
-        current_time = self.get_time_of_day()
-        if current_time == TimeOfDay.MORNING:
-            time_modifier = 1.1  # 10% more encounters in morning
-        elif current_time == TimeOfDay.NIGHT:
-            time_modifier = 1.2  # 20% more encounters at night
-        
-        # Chain bonus - slightly higher encounter rate when chaining
-        chain_bonus = 0
-        if self.chain_count > 5:
-            chain_bonus = min(self.chain_count * 0.5, 10)  # Max +10% from chain
-        
-        # Calculate final rate
-        modified_rate = (base_rate + step_bonus + chain_bonus) * time_modifier
-        modified_rate = min(modified_rate, 45)  # Cap at 45%
-        
-        return random.randint(1, 100) <= modified_rate
+        return table.roll_step(steps_in_grass, self.chain_count,
+                               self.TIME_MODIFIERS[self.get_time_of_day()])
     
     def get_encounter(self, area: str, player_data: Optional[Dict] = None) -> Optional['Pokemon']:
         """Generate a wild Pokemon encounter for the given area."""
-        if area not in self.encounter_tables:
+        table = self.encounter_tables.get(area)
+        if table is None:
             return None
         
-        table = self.encounter_tables[area]
-        current_time = self.get_time_of_day()
-        
-        # Filter available encounters based on conditions
-        available_encounters = []
-        for enc in table.encounters:
-            # Check time conditions
-            if enc.conditions:
-                if "time" in enc.conditions and enc.conditions["time"] != current_time:
-                    continue
-                if "requirement" in enc.conditions:
-                    # Check special requirements (would need player data)
-                    if player_data:
-                        requirement = enc.conditions["requirement"]
-                        if requirement == "elite_four_defeated" and not player_data.get("elite_four_defeated", False):
-                            continue
-                        elif requirement == "has_all_badges" and player_data.get("badge_count", 0) < 8:
-                            continue
-                        # Add more requirement checks as needed
-                    else:
-                        continue
-            
-            available_encounters.append(enc)
-        
-        if not available_encounters:
+        bucket = self._get_bucket(table, self.get_time_of_day(), player_data)
+        if not bucket.species_ids:
             return None
         
         # Select encounter based on rarity
-        encounter = self._select_by_rarity(available_encounters)
-        if not encounter:
-            return None
+        i = bucket.roll()
+        species_id = bucket.species_ids[i]
         
         # Generate level
-        level = random.randint(encounter.min_level, encounter.max_level)
+        level = random.randint(bucket.min_levels[i], bucket.max_levels[i])
         
-        # Create Pokemon
-        try:
-            wild_pokemon = create_pokemon_from_species(encounter.species_id, level)
-            
-            # Check for shiny
-            if self._check_shiny(encounter):
-                wild_pokemon.is_shiny = True
-            
-            # Update chain if same species
-            if self.chain_species == encounter.species_id:
-                self.chain_count += 1
-            else:
-                self.chain_species = encounter.species_id
-                self.chain_count = 1
-            
-            self.last_encounter_area = area
-            
-            return wild_pokemon
-            
-        except ValueError:
-            # Species not in POKEMON_DATA, return None
-            return None
-    
-    def _select_by_rarity(self, encounters: List[EncounterData]) -> Optional[EncounterData]:
-        """Select an encounter based on rarity weights."""
-        # Build weighted list
-        weighted_encounters = []
-        for enc in encounters:
-            weight = self.RARITY_WEIGHTS.get(enc.rarity, 1)
-            weighted_encounters.extend([enc] * weight)
+        # Create Pokemon (species IDs were validated when the tables were built)
+        wild_pokemon = create_pokemon_from_species(species_id, level)
         
-        if not weighted_encounters:
-            return None
+        # Check for shiny
+        if self._check_shiny(bucket.encounters[i]):
+            wild_pokemon.is_shiny = True
         
-        return random.choice(weighted_encounters)
+        # Update chain if same species
+        if self.chain_species == species_id:
+            self.chain_count += 1
+        else:
+            self.chain_species = species_id
+            self.chain_count = 1
+        
+        self.last_encounter_area = area
+        
+        return wild_pokemon
+
+    def get_encounters_batch(self, area: str, n: int,
+                             player_data: Optional[Dict] = None) -> List['Pokemon']:
+        """Sample n wild encounters for the area in one go.
+
+        Meant for simulations and balance checks: all species and levels are
+        drawn up front, and the chain state is read but not advanced.
+        """
+        table = self.encounter_tables.get(area)
+        if table is None or n <= 0:
+            return []
+        
+        bucket = self._get_bucket(table, self.get_time_of_day(), player_data)
+        size = len(bucket.species_ids)
+        if size == 0:
+            return []
+        
+        rand = random.random
+        randint = random.randint
+        if size == 1:
+            picks = [0] * n
+        else:
+            prob, alias = bucket.alias_prob, bucket.alias_index
+            picks = [i if rand() < prob[i] else alias[i]
+                     for i in [int(rand() * size) for _ in range(n)]]
+        min_levels, max_levels = bucket.min_levels, bucket.max_levels
+        levels = [randint(min_levels[i], max_levels[i]) for i in picks]
+        
+        species_ids, encounters = bucket.species_ids, bucket.encounters
+        batch = []
+        for i, level in zip(picks, levels):
+            wild_pokemon = create_pokemon_from_species(species_ids[i], level)
+            if self._check_shiny(encounters[i]):
+                wild_pokemon.is_shiny = True
+            batch.append(wild_pokemon)
+        return batch
+
+    def _get_bucket(self, table: EncounterTable, current_time: TimeOfDay,
+                    player_data: Optional[Dict]) -> _EncounterBucket:
+        """Get the encounters available under the given conditions.
+
+        Which entries pass the condition filter depends only on the time of
+        day and a few player flags, so each combination is filtered once per
+        table and cached together with its sampling tables.
+        """
+        player_mask = _player_mask(player_data)
+        key = (current_time, player_mask)
+        bucket = table.buckets.get(key)
+        if bucket is None:
+            available = self._filter_encounters(table, current_time, player_mask)
+            bucket = _EncounterBucket(
+                available, [self.RARITY_WEIGHTS[enc.rarity] for enc in available])
+            table.buckets[key] = bucket
+        return bucket
+
+    def _filter_encounters(self, table: EncounterTable, current_time: TimeOfDay,
+                           player_mask: int) -> List[EncounterData]:
+        """Filter a table's encounters by their time and requirement conditions."""
+        return [enc for enc in table.encounters
+                if (enc.req_time is None or enc.req_time == current_time)
+                and not enc.req_mask & ~player_mask]
     
     def _check_shiny(self, encounter: EncounterData) -> bool:
         """Check if the encountered Pokemon should be shiny."""
-        shiny_chance = self.BASE_SHINY_CHANCE * encounter.shiny_boost
-        
         # Chain bonus (increases shiny chance)
-        if self.chain_count > 0:
-            # Shiny charm effect at 40+ chain
-            if self.chain_count >= 40:
-                shiny_chance *= 3
-            elif self.chain_count >= 30:
-                shiny_chance *= 2.5
-            elif self.chain_count >= 20:
-                shiny_chance *= 2
-            elif self.chain_count >= 10:
-                shiny_chance *= 1.5
+        chain_mult = self._CHAIN_SHINY_MULT[min(self.chain_count, 40)]
+        key = (encounter.shiny_boost, chain_mult)
+        threshold = self._shiny_thresholds.get(key)
+        if threshold is None:
+            shiny_chance = self.BASE_SHINY_CHANCE * encounter.shiny_boost * chain_mult
+            threshold = round(shiny_chance * (1 << self.SHINY_ROLL_BITS))
+            self._shiny_thresholds[key] = threshold
         
-        return random.random() < shiny_chance
+        return random.getrandbits(self.SHINY_ROLL_BITS) < threshold
     
     def break_chain(self):
         """Break the current encounter chain."""
@@ -286,23 +451,24 @@ class EncounterSystem:
         return self.chain_species, self.chain_count
     
     def get_area_info(self, area: str) -> Optional[Dict]:
-        """Get information about Pokemon available in an area."""
-        if area not in self.encounter_tables:
+        """Get information about Pokemon available in an area.
+
+        Encounter tables are static, so the dict is built once per area and
+        shared by callers; treat it as read-only.
+        """
+        table = self.encounter_tables.get(area)
+        if table is None:
             return None
         
-        table = self.encounter_tables[area]
+        if table._info_cache is not None:
+            return table._info_cache
         
         # Organize by rarity
+        by_rarity = {value: [] for value in _RARITY_VALUES}
         info = {
             "area_name": table.area_name,
             "encounter_rate": table.base_encounter_rate,
-            "pokemon_by_rarity": {
-                EncounterRarity.COMMON.value: [],
-                EncounterRarity.UNCOMMON.value: [],
-                EncounterRarity.RARE.value: [],
-                EncounterRarity.VERY_RARE.value: [],
-                EncounterRarity.LEGENDARY.value: []
-            }
+            "pokemon_by_rarity": by_rarity
         }
         
         for enc in table.encounters:
@@ -311,52 +477,43 @@ class EncounterSystem:
                 "level_range": f"{enc.min_level}-{enc.max_level}",
                 "conditions": enc.conditions
             }
-            info["pokemon_by_rarity"][enc.rarity.value].append(pokemon_info)
+            by_rarity[_RARITY_VALUES[enc.rarity]].append(pokemon_info)
         
+        table._info_cache = info
         return info
 
 
+# Every 6-bit stat mask with exactly k bits set, indexed by k; picking one
+# uniformly is the same as sampling k of the six stats
+_PERFECT_IV_MASKS = tuple(
+    tuple(mask for mask in range(1 << len(_STATS)) if bin(mask).count("1") == k)
+    for k in range(len(_STATS) + 1)
+)
+
+
+def _roll_ivs(perfect_count: int) -> Dict[str, int]:
+    """Roll a random IV spread with perfect_count stats fixed at 31."""
+    masks = _PERFECT_IV_MASKS[max(0, min(perfect_count, 6))]
+    mask = masks[random.randrange(len(masks))]
+    randint = random.randint
+    return {stat: 31 if mask >> i & 1 else randint(0, 31) for i, stat in enumerate(_STATS)}
+
+
 # Special encounter functions for unique situations
 def generate_starter_encounter(starter_id: int) -> 'Pokemon':
     """Generate a starter Pokemon with perfect IVs in some stats."""
     # Starters have at least 3 perfect IVs
-    perfect_ivs = random.sample(["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"], 3)
-    ivs = {}
-    for stat in ["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"]:
-        if stat in perfect_ivs:
-            ivs[stat] = 31
-        else:
-            ivs[stat] = random.randint(0, 31)
-    
-    return create_pokemon_from_species(starter_id, level=5, ivs=ivs)
+    return create_pokemon_from_species(starter_id, level=5, ivs=_roll_ivs(3))
 
 
 def generate_gift_pokemon(species_id: int, level: int, guaranteed_ivs: int = 0) -> 'Pokemon':
     """Generate a gift Pokemon with potentially guaranteed perfect IVs."""
-    ivs = {}
-    if guaranteed_ivs > 0:
-        perfect_stats = random.sample(["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"], 
-                                    min(guaranteed_ivs, 6))
-        for stat in ["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"]:
-            if stat in perfect_stats:
-                ivs[stat] = 31
-            else:
-                ivs[stat] = random.randint(0, 31)
-    
-    return create_pokemon_from_species(species_id, level=level, ivs=ivs)
+    return create_pokemon_from_species(species_id, level=level, ivs=_roll_ivs(guaranteed_ivs))
 
 
 def generate_legendary_encounter(species_id: int, level: int) -> 'Pokemon':
     """Generate a legendary Pokemon with guaranteed 3 perfect IVs."""
     # Legendaries have at least 3 perfect IVs
-    perfect_ivs = random.sample(["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"], 3)
-    ivs = {}
-    for stat in ["hp", "attack", "defense", "sp_attack", "sp_defense", "speed"]:
-        if stat in perfect_ivs:
-            ivs[stat] = 31
-        else:
-            ivs[stat] = random.randint(0, 31)
-    
     # Legendaries often have specific natures that suit them
     # This could be expanded to prefer certain natures for certain legendaries
-    return create_pokemon_from_species(species_id, level=level, ivs=ivs)
\ No newline at end of file
+    return create_pokemon_from_species(species_id, level=level, ivs=_roll_ivs(3))
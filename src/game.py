@@ -29,6 +29,20 @@ class GameState:
 class Game:
     """Main game class that manages the game loop and states."""
     
+    # High-frequency analog and touch input the game never reads; SDL drops
+    # these before they are queued. Everything else is left enabled.
+    NOISY_EVENTS = (pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+                    pygame.CONTROLLERAXISMOTION, pygame.FINGERMOTION)
+    
+    # Starter selection cards: (name, species id, type color, type label)
+    STARTER_CARDS = (
+        ("Bulbasaur", 1, (120, 200, 80), "Grass/Poison"),
+        ("Charmander", 4, (240, 128, 48), "Fire"),
+        ("Squirtle", 7, (104, 144, 240), "Water"),
+    )
+    STARTER_CARD_WIDTH = 220
+    STARTER_CARD_HEIGHT = 290
+    
     def __init__(self):
         # Display settings - Larger window
         self.SCREEN_WIDTH = 1280
@@ -39,6 +53,10 @@ class Game:
         print("  - Creating game window...")
         self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
         pygame.display.set_caption("Pokemon Game")
+        pygame.event.set_blocked(self.NOISY_EVENTS)
+        # Default-font sizes used by the screens drawn here, loaded once
+        self.fonts = {size: pygame.font.Font(None, size)
+                      for size in (18, 20, 22, 24, 26, 28, 30, 48, 52)}
         self.clock = pygame.time.Clock()
         
         # Show loading screen
@@ -85,6 +103,8 @@ class Game:
         # Starter selection
         self.starter_selection_active = False
         self.selected_starter = 0
+        # Pre-rendered starter screen surfaces, built on first display
+        self._starter_cache = None
         
         # Current NPC for interactions
         self.current_npc = None
@@ -94,11 +114,40 @@ class Game:
 
         # Save confirmation message
         self._save_message_timer = 0.0
+        
+        # Static HUD text and backgrounds for render_world
+        self._build_hud_surfaces()
 
         # Battle end timer
         self.battle_end_timer = 0.0
         self.battle_end_delay = 3.0  # 3 seconds delay after battle ends
     
+    def _build_hud_surfaces(self):
+        """Pre-render the fixed HUD messages drawn over the world view."""
+        # "No wild Pokemon" tip (semi-transparent rounded style)
+        self._tip_surface = self.fonts[26].render(
+            "No wild Pokemon here -- head NORTH to Route 1!", True, (255, 240, 100))
+        self._tip_rect = self._tip_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 55))
+        tip_bg_rect = self._tip_rect.inflate(24, 12)
+        self._tip_bg = pygame.Surface(tip_bg_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._tip_bg, (20, 20, 30, 200),
+                         (0, 0, tip_bg_rect.width, tip_bg_rect.height),
+                         border_radius=8)
+        pygame.draw.rect(self._tip_bg, (255, 200, 50, 160),
+                         (0, 0, tip_bg_rect.width, tip_bg_rect.height),
+                         width=2, border_radius=8)
+        self._tip_bg_pos = tip_bg_rect.topleft
+        
+        # "Game Saved!" confirmation; faded out with set_alpha as it expires
+        self._save_surface = self.fonts[28].render("Game Saved!", True, (255, 255, 255))
+        self._save_rect = self._save_surface.get_rect(topright=(self.SCREEN_WIDTH - 20, 20))
+        save_bg_rect = self._save_rect.inflate(16, 8)
+        self._save_bg = pygame.Surface(save_bg_rect.size, pygame.SRCALPHA)
+        pygame.draw.rect(self._save_bg, (20, 20, 40, 200),
+                         (0, 0, save_bg_rect.width, save_bg_rect.height),
+                         border_radius=6)
+        self._save_bg_pos = save_bg_rect.topleft
+    
     def load_map_data(self):
         """Load or generate map data."""
         # Map data is now handled by the World class
@@ -175,7 +224,16 @@ class Game:
     
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
+        # Hover state only needs the latest pointer position, so each run of
+        # consecutive mouse motion collapses to its last event, kept in place
+        # so clicks and keys still see the hover state that preceded them
+        events = pygame.event.get()
+        motion = pygame.MOUSEMOTION
+        for i, event in enumerate(events):
+            if (event.type == motion and i + 1 < len(events)
+                    and events[i + 1].type == motion):
+                continue
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -628,208 +686,232 @@ class Game:
 
             # Show tip if in area without encounters (semi-transparent rounded style)
             if self.world.current_map_id not in self.world.encounter_system.encounter_tables:
-                tip_font = pygame.font.Font(None, 26)
-                tip_text = "No wild Pokemon here -- head NORTH to Route 1!"
-                text_surface = tip_font.render(tip_text, True, (255, 240, 100))
-                text_rect = text_surface.get_rect(center=(self.SCREEN_WIDTH // 2, 55))
-
-                bg_rect = text_rect.inflate(24, 12)
-                bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                pygame.draw.rect(bg_surf, (20, 20, 30, 200),
-                                 (0, 0, bg_rect.width, bg_rect.height),
-                                 border_radius=8)
-                pygame.draw.rect(bg_surf, (255, 200, 50, 160),
-                                 (0, 0, bg_rect.width, bg_rect.height),
-                                 width=2, border_radius=8)
-                self.screen.blit(bg_surf, bg_rect.topleft)
-                self.screen.blit(text_surface, text_rect)
+                self.screen.blit(self._tip_bg, self._tip_bg_pos)
+                self.screen.blit(self._tip_surface, self._tip_rect)
             # Save confirmation message
             if self._save_message_timer > 0:
-                save_font = pygame.font.Font(None, 28)
-                save_text = save_font.render("Game Saved!", True, (255, 255, 255))
-                save_rect = save_text.get_rect(topright=(self.SCREEN_WIDTH - 20, 20))
-                bg_rect = save_rect.inflate(16, 8)
-                bg_surf = pygame.Surface((bg_rect.width, bg_rect.height), pygame.SRCALPHA)
-                alpha = min(200, int(self._save_message_timer * 200))
-                pygame.draw.rect(bg_surf, (20, 20, 40, alpha),
-                                 (0, 0, bg_rect.width, bg_rect.height),
-                                 border_radius=6)
-                self.screen.blit(bg_surf, bg_rect.topleft)
-                save_text.set_alpha(min(255, int(self._save_message_timer * 255)))
-                self.screen.blit(save_text, save_rect)
+                alpha = min(255, int(self._save_message_timer * 255))
+                self._save_bg.set_alpha(alpha)
+                self.screen.blit(self._save_bg, self._save_bg_pos)
+                self._save_surface.set_alpha(alpha)
+                self.screen.blit(self._save_surface, self._save_rect)
         else:
             # Fallback rendering
             self.screen.fill((34, 139, 34))
     
-    def render_starter_selection(self):
-        """Render the starter Pokemon selection screen with dark theme."""
+    def _build_starter_cache(self):
+        """Pre-render the static parts of the starter selection screen."""
         sw, sh = self.SCREEN_WIDTH, self.SCREEN_HEIGHT
+        cache = {}
 
         # Dark gradient background matching main menu theme
+        background = pygame.Surface((sw, sh)).convert()
         for y in range(sh):
             t = y / max(sh - 1, 1)
             r = int(10 + (25 - 10) * t)
             g = int(10 + (20 - 10) * t)
             b = int(30 + (50 - 30) * t)
-            pygame.draw.line(self.screen, (r, g, b), (0, y), (sw, y))
+            pygame.draw.line(background, (r, g, b), (0, y), (sw, y))
+        cache["background"] = background
+
+        # Ambient dot; its pulse is applied with set_alpha when drawn
+        dot = pygame.Surface((4, 4), pygame.SRCALPHA)
+        pygame.draw.circle(dot, (56, 128, 255), (2, 2), 2)
+        cache["dot"] = dot
+
+        # Title, accent underline position and subtitle
+        title = self.fonts[52].render("Choose Your Starter Pokemon", True, (240, 240, 250))
+        title_rect = title.get_rect(center=(sw // 2, 100))
+        line_y = title_rect.bottom + 8
+        subtitle = self.fonts[26].render("Professor Oak has three Pokemon for you",
+                                         True, (170, 170, 190))
+        cache["title"] = (title, title_rect)
+        cache["line_y"] = line_y
+        cache["subtitle"] = (subtitle, subtitle.get_rect(center=(sw // 2, line_y + 22)))
+
+        card_width = self.STARTER_CARD_WIDTH
+        card_height = self.STARTER_CARD_HEIGHT
+
+        # Shadow shared by all cards
+        shadow = pygame.Surface((card_width + 8, card_height + 8), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0, 0, 0, 50),
+                         (4, 4, card_width, card_height), border_radius=14)
+        cache["shadow"] = shadow
+
+        # Per starter: (unselected card, selected card), outer glow and
+        # selection indicator
+        cache["cards"] = []
+        cache["glows"] = []
+        cache["indicators"] = []
+        for name, species_id, color, type_text in self.STARTER_CARDS:
+            cache["cards"].append(tuple(
+                self._render_starter_card(name, species_id, color, type_text, selected)
+                for selected in (False, True)))
+
+            # Outer glow; its pulse is applied with set_alpha when drawn
+            glow_surf = pygame.Surface((card_width + 12, card_height + 12), pygame.SRCALPHA)
+            pygame.draw.rect(glow_surf, color,
+                             (0, 0, card_width + 12, card_height + 12),
+                             width=3, border_radius=17)
+            cache["glows"].append(glow_surf)
+
+            cache["indicators"].append(self.fonts[28].render("▲ SELECTED", True, color))
+
+        # Instructions - styled pill at bottom
+        instructions_text = "◀ LEFT / RIGHT ▶  to select   •   ENTER to confirm   •   ESC to go back"
+        inst_surf = self.fonts[24].render(instructions_text, True, (200, 200, 220))
+        inst_rect = inst_surf.get_rect(center=(sw // 2, sh - 50))
+
+        # Background pill
+        pill_rect = inst_rect.inflate(40, 16)
+        pill = pygame.Surface((pill_rect.width, pill_rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(pill, (20, 20, 40, 180),
+                         (0, 0, pill_rect.width, pill_rect.height), border_radius=12)
+        pygame.draw.rect(pill, (70, 70, 100, 120),
+                         (0, 0, pill_rect.width, pill_rect.height),
+                         width=1, border_radius=12)
+        cache["instructions"] = (pill, pill_rect.topleft, inst_surf, inst_rect)
+
+        return cache
+
+    def _render_starter_card(self, name, species_id, color, type_text, is_selected):
+        """Render one starter card without its animated glow and indicator."""
+        card_width = self.STARTER_CARD_WIDTH
+        card_height = self.STARTER_CARD_HEIGHT
+
+        # Card surface
+        card_surf = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+
+        # Card background - dark themed
+        bg_color = (45, 45, 68) if not is_selected else (55, 55, 85)
+        pygame.draw.rect(card_surf, bg_color,
+                         (0, 0, card_width, card_height), border_radius=14)
+
+        # Border: inner accent border if selected, subtle otherwise
+        if is_selected:
+            pygame.draw.rect(card_surf, (*color, 220),
+                             (0, 0, card_width, card_height),
+                             width=2, border_radius=14)
+        else:
+            pygame.draw.rect(card_surf, (70, 70, 100, 140),
+                             (0, 0, card_width, card_height),
+                             width=1, border_radius=14)
+
+        # Sprite area with subtle background circle
+        sprite_cx = card_width // 2
+        sprite_cy = 80
+        pygame.draw.circle(card_surf, (*color, 30), (sprite_cx, sprite_cy), 55)
+
+        # Pokemon sprite
+        sprite_filename = f"{species_id}_normal.png"
+        sprite_path = f"assets/sprites/{sprite_filename}"
+        sprite_size = 110
+
+        try:
+            sprite = pygame.image.load(sprite_path).convert_alpha()
+            sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
+            card_surf.blit(sprite, (sprite_cx - sprite_size // 2,
+                                    sprite_cy - sprite_size // 2))
+        except Exception:
+            # Fallback colored circle
+            pygame.draw.circle(card_surf, color, (sprite_cx, sprite_cy), 45)
+            fb = self.fonts[18].render(name, True, (255, 255, 255))
+            card_surf.blit(fb, fb.get_rect(center=(sprite_cx, sprite_cy)))
+
+        # Pokemon name
+        ns = self.fonts[30].render(name, True, (240, 240, 250))
+        card_surf.blit(ns, ns.get_rect(center=(card_width // 2, 155)))
+
+        # Type badge
+        badge_text = self.fonts[20].render(type_text.upper(), True, (255, 255, 255))
+        bw = badge_text.get_width() + 16
+        bh = badge_text.get_height() + 6
+        bx = (card_width - bw) // 2
+        by = 175
+        pygame.draw.rect(card_surf, (*color, 200), (bx, by, bw, bh), border_radius=8)
+        card_surf.blit(badge_text, badge_text.get_rect(center=(card_width // 2, by + bh // 2)))
+
+        # Level
+        lv = self.fonts[22].render("Level 5", True, (170, 170, 190))
+        card_surf.blit(lv, lv.get_rect(center=(card_width // 2, 210)))
+
+        return card_surf
+
+    def render_starter_selection(self):
+        """Render the starter Pokemon selection screen with dark theme."""
+        sw, sh = self.SCREEN_WIDTH, self.SCREEN_HEIGHT
+        if self._starter_cache is None:
+            self._starter_cache = self._build_starter_cache()
+        cache = self._starter_cache
+        screen = self.screen
+
+        screen.blit(cache["background"], (0, 0))
 
         # Subtle decorative particles (static dots for ambience)
         tick = pygame.time.get_ticks()
+        dot = cache["dot"]
         for i in range(30):
             px = (i * 137 + 50) % sw
             py = (i * 97 + 30) % sh
-            alpha = int(40 + 30 * math.sin(tick * 0.001 + i))
-            dot = pygame.Surface((4, 4), pygame.SRCALPHA)
-            pygame.draw.circle(dot, (56, 128, 255, alpha), (2, 2), 2)
-            self.screen.blit(dot, (px, py))
+            dot.set_alpha(int(40 + 30 * math.sin(tick * 0.001 + i)))
+            screen.blit(dot, (px, py))
 
         # Title with accent underline
-        title_font = pygame.font.Font(None, 52)
-        title_text = title_font.render("Choose Your Starter Pokemon", True, (240, 240, 250))
-        title_rect = title_text.get_rect(center=(sw // 2, 100))
-        self.screen.blit(title_text, title_rect)
-
-        # Accent line under title
+        screen.blit(*cache["title"])
         line_w = 260
-        line_y = title_rect.bottom + 8
-        pygame.draw.line(self.screen, (56, 128, 255),
+        line_y = cache["line_y"]
+        pygame.draw.line(screen, (56, 128, 255),
                          (sw // 2 - line_w // 2, line_y),
                          (sw // 2 + line_w // 2, line_y), 2)
 
         # Subtitle
-        sub_font = pygame.font.Font(None, 26)
-        sub_text = sub_font.render("Professor Oak has three Pokemon for you", True, (170, 170, 190))
-        sub_rect = sub_text.get_rect(center=(sw // 2, line_y + 22))
-        self.screen.blit(sub_text, sub_rect)
+        screen.blit(*cache["subtitle"])
 
         # Starter options
-        starters = [
-            ("Bulbasaur", 1, (120, 200, 80), "Grass/Poison"),
-            ("Charmander", 4, (240, 128, 48), "Fire"),
-            ("Squirtle", 7, (104, 144, 240), "Water"),
-        ]
-
-        card_width = 220
-        card_height = 290
+        card_width = self.STARTER_CARD_WIDTH
+        card_height = self.STARTER_CARD_HEIGHT
         spacing = 40
         total_width = card_width * 3 + spacing * 2
         start_x = (sw - total_width) // 2
         # Vertically center cards between subtitle and instructions area
         start_y = (sh - card_height) // 2 + 20
 
-        for i, (name, species_id, color, type_text) in enumerate(starters):
+        shadow = cache["shadow"]
+        for i, cards in enumerate(cache["cards"]):
             x = start_x + i * (card_width + spacing)
             is_selected = (i == self.selected_starter)
 
-            card_rect = pygame.Rect(x, start_y, card_width, card_height)
-
             # Shadow
-            shadow = pygame.Surface((card_width + 8, card_height + 8), pygame.SRCALPHA)
-            pygame.draw.rect(shadow, (0, 0, 0, 50),
-                             (4, 4, card_width, card_height), border_radius=14)
-            self.screen.blit(shadow, (x - 4, start_y - 4))
-
-            # Card surface
-            card_surf = pygame.Surface((card_width, card_height), pygame.SRCALPHA)
+            screen.blit(shadow, (x - 4, start_y - 4))
 
-            # Card background - dark themed
-            bg_color = (45, 45, 68) if not is_selected else (55, 55, 85)
-            pygame.draw.rect(card_surf, bg_color,
-                             (0, 0, card_width, card_height), border_radius=14)
-
-            # Border: type-colored glow if selected, subtle otherwise
+            # Outer glow if selected
             if is_selected:
-                # Outer glow
-                glow_surf = pygame.Surface((card_width + 12, card_height + 12), pygame.SRCALPHA)
-                pulse = int(160 + 60 * math.sin(tick * 0.004))
-                pygame.draw.rect(glow_surf, (*color, pulse),
-                                 (0, 0, card_width + 12, card_height + 12),
-                                 width=3, border_radius=17)
-                self.screen.blit(glow_surf, (x - 6, start_y - 6))
-                # Inner accent border
-                pygame.draw.rect(card_surf, (*color, 220),
-                                 (0, 0, card_width, card_height),
-                                 width=2, border_radius=14)
-            else:
-                pygame.draw.rect(card_surf, (70, 70, 100, 140),
-                                 (0, 0, card_width, card_height),
-                                 width=1, border_radius=14)
-
-            # Sprite area with subtle background circle
-            sprite_cx = card_width // 2
-            sprite_cy = 80
-            pygame.draw.circle(card_surf, (*color, 30), (sprite_cx, sprite_cy), 55)
+                glow_surf = cache["glows"][i]
+                glow_surf.set_alpha(int(160 + 60 * math.sin(tick * 0.004)))
+                screen.blit(glow_surf, (x - 6, start_y - 6))
 
-            # Pokemon sprite
-            sprite_filename = f"{species_id}_normal.png"
-            sprite_path = f"assets/sprites/{sprite_filename}"
-            sprite_size = 110
-
-            try:
-                sprite = pygame.image.load(sprite_path)
-                sprite = pygame.transform.scale(sprite, (sprite_size, sprite_size))
-                card_surf.blit(sprite, (sprite_cx - sprite_size // 2,
-                                        sprite_cy - sprite_size // 2))
-            except Exception:
-                # Fallback colored circle
-                pygame.draw.circle(card_surf, color, (sprite_cx, sprite_cy), 45)
-                fb_font = pygame.font.Font(None, 18)
-                fb = fb_font.render(name, True, (255, 255, 255))
-                card_surf.blit(fb, fb.get_rect(center=(sprite_cx, sprite_cy)))
-
-            # Pokemon name
-            name_font = pygame.font.Font(None, 30)
-            ns = name_font.render(name, True, (240, 240, 250))
-            card_surf.blit(ns, ns.get_rect(center=(card_width // 2, 155)))
-
-            # Type badge
-            badge_font = pygame.font.Font(None, 20)
-            badge_text = badge_font.render(type_text.upper(), True, (255, 255, 255))
-            bw = badge_text.get_width() + 16
-            bh = badge_text.get_height() + 6
-            bx = (card_width - bw) // 2
-            by = 175
-            pygame.draw.rect(card_surf, (*color, 200), (bx, by, bw, bh), border_radius=8)
-            card_surf.blit(badge_text, badge_text.get_rect(center=(card_width // 2, by + bh // 2)))
-
-            # Level
-            lv_font = pygame.font.Font(None, 22)
-            lv = lv_font.render("Level 5", True, (170, 170, 190))
-            card_surf.blit(lv, lv.get_rect(center=(card_width // 2, 210)))
+            screen.blit(cards[is_selected], (x, start_y))
 
             # Selection indicator arrow
             if is_selected:
                 arrow_y = card_height - 30
                 arrow_bounce = int(4 * math.sin(tick * 0.005))
-                indicator = pygame.font.Font(None, 28).render("▲ SELECTED", True, color)
-                card_surf.blit(indicator,
-                               indicator.get_rect(center=(card_width // 2, arrow_y + arrow_bounce)))
-
-            self.screen.blit(card_surf, (x, start_y))
+                indicator = cache["indicators"][i]
+                screen.blit(indicator,
+                            indicator.get_rect(center=(x + card_width // 2,
+                                                       start_y + arrow_y + arrow_bounce)))
 
         # Instructions - styled pill at bottom
-        instructions_text = "◀ LEFT / RIGHT ▶  to select   •   ENTER to confirm   •   ESC to go back"
-        inst_font = pygame.font.Font(None, 24)
-        inst_surf = inst_font.render(instructions_text, True, (200, 200, 220))
-        inst_rect = inst_surf.get_rect(center=(sw // 2, sh - 50))
-
-        # Background pill
-        pill_rect = inst_rect.inflate(40, 16)
-        pill = pygame.Surface((pill_rect.width, pill_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(pill, (20, 20, 40, 180),
-                         (0, 0, pill_rect.width, pill_rect.height), border_radius=12)
-        pygame.draw.rect(pill, (70, 70, 100, 120),
-                         (0, 0, pill_rect.width, pill_rect.height),
-                         width=1, border_radius=12)
-        self.screen.blit(pill, pill_rect.topleft)
-        self.screen.blit(inst_surf, inst_rect)
+        pill, pill_pos, inst_surf, inst_rect = cache["instructions"]
+        screen.blit(pill, pill_pos)
+        screen.blit(inst_surf, inst_rect)
     
     def show_loading_screen(self, message="Loading..."):
         """Show a loading screen with a message."""
         self.screen.fill((0, 0, 0))
         
         # Loading text
-        font = pygame.font.Font(None, 48)
+        font = self.fonts[48]
         text = font.render(message, True, (255, 255, 255))
         text_rect = text.get_rect(center=(self.SCREEN_WIDTH // 2, self.SCREEN_HEIGHT // 2))
         self.screen.blit(text, text_rect)
@@ -9,6 +9,60 @@ import os
 import math
 
 
+class Inventory(dict):
+    """Item bag mapping item id to quantity.
+
+    Behaves like a plain dict, but bumps ``version`` on every mutation so
+    views derived from the bag (e.g. pre-rendered menu rows) can tell when
+    they are stale without rescanning it. ``nonzero_count`` tracks how many
+    entries hold a positive quantity, so "has any items" is O(1).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+        self.nonzero_count = sum(1 for qty in self.values() if qty > 0)
+
+    def __setitem__(self, key, value):
+        old = self.get(key, 0)
+        super().__setitem__(key, value)
+        self.nonzero_count += (value > 0) - (old > 0)
+        self.version += 1
+
+    def __delitem__(self, key):
+        old = self[key]
+        super().__delitem__(key)
+        self.nonzero_count -= old > 0
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        return super().pop(key, *default)
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.nonzero_count -= value > 0
+        self.version += 1
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self.nonzero_count = 0
+        self.version += 1
+
+
 class Player:
     """Represents the player character in the Pokemon game."""
     
@@ -32,11 +86,11 @@ class Player:
         self.active_pokemon: Optional[Pokemon] = None
         self.money = 3000
         self.badges = []
-        self.inventory = {
+        self.inventory = Inventory({
             "pokeball": 5,
             "potion": 3,
             "super_potion": 1
-        }
+        })
         
         # Defeated trainers tracking (persists through save/load)
         self.defeated_trainers: set = set()
@@ -58,6 +112,16 @@ class Player:
         self.animation_timer = 0.0
         self.sprites = self._load_sprites()
     
+    @property
+    def inventory(self) -> Inventory:
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value: dict):
+        # Plain dicts (e.g. restored from a save) are wrapped so mutations
+        # keep bumping the version counter.
+        self._inventory = value if isinstance(value, Inventory) else Inventory(value)
+
     def add_pokemon(self, pokemon: Pokemon) -> bool:
         """Add a Pokemon to the team (max 6)."""
         if len(self.pokemon_team) < 6:
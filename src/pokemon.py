@@ -5,7 +5,7 @@ Pokemon Class - Comprehensive Pokemon entity with stats, IVs, EVs, natures, abil
 import random
 import math
 from typing import Dict, List, Optional, Tuple
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class StatusCondition(Enum):
@@ -237,6 +237,68 @@ TYPE_EFFECTIVENESS = {
     }
 }
 
+# Dense form of TYPE_EFFECTIVENESS for hot lookups:
+# TYPE_CHART[TYPE_INDEX[attacking]][TYPE_INDEX[defending]]
+TYPE_INDEX: Dict[PokemonType, int] = {t: i for i, t in enumerate(PokemonType)}
+TYPE_CHART: Tuple[Tuple[float, ...], ...] = tuple(
+    tuple(TYPE_EFFECTIVENESS.get(att, {}).get(def_type, 1.0) for def_type in PokemonType)
+    for att in PokemonType
+)
+
+
+# Stat order used to encode stat-raising effect tags
+_RAISE_STATS = ("attack", "defense", "sp_attack", "sp_defense", "speed", "accuracy", "evasion")
+
+
+class EffectTag(IntEnum):
+    """Integer tags for move effects, resolved once when a Move is built.
+
+    Stat-raising effects occupy one contiguous range ordered like
+    _RAISE_STATS (+1 stage first, then "sharply"), so the family check is a
+    range compare and the stat is recovered arithmetically.
+    """
+    NONE = 0
+    OTHER = 1  # Any effect the AI has no special handling for
+    PARALYSIS = 2
+    BURN = 3
+    FREEZE = 4
+    POISON = 5
+    SLEEP = 6
+    CONFUSION = 7
+    FLINCH = 8
+    RAISE_ATTACK = 16
+    RAISE_DEFENSE = 17
+    RAISE_SP_ATTACK = 18
+    RAISE_SP_DEFENSE = 19
+    RAISE_SPEED = 20
+    RAISE_ACCURACY = 21
+    RAISE_EVASION = 22
+    RAISE_ATTACK_SHARPLY = 23
+    RAISE_DEFENSE_SHARPLY = 24
+    RAISE_SP_ATTACK_SHARPLY = 25
+    RAISE_SP_DEFENSE_SHARPLY = 26
+    RAISE_SPEED_SHARPLY = 27
+    RAISE_ACCURACY_SHARPLY = 28
+    RAISE_EVASION_SHARPLY = 29
+
+    @classmethod
+    def from_effect(cls, effect: Optional[str]) -> "EffectTag":
+        """Resolve a move effect string to its tag."""
+        if not effect:
+            return cls.NONE
+        return cls.__members__.get(effect.upper(), cls.OTHER)
+
+    @property
+    def is_stat_raise(self) -> bool:
+        return EffectTag.RAISE_ATTACK <= self <= EffectTag.RAISE_EVASION_SHARPLY
+
+    @property
+    def raised_stat(self) -> Optional[str]:
+        """Stat raised by this effect, or None for other effects."""
+        if not self.is_stat_raise:
+            return None
+        return _RAISE_STATS[(self - EffectTag.RAISE_ATTACK) % len(_RAISE_STATS)]
+
 
 class Move:
     """Represents a Pokemon move."""
@@ -252,6 +314,7 @@ class Move:
         self.current_pp = pp
         self.priority = priority
         self.effect = effect
+        self.effect_tag = EffectTag.from_effect(effect)
         self.effect_chance = effect_chance
     
     def use(self) -> bool:
@@ -269,6 +332,49 @@ class Move:
             self.current_pp = min(self.pp, self.current_pp + amount)
 
 
+class StatBlock(dict):
+    """Stat name to value mapping for a Pokemon.
+
+    Behaves like a plain dict, but bumps ``version`` on every mutation so the
+    modified-stat cache can tell when an in-place write made it stale.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self.version += 1
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.version += 1
+        return item
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
 class Ability:
     """Represents a Pokemon ability."""
     def __init__(self, name: str, description: str, effect_type: str = None):
@@ -279,6 +385,9 @@ class Ability:
 
 class Pokemon:
     """Comprehensive Pokemon class with full stat system, IVs, EVs, natures, etc."""
+
+    # A battle opponent is either a lone wild Pokemon or a Trainer
+    is_trainer = False
     
     def __init__(self, species_data: Dict, level: int = 5, 
                  ivs: Optional[Dict[str, int]] = None,
@@ -290,6 +399,9 @@ class Pokemon:
         self.nickname = species_data["name"]
         self.species_id = species_data["id"]
         self.types = [PokemonType(t) for t in species_data["types"]]
+        # See type_values
+        self._type_values: Tuple[str, ...] = ()
+        self._type_values_src: Tuple[PokemonType, ...] = ()
         self.level = level
         
         # Base stats
@@ -322,7 +434,12 @@ class Pokemon:
         available_abilities = [Ability(**a) for a in species_data["abilities"]]
         self.ability = ability or random.choice(available_abilities)
         
-        # Calculate actual stats
+        # Calculate actual stats. get_modified_stat() results are cached in
+        # _stat_cache and rebuilt when stats, stages or status change;
+        # _stat_cache_version is the stats version the cache was built from.
+        self._stat_cache: Dict[str, int] = {}
+        self._stat_cache_version = -1
+        self._stat_dirty = True
         self.stats = self._calculate_stats()
         self.current_hp = self.stats["hp"]
         
@@ -330,6 +447,9 @@ class Pokemon:
         self.moves: List[Move] = []
         self.learnset = species_data["learnset"]
         self._learn_moves_up_to_level()
+        # Cached per-move scoring data, see get_move_profiles()
+        self._move_profiles: List[Tuple[int, int, int, float]] = []
+        self._move_profiles_key: Optional[Tuple[Tuple[Move, ...], Tuple[PokemonType, ...]]] = None
         
         # Status
         self.status = StatusCondition.NONE
@@ -515,7 +635,8 @@ class Pokemon:
             return True
         return False
     
-    def apply_status(self, status: StatusCondition) -> bool:
+    def apply_status(self, status: StatusCondition,
+                     rng: Optional[random.Random] = None) -> bool:
         """Apply a status condition. Returns True if successful."""
         # Can't apply status to fainted Pokemon
         if self.is_fainted:
@@ -540,16 +661,17 @@ class Pokemon:
         
         # Set initial counters
         if status == StatusCondition.ASLEEP:
-            self.status_counter = random.randint(1, 3)  # 1-3 turns
+            self.status_counter = (rng or random).randint(1, 3)  # 1-3 turns
         elif status == StatusCondition.BADLY_POISONED:
             self.status_counter = 1  # Damage multiplier
         elif status == StatusCondition.CONFUSED:
-            self.confusion_turns = random.randint(1, 4)  # 1-4 turns
+            self.confusion_turns = (rng or random).randint(1, 4)  # 1-4 turns
         
         return True
     
-    def process_status(self) -> Tuple[bool, List[str]]:
+    def process_status(self, rng: Optional[random.Random] = None) -> Tuple[bool, List[str]]:
         """Process status effects at end of turn. Returns (can_move, events)."""
+        rng = rng or random
         events = []
         can_move = True
         
@@ -563,12 +685,12 @@ class Pokemon:
                 can_move = False
         
         elif self.status == StatusCondition.PARALYZED:
-            if random.random() < 0.25:  # 25% chance to not move
+            if rng.random() < 0.25:  # 25% chance to not move
                 events.append(f"{self.nickname} is paralyzed! It can't move!")
                 can_move = False
         
         elif self.status == StatusCondition.FROZEN:
-            if random.random() < 0.2:  # 20% chance to thaw
+            if rng.random() < 0.2:  # 20% chance to thaw
                 self.status = StatusCondition.NONE
                 events.append(f"{self.nickname} thawed out!")
             else:
@@ -582,7 +704,7 @@ class Pokemon:
                 events.append(f"{self.nickname} snapped out of confusion!")
             else:
                 events.append(f"{self.nickname} is confused!")
-                if random.random() < 0.33:  # 33% chance to hurt itself
+                if rng.random() < 0.33:  # 33% chance to hurt itself
                     # Confusion damage calculation
                     damage = self.calculate_confusion_damage()
                     self.take_damage(damage)
@@ -622,29 +744,59 @@ class Pokemon:
         base_damage = level_factor * 40 * (attack / defense) + 2
         return max(1, int(base_damage))
     
+    @property
+    def stats(self) -> StatBlock:
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: Dict[str, int]):
+        # Plain dicts are wrapped so in-place writes keep bumping the version
+        self._stats = stats if isinstance(stats, StatBlock) else StatBlock(stats)
+        self._stat_dirty = True
+
+    @property
+    def status(self) -> StatusCondition:
+        return self._status
+
+    @status.setter
+    def status(self, status: StatusCondition):
+        self._status = status
+        self._stat_dirty = True
+
     def get_modified_stat(self, stat: str) -> int:
         """Get stat with battle modifiers applied."""
-        if stat == "hp":
-            return self.stats["hp"]  # HP doesn't have stages
-        
-        base_value = self.stats[stat]
-        stage = self.stat_stages.get(stat, 0)
-        
-        # Stat stage multipliers
-        if stage >= 0:
-            multiplier = (2 + stage) / 2
-        else:
-            multiplier = 2 / (2 - stage)
-        
-        modified = int(base_value * multiplier)
-        
-        # Apply status effects
-        if stat == "attack" and self.status == StatusCondition.BURNED:
-            modified = int(modified * 0.5)
-        elif stat == "speed" and self.status == StatusCondition.PARALYZED:
-            modified = int(modified * 0.25)
-        
-        return modified
+        if self._stat_dirty or self._stats.version != self._stat_cache_version:
+            self._rebuild_stat_cache()
+        return self._stat_cache[stat]
+
+    def _rebuild_stat_cache(self):
+        """Recompute every modified stat in one pass."""
+        cache = {"hp": self._stats["hp"]}  # HP doesn't have stages
+        stages = self.stat_stages
+        status = self._status
+        for stat, base_value in self._stats.items():
+            if stat == "hp":
+                continue
+            stage = stages.get(stat, 0)
+            
+            # Stat stage multipliers
+            if stage >= 0:
+                multiplier = (2 + stage) / 2
+            else:
+                multiplier = 2 / (2 - stage)
+            
+            modified = int(base_value * multiplier)
+            
+            # Apply status effects
+            if stat == "attack" and status == StatusCondition.BURNED:
+                modified = int(modified * 0.5)
+            elif stat == "speed" and status == StatusCondition.PARALYZED:
+                modified = int(modified * 0.25)
+            
+            cache[stat] = modified
+        self._stat_cache = cache
+        self._stat_cache_version = self._stats.version
+        self._stat_dirty = False
     
     def modify_stat_stage(self, stat: str, stages: int) -> Tuple[bool, str]:
         """Modify a stat stage. Returns (success, message)."""
@@ -658,6 +810,7 @@ class Pokemon:
                 return False, f"{self.nickname}'s {stat} won't go any lower!"
         
         self.stat_stages[stat] = new_stage
+        self._stat_dirty = True
         change = new_stage - current
         
         if change == 1:
@@ -677,13 +830,17 @@ class Pokemon:
         """Reset all stat stages to 0."""
         for stat in self.stat_stages:
             self.stat_stages[stat] = 0
+        self._stat_dirty = True
     
     def calculate_damage(self, move: Move, defender: 'Pokemon',
-                        critical: bool = False) -> Tuple[int, float, List[str]]:
+                        critical: bool = False,
+                        rng: Optional[random.Random] = None) -> Tuple[int, float, List[str]]:
         """Calculate damage dealt by a move. Returns (damage, effectiveness, events).
 
         Note: Accuracy is checked by the battle system before calling this method.
+        Critical and damage rolls use rng when given, else the random module.
         """
+        rng = rng or random
         events = []
 
         # Status moves don't deal damage
@@ -707,7 +864,7 @@ class Pokemon:
         if not critical:
             # Base critical rate is 1/16
             crit_chance = 1/16
-            critical = random.random() < crit_chance
+            critical = rng.random() < crit_chance
         
         if critical:
             base_damage *= 1.5
@@ -727,7 +884,7 @@ class Pokemon:
             base_damage *= 1.5
         
         # Random factor (85-100%)
-        random_factor = random.randint(85, 100) / 100
+        random_factor = rng.randint(85, 100) / 100
         
         # Calculate final damage
         damage = int(base_damage * effectiveness * random_factor)
@@ -750,16 +907,48 @@ class Pokemon:
         else:
             return (3 - stage) / 3
     
+    @property
+    def type_values(self) -> Tuple[str, ...]:
+        """The string values of this Pokemon's types, e.g. ("fire",).
+
+        Cached until self.types changes, whether it is replaced or edited in
+        place.
+        """
+        types = tuple(self.types)
+        if types != self._type_values_src:
+            self._type_values = tuple(t.value for t in types)
+            self._type_values_src = types
+        return self._type_values
+
+    def get_valid_move_indices(self) -> List[int]:
+        """Get indices of moves that still have PP."""
+        return [i for i, m in enumerate(self.moves) if m.current_pp > 0]
+
+    def get_move_profiles(self) -> List[Tuple[int, int, int, float]]:
+        """Get (type_index, power, accuracy, stab) for each move, aligned with self.moves.
+
+        Rebuilt only when the moves or types change, so AI scoring loops can
+        read plain numbers instead of re-deriving them every turn. The key
+        holds the Move objects themselves, not their ids, so a new move can't
+        be mistaken for a freed one that shared its address.
+        """
+        key = (tuple(self.moves), tuple(self.types))
+        if key != self._move_profiles_key:
+            self._move_profiles = [
+                (TYPE_INDEX[m.type], m.power, m.accuracy,
+                 1.5 if m.type in self.types else 1.0)
+                for m in self.moves
+            ]
+            self._move_profiles_key = key
+        return self._move_profiles
+
     def get_type_effectiveness(self, attacking_type: PokemonType, 
                                defending_types: List[PokemonType]) -> float:
         """Calculate type effectiveness multiplier."""
         effectiveness = 1.0
-        
+        row = TYPE_CHART[TYPE_INDEX[attacking_type]]
         for def_type in defending_types:
-            if attacking_type in TYPE_EFFECTIVENESS:
-                if def_type in TYPE_EFFECTIVENESS[attacking_type]:
-                    effectiveness *= TYPE_EFFECTIVENESS[attacking_type][def_type]
-        
+            effectiveness *= row[TYPE_INDEX[def_type]]
         return effectiveness
     
     def can_battle(self) -> bool:
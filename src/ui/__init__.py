@@ -14,7 +14,7 @@ from ..player import Player
 from ..battle import Battle, BattleState, BattleAction
 from ..pokemon import Pokemon, Move
 
-from .components import Colors, Button, HealthBar, ExperienceBar
+from .components import Colors, Button, HealthBar, ExperienceBar, _to_display_format
 from .battle_ui import BattleUI, PokemonInfoPanel, BattleMenu
 from .menu_ui import MenuUI
 from .world_hud import WorldHUD
@@ -98,6 +98,7 @@ class UI:
                 sprite = pygame.image.load(sprite_path)
                 if size:
                     sprite = pygame.transform.scale(sprite, size)
+                sprite = _to_display_format(sprite)
                 self.sprite_cache[cache_key] = sprite
                 return sprite
         except Exception:
@@ -224,7 +225,8 @@ class UI:
         elif self.state == UIState.BAG_MENU:
             self.draw_bag_menu(game.player)
 
-        self.draw_transition()
+        if self.transition_alpha:
+            self.draw_transition()
 
 
 __all__ = [
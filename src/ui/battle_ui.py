@@ -14,6 +14,7 @@ from ..battle_animations import BattleAnimationManager, AnimationType
 from .components import (
     Colors, Button, HealthBar, ExperienceBar,
     _draw_rounded_rect, _draw_shadow, _draw_gradient_rect, _draw_type_badge,
+    _to_display_format,
 )
 from .dialog import DialogBox
 
@@ -312,6 +313,7 @@ class BattleUI:
         self.font_large = font_large
 
         self._battle_bg_cache: Optional[pygame.Surface] = None
+        self._sprite_path_cache: Dict[Tuple[int, bool], str] = {}
         self._vs_shown_for_battle = False
         self._battle_fade_alpha = 0.0
         self._battle_fading_in = False
@@ -340,6 +342,7 @@ class BattleUI:
                 sprite = pygame.image.load(sprite_path)
                 if size:
                     sprite = pygame.transform.scale(sprite, size)
+                sprite = _to_display_format(sprite)
                 self.sprite_cache[cache_key] = sprite
                 return sprite
         except Exception:
@@ -367,7 +370,7 @@ class BattleUI:
             self._battle_fade_alpha = 255.0
 
         if hasattr(self, "_last_battle_log_length"):
-            cur = len(game.current_battle.battle_log) if game and game.current_battle else 0
+            cur = game.current_battle.log_count if game and game.current_battle else 0
             if cur > self._last_battle_log_length:
                 if game.current_battle and game.current_battle.last_used_move:
                     tp = self.opponent_sprite_pos if game.current_battle.player_pokemon else self.player_sprite_pos
@@ -413,12 +416,9 @@ class BattleUI:
         self.opponent_info_panel.set_pokemon(battle.opponent_pokemon)
 
         if battle.battle_log:
-            latest = ""
-            for entry in reversed(battle.battle_log):
-                if entry.strip():
-                    latest = entry
-                    break
-            if latest and self.battle_dialog.text != latest:
+            # The log never holds blank messages, so the newest entry is last
+            latest = battle.battle_log[-1]
+            if self.battle_dialog.text != latest:
                 self.battle_dialog.set_text(latest)
 
         self._draw_pokemon_sprite_on_surface(surface, battle.player_pokemon,
@@ -518,14 +518,19 @@ class BattleUI:
         pygame.draw.ellipse(bg, (130, 195, 130), edge_rect2)
         pygame.draw.ellipse(bg, (80, 130, 80), opp_rect, 3)
 
+        bg = _to_display_format(bg, alpha=False)
         self._battle_bg_cache = bg
         surface.blit(bg, (0, 0))
 
     def _draw_pokemon_sprite_on_surface(self, surface, pokemon, position, is_back):
         if not pokemon:
             return
-        sprite_fn = f"{pokemon.species_id}_{'back' if is_back else 'normal'}.png"
-        sprite_path = os.path.join("assets", "sprites", sprite_fn)
+        key = (pokemon.species_id, is_back)
+        sprite_path = self._sprite_path_cache.get(key)
+        if sprite_path is None:
+            sprite_fn = f"{pokemon.species_id}_{'back' if is_back else 'normal'}.png"
+            sprite_path = os.path.join("assets", "sprites", sprite_fn)
+            self._sprite_path_cache[key] = sprite_path
         sprite = self.load_sprite(sprite_path, (128, 128))
         if sprite:
             sr = sprite.get_rect(center=position)
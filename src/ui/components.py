@@ -92,6 +92,18 @@ class Colors:
     BUTTON_PRESSED = (45, 45, 70)
 
 
+def _to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface that will be cached and blitted often to the display format.
+
+    Blitting a surface whose pixel format differs from the display's forces a
+    per-pixel conversion on every blit. Without a display mode (e.g. headless
+    tests) the surface is returned unchanged.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
 def _draw_rounded_rect(surface: pygame.Surface, color, rect, radius: int = 10,
                         border: int = 0, border_color=None):
     """Draw a rectangle with rounded corners."""
@@ -141,11 +153,15 @@ def _draw_gradient_rect(surface: pygame.Surface, rect, color_top, color_bottom,
 
 
 def _draw_type_badge(surface: pygame.Surface, ptype: PokemonType, x: int, y: int,
-                      font: pygame.font.Font):
-    """Draw a small coloured type badge."""
+                      font: Optional[pygame.font.Font],
+                      text_surf: Optional[pygame.Surface] = None):
+    """Draw a small coloured type badge.
+
+    Pass a pre-rendered ``text_surf`` to skip rendering the label.
+    """
     color = Colors.TYPE_COLORS.get(ptype, Colors.GRAY)
-    label = ptype.value.upper()
-    text_surf = font.render(label, True, Colors.WHITE)
+    if text_surf is None:
+        text_surf = font.render(ptype.value.upper(), True, Colors.WHITE)
     tw, th = text_surf.get_size()
     pad_x, pad_y = 8, 3
     badge_w = tw + pad_x * 2
@@ -14,6 +14,7 @@ from ..items import ITEM_REGISTRY, ItemCategory
 from .components import (
     Colors, Button,
     _draw_rounded_rect, _draw_shadow, _draw_gradient_rect, _draw_type_badge,
+    _to_display_format,
 )
 
 
@@ -37,6 +38,14 @@ class MenuUI:
 
         # Pokemon menu
         self._pokemon_selected = 0
+        # Type badge labels never change, render each one once
+        badge_font = pygame.font.Font(None, 16)
+        self._type_label_surfaces: Dict[PokemonType, pygame.Surface] = {
+            t: _to_display_format(badge_font.render(t.value.upper(), True, Colors.WHITE))
+            for t in PokemonType
+        }
+        # Card geometry keyed by (party_size, selected index)
+        self._party_slot_positions: Dict[Tuple[int, int], List[Dict]] = {}
 
         # Bag menu
         self._bag_tab = 0
@@ -48,6 +57,14 @@ class MenuUI:
             [ItemCategory.BATTLE, ItemCategory.FIELD],
             [ItemCategory.KEY],
         ]
+        # Pre-rendered rows for the current tab, rebuilt when the bag changes
+        self._bag_entries: List[Tuple[str, int, pygame.Surface, pygame.Surface]] = []
+        # The inventory the rows were built from is held by reference (not
+        # id()), so a reloaded bag at the same address is never mistaken for it
+        self._bag_entries_inv: Optional[Dict[str, int]] = None
+        self._bag_entries_key: Optional[Tuple[int, int]] = None
+        self._bag_name_surfaces: Dict[str, pygame.Surface] = {}
+        self._bag_qty_surfaces: Dict[int, pygame.Surface] = {}
 
         # Main menu
         self._menu_selected = 0
@@ -93,6 +110,7 @@ class MenuUI:
                 sprite = pygame.image.load(sprite_path)
                 if size:
                     sprite = pygame.transform.scale(sprite, size)
+                sprite = _to_display_format(sprite)
                 self.sprite_cache[cache_key] = sprite
                 return sprite
         except Exception:
@@ -313,6 +331,46 @@ class MenuUI:
             lbl_surf = self.font_medium.render(label, True, Colors.TEXT_PRIMARY)
             self.screen.blit(lbl_surf, (cx + 75, iy + 12))
 
+    def _get_party_slot_positions(self, party_size: int, selected: int) -> List[Dict]:
+        """Return per-card layout for the Pokemon menu.
+
+        The selected card is taller than the rest, so the layout depends on
+        both party size and selection; each combination is computed once.
+        """
+        key = (party_size, selected)
+        slots = self._party_slot_positions.get(key)
+        if slots is not None:
+            return slots
+
+        card_w = 560
+        card_h_normal = 90
+        card_h_expanded = 170
+        gap = 10
+        base_x = (self.screen_width - card_w) // 2
+        cur_y = 80
+        slots = []
+        for i in range(party_size):
+            ch = card_h_expanded if i == selected else card_h_normal
+            info_x = base_x + 95
+            sprite_cx = base_x + 50
+            sprite_cy = cur_y + 45
+            hp_bar = pygame.Rect(info_x, cur_y + 60, card_w - 140, 8)
+            slots.append({
+                "card": (base_x, cur_y, card_w, ch),
+                "sprite_center": (sprite_cx, sprite_cy),
+                "info_x": info_x,
+                "name_y": cur_y + 12,
+                "level_y": cur_y + 16,
+                "type_y": cur_y + 38,
+                "hp_bar": hp_bar,
+                "hp_text_pos": (hp_bar.right + 8, hp_bar.y - 2),
+                "status_dot": (base_x + card_w - 30, cur_y + 15),
+                "detail_y": cur_y + 85,
+            })
+            cur_y += ch + gap
+        self._party_slot_positions[key] = slots
+        return slots
+
     def draw_pokemon_menu(self, player: Player):
         if not player:
             return
@@ -331,17 +389,13 @@ class MenuUI:
                                                            self.screen_height // 2)))
             return
 
-        card_w = 560
-        card_h_normal = 90
-        card_h_expanded = 170
-        gap = 10
-        base_x = (self.screen_width - card_w) // 2
-        cur_y = 80
+        slots = self._get_party_slot_positions(len(player.pokemon_team),
+                                               self._pokemon_selected)
 
         for i, pokemon in enumerate(player.pokemon_team):
             is_selected = (i == self._pokemon_selected)
-            ch = card_h_expanded if is_selected else card_h_normal
-            card_rect = (base_x, cur_y, card_w, ch)
+            slot = slots[i]
+            card_rect = slot["card"]
 
             _draw_shadow(self.screen, card_rect, radius=12, offset=4, alpha=50)
             bg_color = Colors.PANEL_BG_LIGHT if is_selected else Colors.PANEL_BG
@@ -352,8 +406,7 @@ class MenuUI:
             _draw_rounded_rect(self.screen, (0, 0, 0, 0), card_rect, radius=12,
                                border=2, border_color=border_c)
 
-            sprite_cx = base_x + 50
-            sprite_cy = cur_y + 45
+            sprite_cx, sprite_cy = slot["sprite_center"]
             pcolor = Colors.TYPE_COLORS.get(
                 pokemon.types[0] if pokemon.types else PokemonType.NORMAL, Colors.GRAY
             )
@@ -388,27 +441,24 @@ class MenuUI:
                 pygame.draw.polygon(star_surf, (255, 215, 0, 220), pts)
                 self.screen.blit(star_surf, (sprite_cx + 18, sprite_cy - 28))
 
-            info_x = base_x + 95
+            info_x = slot["info_x"]
             name_surf = self.font_medium.render(
                 f"{pokemon.nickname}", True, Colors.TEXT_PRIMARY
             )
-            self.screen.blit(name_surf, (info_x, cur_y + 12))
+            self.screen.blit(name_surf, (info_x, slot["name_y"]))
             lvl_surf = self.font_small.render(
                 f"Lv. {pokemon.level}", True, Colors.TEXT_SECONDARY
             )
-            self.screen.blit(lvl_surf, (info_x + name_surf.get_width() + 10, cur_y + 16))
+            self.screen.blit(lvl_surf, (info_x + name_surf.get_width() + 10, slot["level_y"]))
 
             badge_x = info_x
             for pt in pokemon.types:
-                bw = _draw_type_badge(self.screen, pt, badge_x, cur_y + 38,
-                                      pygame.font.Font(None, 16))
+                bw = _draw_type_badge(self.screen, pt, badge_x, slot["type_y"], None,
+                                      self._type_label_surfaces[pt])
                 badge_x += bw + 6
 
             hp_pct = pokemon.current_hp / pokemon.stats["hp"] if pokemon.stats["hp"] else 0
-            hp_bar_x = info_x
-            hp_bar_y = cur_y + 60
-            hp_bar_w = card_w - 140
-            hp_bar_h = 8
+            hp_bar_x, hp_bar_y, hp_bar_w, hp_bar_h = slot["hp_bar"]
             hp_color = Colors.HP_GREEN if hp_pct > 0.5 else Colors.HP_YELLOW if hp_pct > 0.25 else Colors.HP_RED
             _draw_rounded_rect(self.screen, (40, 40, 55), (hp_bar_x, hp_bar_y, hp_bar_w, hp_bar_h),
                                radius=4)
@@ -419,19 +469,18 @@ class MenuUI:
             hp_txt = self.font_small.render(
                 f"{pokemon.current_hp}/{pokemon.stats['hp']}", True, Colors.TEXT_SECONDARY
             )
-            self.screen.blit(hp_txt, (hp_bar_x + hp_bar_w + 8, hp_bar_y - 2))
+            self.screen.blit(hp_txt, slot["hp_text_pos"])
 
             if pokemon.status != StatusCondition.NONE:
                 sc = Colors.STATUS_COLORS.get(pokemon.status, Colors.RED)
-                dot_x = base_x + card_w - 30
-                dot_y = cur_y + 15
+                dot_x, dot_y = slot["status_dot"]
                 pygame.draw.circle(self.screen, sc, (dot_x, dot_y), 6)
                 st_label = self.font_small.render(pokemon.status.value[:3].upper(),
                                                   True, sc)
                 self.screen.blit(st_label, (dot_x - st_label.get_width() - 4, dot_y - 6))
 
             if is_selected:
-                detail_y = cur_y + 85
+                detail_y = slot["detail_y"]
                 moves_title = self.font_small.render("MOVES:", True, Colors.TEXT_SECONDARY)
                 self.screen.blit(moves_title, (info_x, detail_y))
                 for mi, move in enumerate(pokemon.moves[:4]):
@@ -450,14 +499,53 @@ class MenuUI:
                 sts = self.font_small.render(stats_text, True, Colors.TEXT_SECONDARY)
                 self.screen.blit(sts, (stat_x, stat_y))
 
-            cur_y += ch + gap
-
         footer = self.font_small.render(
             "UP/DOWN: Select  |  ESC: Back", True, Colors.TEXT_SECONDARY
         )
         self.screen.blit(footer, footer.get_rect(center=(self.screen_width // 2,
                                                          self.screen_height - 25)))
 
+    def _get_bag_entries(self, player: Player) -> List[Tuple[str, int, pygame.Surface, pygame.Surface]]:
+        """Return (item_id, qty, name_surface, qty_surface) rows for the current tab.
+
+        Rows are rebuilt only when the inventory or the selected tab changes;
+        name and quantity text surfaces are reused across rebuilds.
+        """
+        inventory = player.inventory
+        key = (inventory.version, self._bag_tab)
+        if inventory is self._bag_entries_inv and key == self._bag_entries_key:
+            return self._bag_entries
+
+        allowed_cats = self._bag_tab_categories[self._bag_tab]
+        entries: List[Tuple[str, int, pygame.Surface, pygame.Surface]] = []
+        for item_id, qty in inventory.items():
+            if qty <= 0:
+                continue
+            item_def = ITEM_REGISTRY.get(item_id)
+            if item_def and item_def.category in allowed_cats:
+                display_name = item_def.name
+            elif not item_def and self._bag_tab == 3:
+                display_name = item_id.replace("_", " ").title()
+            else:
+                continue
+
+            name_surf = self._bag_name_surfaces.get(item_id)
+            if name_surf is None:
+                name_surf = _to_display_format(
+                    self.font_medium.render(display_name, True, Colors.TEXT_PRIMARY))
+                self._bag_name_surfaces[item_id] = name_surf
+            qty_surf = self._bag_qty_surfaces.get(qty)
+            if qty_surf is None:
+                qty_surf = _to_display_format(
+                    self.font_small.render(f"x{qty}", True, Colors.TEXT_SECONDARY))
+                self._bag_qty_surfaces[qty] = qty_surf
+            entries.append((item_id, qty, name_surf, qty_surf))
+
+        self._bag_entries = entries
+        self._bag_entries_inv = inventory
+        self._bag_entries_key = key
+        return entries
+
     def draw_bag_menu(self, player: Player):
         if not player:
             return
@@ -484,16 +572,7 @@ class MenuUI:
             ts = self.font_small.render(tab_name, True, tc)
             self.screen.blit(ts, ts.get_rect(center=(tx + tab_w // 2, 88)))
 
-        allowed_cats = self._bag_tab_categories[self._bag_tab]
-        items_list: List[Tuple[str, int, str]] = []
-        for item_id, qty in player.inventory.items():
-            if qty <= 0:
-                continue
-            item_def = ITEM_REGISTRY.get(item_id)
-            if item_def and item_def.category in allowed_cats:
-                items_list.append((item_id, qty, item_def.name))
-            elif not item_def and self._bag_tab == 3:
-                items_list.append((item_id, qty, item_id.replace("_", " ").title()))
+        items_list = self._get_bag_entries(player)
 
         if self._bag_selected >= len(items_list):
             self._bag_selected = max(0, len(items_list) - 1)
@@ -521,7 +600,7 @@ class MenuUI:
             self.screen.blit(empty, (list_x + 20, list_y + 20))
         else:
             item_h = 44
-            for idx, (item_id, qty, display_name) in enumerate(items_list):
+            for idx, (item_id, qty, ns, qs) in enumerate(items_list):
                 iy = list_y + 10 + idx * (item_h + 4)
                 if iy + item_h > list_y + list_h - 10:
                     break
@@ -535,11 +614,8 @@ class MenuUI:
                     _draw_rounded_rect(self.screen, (0, 0, 0, 0), ir, radius=8,
                                        border=1, border_color=(50, 50, 70))
 
-                ns = self.font_medium.render(display_name, True, Colors.TEXT_PRIMARY)
                 self.screen.blit(ns, (list_x + 22, iy + 10))
 
-                qty_text = f"x{qty}"
-                qs = self.font_small.render(qty_text, True, Colors.TEXT_SECONDARY)
                 qw = qs.get_width() + 12
                 qr = (list_x + list_w - qw - 20, iy + 10, qw, 24)
                 _draw_rounded_rect(self.screen, (60, 60, 85), qr, radius=6)
@@ -6,7 +6,7 @@ import pygame
 
 from ..player import Player
 
-from .components import Colors
+from .components import Colors, _to_display_format
 
 
 class WorldHUD:
@@ -24,6 +24,16 @@ class WorldHUD:
         self._location_alpha = 0.0
         self._location_timer = 0.0
 
+        # Lead Pokemon text surfaces, re-rendered only when the value changes
+        self._name_font = pygame.font.Font(None, 22)
+        self._info_font = pygame.font.Font(None, 19)
+        self._name_cache: tuple[str, pygame.Surface] | None = None
+        self._level_cache: tuple[int, pygame.Surface] | None = None
+        self._hp_cache: tuple[tuple[int, int], pygame.Surface] | None = None
+
+        # Hint bar is static text, build it once
+        self._hint_surf: pygame.Surface | None = None
+
     def show_location(self, name: str):
         """Show a location banner that fades in and out."""
         display_name = name.replace('_', ' ').title()
@@ -78,11 +88,18 @@ class WorldHUD:
             pygame.draw.rect(mini_surf, (*Colors.CARD_BORDER, 185),
                              (0, 0, mini_w, mini_h), width=1, border_radius=10)
 
-            name_font = pygame.font.Font(None, 22)
-            ns = name_font.render(p.nickname, True, Colors.TEXT_PRIMARY)
-            mini_surf.blit(ns, (10, 7))
-            lv_font = pygame.font.Font(None, 19)
-            lv_surf = lv_font.render(f"Lv.{p.level}", True, Colors.TEXT_SECONDARY)
+            if self._name_cache is None or self._name_cache[0] != p.nickname:
+                self._name_cache = (
+                    p.nickname,
+                    _to_display_format(
+                        self._name_font.render(p.nickname, True, Colors.TEXT_PRIMARY)))
+            mini_surf.blit(self._name_cache[1], (10, 7))
+            if self._level_cache is None or self._level_cache[0] != p.level:
+                self._level_cache = (
+                    p.level,
+                    _to_display_format(
+                        self._info_font.render(f"Lv.{p.level}", True, Colors.TEXT_SECONDARY)))
+            lv_surf = self._level_cache[1]
             mini_surf.blit(lv_surf, (mini_w - 10 - lv_surf.get_width(), 9))
 
             hp_pct = p.current_hp / p.stats["hp"] if p.stats["hp"] else 0
@@ -94,16 +111,23 @@ class WorldHUD:
                 fw = max(bar_h, int(bar_w * hp_pct))
                 pygame.draw.rect(mini_surf, hc, (bar_x, bar_y, fw, bar_h), border_radius=4)
 
-            hp_font = pygame.font.Font(None, 19)
-            hp_txt = hp_font.render(f"HP {p.current_hp}/{p.stats['hp']}", True, Colors.TEXT_SECONDARY)
-            mini_surf.blit(hp_txt, (10, 44))
+            hp_key = (p.current_hp, p.stats["hp"])
+            if self._hp_cache is None or self._hp_cache[0] != hp_key:
+                self._hp_cache = (
+                    hp_key,
+                    _to_display_format(
+                        self._info_font.render(f"HP {hp_key[0]}/{hp_key[1]}", True,
+                                               Colors.TEXT_SECONDARY)))
+            mini_surf.blit(self._hp_cache[1], (10, 44))
 
             self.screen.blit(mini_surf, (mx, my))
 
         # -- Bottom: context action hint --
-        hint_text = "SPACE: Interact  |  P: Pokemon  |  I: Items  |  ESC: Menu"
-        hint_surf = pygame.Surface((self.screen_width, 30), pygame.SRCALPHA)
-        hint_surf.fill((10, 10, 20, 130))
-        ht = self.font_small.render(hint_text, True, Colors.TEXT_SECONDARY)
-        hint_surf.blit(ht, ht.get_rect(center=(self.screen_width // 2, 15)))
-        self.screen.blit(hint_surf, (0, self.screen_height - 30))
+        if self._hint_surf is None:
+            hint_text = "SPACE: Interact  |  P: Pokemon  |  I: Items  |  ESC: Menu"
+            hint_surf = pygame.Surface((self.screen_width, 30), pygame.SRCALPHA)
+            hint_surf.fill((10, 10, 20, 130))
+            ht = self.font_small.render(hint_text, True, Colors.TEXT_SECONDARY)
+            hint_surf.blit(ht, ht.get_rect(center=(self.screen_width // 2, 15)))
+            self._hint_surf = _to_display_format(hint_surf)
+        self.screen.blit(self._hint_surf, (0, self.screen_height - 30))
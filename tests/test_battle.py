@@ -0,0 +1,394 @@
+"""Tests for battle move effects and turn flow."""
+
+import math
+import random
+
+from src import battle as battle_module
+from src.battle import Battle, BattleAction, BattleType, Trainer, TurnAction
+from src.player import Player
+from src.pokemon import (
+    EffectTag, Move, PokemonType, StatusCondition, TYPE_CHART, TYPE_EFFECTIVENESS, TYPE_INDEX,
+    create_pokemon_from_species,
+)
+
+
+def _make_battle():
+    player = Player("Ash", 10, 10)
+    player.add_pokemon(create_pokemon_from_species(4, 10))
+    wild = create_pokemon_from_species(16, 10)
+    return Battle(player, wild)
+
+
+def _set_speed(pokemon, speed):
+    pokemon.stats["speed"] = speed
+
+
+class TestMoveEffects:
+    def test_status_effect_applies_and_logs(self):
+        battle = _make_battle()
+        target = battle.opponent_pokemon
+        battle._apply_move_effect("paralysis", battle.player_pokemon, target)
+        assert target.status == StatusCondition.PARALYZED
+        assert battle.battle_log[-1] == f"{target.nickname} was paralyzed!"
+
+    def test_paralysis_on_statused_target_logs_failure(self):
+        battle = _make_battle()
+        target = battle.opponent_pokemon
+        target.status = StatusCondition.BURNED
+        battle._apply_move_effect("paralysis", battle.player_pokemon, target)
+        assert target.status == StatusCondition.BURNED
+        assert "already affected" in battle.battle_log[-1]
+
+    def test_lower_stat_targets_defender(self):
+        battle = _make_battle()
+        battle._apply_move_effect("lower_defense", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        assert battle.opponent_pokemon.stat_stages["defense"] == -1
+        assert battle.player_pokemon.stat_stages["defense"] == 0
+
+    def test_raise_sharply_targets_user(self):
+        battle = _make_battle()
+        battle._apply_move_effect("raise_speed_sharply", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        assert battle.player_pokemon.stat_stages["speed"] == 2
+
+    def test_weather_effect_sets_weather(self):
+        battle = _make_battle()
+        battle._apply_move_effect("weather_rain", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        assert battle.weather == "rain"
+        assert battle.weather_turns == 5
+
+    def test_unknown_effect_is_ignored(self):
+        battle = _make_battle()
+        battle._apply_move_effect("not_a_real_effect", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        assert len(battle.battle_log) == 0
+
+    def test_generated_stat_effects_cover_data_effects(self):
+        battle = _make_battle()
+        battle._apply_move_effect("lower_attack_sharply", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        battle._apply_move_effect("raise_evasion", battle.player_pokemon,
+                                  battle.opponent_pokemon)
+        assert battle.opponent_pokemon.stat_stages["attack"] == -2
+        assert battle.player_pokemon.stat_stages["evasion"] == 1
+
+
+class TestTurnOrder:
+    @staticmethod
+    def _record_moves(monkeypatch):
+        """Stub out move execution and return the list actors get appended to."""
+        ran = []
+        monkeypatch.setitem(battle_module._ACTION_HANDLERS, "move",
+                            lambda self, actor, action: ran.append(actor))
+        monkeypatch.setattr(Battle, "_process_end_of_turn", lambda self: None)
+        return ran
+
+    def _order(self, battle, monkeypatch):
+        """Return actors in the order _execute_turn would run them."""
+        ran = self._record_moves(monkeypatch)
+        battle.player_action = TurnAction("move", battle.player_pokemon, move_index=0)
+        battle.opponent_action = TurnAction("move", battle.opponent_pokemon, move_index=0)
+        battle._execute_turn()
+        return ran
+
+    def test_faster_pokemon_moves_first(self, monkeypatch):
+        battle = _make_battle()
+        _set_speed(battle.player_pokemon, 10)
+        _set_speed(battle.opponent_pokemon, 50)
+        assert self._order(battle, monkeypatch) == ["opponent", "player"]
+
+    def test_priority_beats_speed(self, monkeypatch):
+        battle = _make_battle()
+        _set_speed(battle.player_pokemon, 10)
+        _set_speed(battle.opponent_pokemon, 500)
+        battle.player_action = TurnAction("move", battle.player_pokemon, priority=1,
+                                          move_index=0)
+        battle.opponent_action = TurnAction("move", battle.opponent_pokemon, move_index=0)
+        ran = self._record_moves(monkeypatch)
+        battle._execute_turn()
+        assert ran == ["player", "opponent"]
+
+    def test_trick_room_reverses_speed_order(self, monkeypatch):
+        battle = _make_battle()
+        _set_speed(battle.player_pokemon, 10)
+        _set_speed(battle.opponent_pokemon, 50)
+        battle.trick_room_turns = 3
+        assert self._order(battle, monkeypatch) == ["player", "opponent"]
+
+
+class TestSeededBattle:
+    def test_same_seed_replays_same_rolls(self):
+        player = Player("Ash", 10, 10)
+        player.add_pokemon(create_pokemon_from_species(4, 10))
+        first = Battle(player, create_pokemon_from_species(16, 10), seed=42)
+        second = Battle(player, create_pokemon_from_species(16, 10), seed=42)
+        moves = [first._get_wild_pokemon_move().move_index for _ in range(20)]
+        assert moves == [second._get_wild_pokemon_move().move_index for _ in range(20)]
+
+    def test_damage_and_status_rolls_use_battle_rng(self):
+        attacker = create_pokemon_from_species(4, 10)
+        defender = create_pokemon_from_species(16, 10)
+        move = attacker.moves[0]
+
+        def rolls(seed):
+            rng = random.Random(seed)
+            random.seed()  # reseed the global generator; it must not matter
+            damage = [attacker.calculate_damage(move, defender, rng=rng)[0] for _ in range(20)]
+            attacker.status = StatusCondition.PARALYZED
+            moved = [attacker.process_status(rng)[0] for _ in range(20)]
+            return damage, moved
+
+        assert rolls(3) == rolls(3)
+
+
+class TestCatch:
+    def test_shake_count_bounds(self):
+        rng = random.Random(0)
+        assert battle_module._shake_count(255, rng) == 4
+        counts = {battle_module._shake_count(1, rng) for _ in range(200)}
+        assert counts <= {0, 1, 2, 3, 4}
+        assert 0 in counts
+
+    def test_catch_batch_matches_shake_distribution(self):
+        assert battle_module.simulate_catch_batch(255, 5) == [4] * 5
+        rng = random.Random(1)
+        counts = battle_module.simulate_catch_batch(3, 20000, rng)
+        assert set(counts) <= {0, 1, 2, 3, 4}
+        p = math.ceil(battle_module._CATCH_K * 3 ** 0.1875) / 65536
+        caught = sum(1 for c in counts if c == 4) / len(counts)
+        assert abs(caught - p ** 4) < 0.02
+
+
+class TestEndOfTurn:
+    def test_hail_skips_ice_types(self):
+        battle = _make_battle()
+        battle.opponent_pokemon.types = [PokemonType.ICE]
+        battle.weather, battle.weather_turns = "hail", 3
+        player_hp = battle.player_pokemon.current_hp
+        opponent_hp = battle.opponent_pokemon.current_hp
+        battle._process_end_of_turn()
+        assert battle.player_pokemon.current_hp == player_hp - max(
+            1, battle.player_pokemon.stats["hp"] // 16)
+        assert battle.opponent_pokemon.current_hp == opponent_hp
+        assert "buffeted by the hail" in battle.battle_log[-1]
+
+
+class TestValidActions:
+    def test_bag_hidden_when_inventory_empty(self):
+        battle = _make_battle()
+        assert BattleAction.BAG in battle.get_valid_actions()
+        for item_id in list(battle.player.inventory):
+            battle.player.inventory[item_id] = 0
+        assert BattleAction.BAG not in battle.get_valid_actions()
+
+    def test_pokemon_action_needs_healthy_bench(self):
+        battle = _make_battle()
+        assert BattleAction.POKEMON not in battle.get_valid_actions()
+        battle.player.add_pokemon(create_pokemon_from_species(7, 10))
+        assert BattleAction.POKEMON in battle.get_valid_actions()
+
+    def test_pokemon_action_follows_revive_between_turns(self):
+        battle = _make_battle()
+        battle.player.add_pokemon(create_pokemon_from_species(7, 10))
+        battle.player.pokemon_team[1].take_damage(999)
+        assert BattleAction.POKEMON not in battle.get_valid_actions()
+        battle.player.heal_all_pokemon()
+        assert BattleAction.POKEMON in battle.get_valid_actions()
+
+
+class TestTeamHealth:
+    def test_first_healthy_follows_faint_and_revive(self):
+        player = Player("Ash", 10, 10)
+        for species in (4, 7, 1):
+            player.add_pokemon(create_pokemon_from_species(species, 10))
+        assert player.get_first_healthy_pokemon() is player.pokemon_team[0]
+        player.pokemon_team[0].take_damage(999)
+        assert player.get_first_healthy_pokemon() is player.pokemon_team[1]
+        player.heal_all_pokemon()
+        assert player.get_first_healthy_pokemon() is player.pokemon_team[0]
+
+    def test_switchable_skips_active_and_fainted(self):
+        battle = _make_battle()
+        battle.player.add_pokemon(create_pokemon_from_species(7, 10))
+        battle.player.add_pokemon(create_pokemon_from_species(1, 10))
+        battle.player.pokemon_team[1].is_fainted = True
+        assert [i for i, _ in battle.get_switchable_pokemon()] == [2]
+
+    def test_trainer_can_battle_tracks_team(self):
+        trainer = Trainer("Blue", [create_pokemon_from_species(16, 5)])
+        assert trainer.can_battle()
+        trainer.pokemon_team[0].take_damage(999)
+        assert not trainer.can_battle()
+        assert trainer.get_first_healthy_pokemon() is None
+
+    def test_assigned_team_is_tracked(self):
+        player = Player("Ash", 10, 10)
+        player.add_pokemon(create_pokemon_from_species(7, 5))
+        assert player.can_battle()
+        fainted = create_pokemon_from_species(4, 5)
+        fainted.take_damage(999)
+        player.pokemon_team = [fainted]
+        assert not player.can_battle()
+        assert player.get_lead_pokemon() is None
+
+    def test_pokemon_shared_between_teams(self):
+        pokemon = create_pokemon_from_species(16, 5)
+        trainer = Trainer("Blue", [pokemon])
+        assert trainer.can_battle()
+        player = Player("Ash", 10, 10)
+        player.add_pokemon(pokemon)
+        assert player.can_battle()
+        pokemon.take_damage(999)
+        assert not trainer.can_battle()
+        assert not player.can_battle()
+
+
+class TestStatCache:
+    def test_modified_stat_follows_stages_and_status(self):
+        pokemon = create_pokemon_from_species(4, 10)
+        speed = pokemon.get_modified_stat("speed")
+        pokemon.modify_stat_stage("speed", 2)
+        assert pokemon.get_modified_stat("speed") == int(speed * 2)
+        pokemon.reset_stat_stages()
+        pokemon.status = StatusCondition.PARALYZED
+        assert pokemon.get_modified_stat("speed") == int(speed * 0.25)
+        pokemon.stats["speed"] = 100
+        assert pokemon.get_modified_stat("speed") == 25
+        pokemon.stats.update(speed=200)
+        assert pokemon.get_modified_stat("speed") == 50
+
+
+class TestTypeChart:
+    def test_chart_matches_effectiveness_dict(self):
+        for att, row in TYPE_EFFECTIVENESS.items():
+            for defending, mult in row.items():
+                assert TYPE_CHART[TYPE_INDEX[att]][TYPE_INDEX[defending]] == mult
+
+    def test_matchup_averages_over_attacker_types(self):
+        battle = _make_battle()
+        matchup = battle._calculate_type_matchup(
+            [PokemonType.FIRE, PokemonType.NORMAL], [PokemonType.GRASS])
+        assert matchup == 1.5
+
+
+class TestTrainerAI:
+    def test_move_profiles_follow_moveset_changes(self):
+        pokemon = create_pokemon_from_species(4, 10)
+        before = pokemon.get_move_profiles()
+        assert len(before) == len(pokemon.moves)
+        pokemon.moves = pokemon.moves[:1]
+        assert len(pokemon.get_move_profiles()) == 1
+
+    def test_move_profiles_follow_replaced_moves_and_types(self):
+        pokemon = create_pokemon_from_species(4, 10)
+        pokemon.moves = [Move("Tackle", PokemonType.NORMAL, "physical", 40, 100, 35)]
+        assert pokemon.get_move_profiles()[0][3] == 1.0
+        pokemon.types = [PokemonType.NORMAL]
+        assert pokemon.get_move_profiles()[0][3] == 1.5
+        # A fresh move list each time frees the old Move, whose address the
+        # next one may reuse
+        for power in (50, 60, 70):
+            pokemon.moves = [Move("Tackle", PokemonType.NORMAL, "physical", power, 100, 35)]
+            assert pokemon.get_move_profiles()[0][1] == power
+
+    def test_valid_move_indices_track_pp(self):
+        pokemon = create_pokemon_from_species(4, 10)
+        assert pokemon.get_valid_move_indices() == list(range(len(pokemon.moves)))
+        pokemon.moves[0].current_pp = 0
+        assert 0 not in pokemon.get_valid_move_indices()
+        pokemon.moves[0].restore_pp()
+        assert 0 in pokemon.get_valid_move_indices()
+        pokemon.moves = pokemon.moves[:1]
+        assert pokemon.get_valid_move_indices() == [0]
+
+    def test_valid_move_indices_follow_in_place_edits(self):
+        pokemon = create_pokemon_from_species(4, 10)
+        pokemon.moves = [Move("Tackle", PokemonType.NORMAL, "physical", 40, 100, 35),
+                         Move("Ember", PokemonType.FIRE, "special", 40, 100, 25)]
+        assert pokemon.get_valid_move_indices() == [0, 1]
+        pokemon.moves.pop()
+        assert pokemon.get_valid_move_indices() == [0]
+        spent = Move("Scratch", PokemonType.NORMAL, "physical", 40, 100, 35)
+        spent.current_pp = 0
+        pokemon.moves[0] = spent
+        assert pokemon.get_valid_move_indices() == []
+        spent.restore_pp()
+        assert pokemon.get_valid_move_indices() == [0]
+        pokemon.moves.append(Move("Growl", PokemonType.NORMAL, "status", 0, 100, 40))
+        assert pokemon.get_valid_move_indices() == [0, 1]
+
+    def test_trainer_prefers_super_effective_move(self):
+        player = Player("Ash", 10, 10)
+        player.add_pokemon(create_pokemon_from_species(1, 10))  # Bulbasaur
+        charmander = create_pokemon_from_species(4, 10)
+        charmander.moves = [
+            Move("Tackle", PokemonType.NORMAL, "physical", 40, 100, 35),
+            Move("Ember", PokemonType.FIRE, "special", 40, 100, 25),
+        ]
+        trainer = Trainer("Blue", [charmander], ai_level=2)
+        battle = Battle(player, trainer, BattleType.TRAINER)
+        action = battle._get_trainer_move()
+        assert action.move_index == 1
+
+    def test_best_switch_skips_active_and_fainted(self):
+        player = Player("Ash", 10, 10)
+        player.add_pokemon(create_pokemon_from_species(4, 10))  # Charmander
+        team = [create_pokemon_from_species(1, 10),   # Bulbasaur, active
+                create_pokemon_from_species(7, 10),   # Squirtle, fainted
+                create_pokemon_from_species(16, 10)]  # Pidgey
+        team[1].current_hp = 0
+        team[1].is_fainted = True
+        trainer = Trainer("Blue", team, ai_level=2)
+        battle = Battle(player, trainer, BattleType.TRAINER)
+        assert battle._get_best_switch() == 2
+
+    def test_effect_tags_resolve_raised_stat(self):
+        assert EffectTag.from_effect(None) == EffectTag.NONE
+        assert EffectTag.from_effect("recoil") == EffectTag.OTHER
+        tag = EffectTag.from_effect("raise_sp_defense_sharply")
+        assert tag.is_stat_raise
+        assert tag.raised_stat == "sp_defense"
+        assert not EffectTag.PARALYSIS.is_stat_raise
+
+
+class TestBattleStatus:
+    def test_status_reflects_current_state(self):
+        battle = _make_battle()
+        status = battle.get_battle_status()
+        battle.player_pokemon.take_damage(1)
+        battle.end_battle("ran")
+        refreshed = battle.get_battle_status()
+        assert refreshed is not status
+        assert refreshed["player_pokemon"]["hp"] == status["player_pokemon"]["hp"] - 1
+        assert refreshed["is_over"]
+
+    def test_type_values_follow_in_place_type_edits(self):
+        battle = _make_battle()
+        pokemon = battle.player_pokemon
+        pokemon.types = [PokemonType.FIRE]
+        assert pokemon.type_values == ("fire",)
+        pokemon.types[0] = PokemonType.WATER
+        assert battle.get_battle_status()["player_pokemon"]["types"] == ("water",)
+        pokemon.types.append(PokemonType.FLYING)
+        assert pokemon.type_values == ("water", "flying")
+
+
+class TestBattleLog:
+    def test_log_is_bounded_but_count_keeps_growing(self):
+        battle = _make_battle()
+        for i in range(Battle.LOG_MAX_LENGTH + 10):
+            battle.add_to_log(f"message {i}")
+        assert len(battle.battle_log) == Battle.LOG_MAX_LENGTH
+        assert battle.battle_log[-1] == f"message {Battle.LOG_MAX_LENGTH + 9}"
+        assert battle.log_count == Battle.LOG_MAX_LENGTH + 10
+
+    def test_disabled_log_skips_move_messages(self):
+        battle = _make_battle()
+        battle.log_enabled = False
+        battle._apply_move_effect("paralysis", battle.player_pokemon, battle.opponent_pokemon)
+        battle.add_to_log("ignored")
+        assert battle.opponent_pokemon.status == StatusCondition.PARALYZED
+        assert len(battle.battle_log) == 0
+        assert battle.log_count == 0
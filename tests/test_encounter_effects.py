@@ -0,0 +1,23 @@
+"""Tests for the encounter effect particle kernel."""
+
+from src.encounter_effects import _step_particles
+
+
+class TestStepParticles:
+    def test_integrates_velocity_gravity_and_decel(self):
+        xs, ys, vxs, vys, lives = [0.0], [0.0], [2.0], [-4.0], [1.0]
+        alive = _step_particles(xs, ys, vxs, vys, lives, (), 0.5, 0.5, 0.25)
+        assert alive == 1
+        assert (xs, ys) == ([2.0], [-4.0])
+        assert (vxs, vys) == ([1.0], [-1.5])
+        assert lives == [0.75]
+
+    def test_expired_particles_dropped_from_every_column(self):
+        xs, ys = [1.0, 2.0, 3.0], [0.0, 0.0, 0.0]
+        vxs, vys = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        lives, sizes = [0.1, 0.9, 0.2], [2, 3, 4]
+        alive = _step_particles(xs, ys, vxs, vys, lives, (sizes,), 0.0, 1.0, 0.5)
+        assert alive == 1
+        assert xs == [2.0]
+        assert sizes == [3]
+        assert len(ys) == len(vxs) == len(vys) == len(lives) == 1
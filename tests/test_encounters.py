@@ -10,7 +10,10 @@ from unittest.mock import patch, MagicMock
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.encounters import EncounterSystem, TimeOfDay
+from src.encounters import (EncounterSystem, EncounterData, EncounterRarity,
+                            TimeOfDay, _build_alias_table, _PERFECT_IV_MASKS,
+                            generate_starter_encounter, generate_gift_pokemon,
+                            generate_legendary_encounter)
 from src.map import Map, Tile, TileType
 from src.world import World
 from src.player import Player
@@ -83,6 +86,161 @@ class TestEncounterSystem(unittest.TestCase):
         # Night should have highest rate (1.2x modifier)
         self.assertGreater(time_rates[TimeOfDay.NIGHT], time_rates[TimeOfDay.DAY])
 
+    def test_time_of_day_cached(self):
+        """Test that the time of day is read from the clock once per TTL."""
+        with patch('src.encounters.time.localtime') as mock_localtime, \
+                patch('src.encounters.time.monotonic', return_value=1000.0) as mock_clock:
+            mock_localtime.return_value.tm_hour = 12
+            self.assertEqual(self.encounter_system.get_time_of_day(), TimeOfDay.DAY)
+            mock_localtime.return_value.tm_hour = 22
+            self.assertEqual(self.encounter_system.get_time_of_day(), TimeOfDay.DAY)
+            self.assertEqual(mock_localtime.call_count, 1)
+
+            mock_clock.return_value = 1000.0 + EncounterSystem.TIME_OF_DAY_TTL
+            self.assertEqual(self.encounter_system.get_time_of_day(), TimeOfDay.NIGHT)
+
+    def test_area_info(self):
+        """Test area info groups species by rarity name and is built once."""
+        info = self.encounter_system.get_area_info("route_2")
+        self.assertEqual(info["area_name"], "Route 2")
+        self.assertEqual(set(info["pokemon_by_rarity"]),
+                         {"common", "uncommon", "rare", "very_rare", "legendary"})
+        self.assertEqual([p["species_id"] for p in info["pokemon_by_rarity"]["uncommon"]],
+                         [19, 10])
+        self.assertEqual(info["pokemon_by_rarity"]["common"][0]["level_range"], "3-6")
+        self.assertIs(self.encounter_system.get_area_info("route_2"), info)
+        self.assertIsNone(self.encounter_system.get_area_info("nowhere"))
+
+    def test_encounters_batch(self):
+        """Test batch sampling stays within the table and leaves the chain alone."""
+        table = self.encounter_system.encounter_tables["route_1"]
+        batch = self.encounter_system.get_encounters_batch("route_1", 200)
+        self.assertEqual(len(batch), 200)
+        ranges = {}
+        for enc in table.encounters:
+            ranges.setdefault(enc.species_id, []).append((enc.min_level, enc.max_level))
+        for pokemon in batch:
+            self.assertIn(pokemon.species_id, ranges)
+            self.assertTrue(any(lo <= pokemon.level <= hi
+                                for lo, hi in ranges[pokemon.species_id]))
+        self.assertEqual(self.encounter_system.get_chain_info(), (None, 0))
+        self.assertEqual(self.encounter_system.get_encounters_batch("nowhere", 5), [])
+
+    def test_roll_step(self):
+        """Test areas without a table never roll and the step roll honours the cap."""
+        table = self.encounter_system.encounter_tables["route_1"]
+        self.assertFalse(self.encounter_system.should_encounter("pallet_town"))
+        with patch('src.encounters.random.random', return_value=0.449):
+            self.assertTrue(table.roll_step(100, 100, 2.0))
+        with patch('src.encounters.random.random', return_value=0.45):
+            self.assertFalse(table.roll_step(100, 100, 2.0))
+
+    def test_unknown_species_rejected_at_startup(self):
+        """Test that tables naming a missing species fail when built."""
+        with patch('src.encounters.POKEMON_DATA', {}):
+            with self.assertRaises(ValueError):
+                EncounterSystem()
+
+    def test_shiny_threshold(self):
+        """Test the shiny roll threshold follows the base odds and chain bonus."""
+        encounter = EncounterData(16, 2, 5, EncounterRarity.COMMON)
+        with patch('src.encounters.random.getrandbits', return_value=15):
+            self.assertTrue(self.encounter_system._check_shiny(encounter))
+        with patch('src.encounters.random.getrandbits', return_value=16):
+            self.assertFalse(self.encounter_system._check_shiny(encounter))
+            self.encounter_system.chain_count = 40
+            self.assertTrue(self.encounter_system._check_shiny(encounter))
+        self.assertEqual(self.encounter_system._shiny_thresholds,
+                         {(1.0, 1.0): 16, (1.0, 3.0): 48})
+
+
+class TestAliasTable(unittest.TestCase):
+    """Test the rarity-weighted alias sampler."""
+
+    def _implied_weights(self, prob, alias):
+        """Probability mass the alias table assigns to each index."""
+        n = len(prob)
+        mass = [p / n for p in prob]
+        for i, p in enumerate(prob):
+            mass[alias[i]] += (1.0 - p) / n
+        return mass
+
+    def test_alias_table_matches_weights(self):
+        """Test that the alias table reproduces the rarity weights exactly."""
+        for weights in ([50, 30], [50, 30, 30], [50, 30, 15, 4, 1], [1], [15, 15, 15]):
+            prob, alias = _build_alias_table(weights)
+            total = sum(weights)
+            for got, w in zip(self._implied_weights(prob, alias), weights):
+                self.assertAlmostEqual(got, w / total)
+
+    def test_small_bucket_bisect_matches_weights(self):
+        """Test that the cumulative-weight path hands out each entry by weight."""
+        system = EncounterSystem()
+        table = system.encounter_tables["route_2"]
+        bucket = system._get_bucket(table, TimeOfDay.DAY, None)
+        weights = [EncounterSystem.RARITY_WEIGHTS[enc.rarity] for enc in bucket.encounters]
+        counts = [0] * len(weights)
+        for r in range(sum(weights)):
+            with patch('src.encounters.random.randrange', return_value=r):
+                counts[bucket.roll()] += 1
+        self.assertEqual(counts, weights)
+
+    def test_buckets_filter_by_conditions(self):
+        """Test that cached buckets only hold encounters whose conditions hold."""
+        system = EncounterSystem()
+        table = system.encounter_tables["route_1"]
+        table.encounters.append(EncounterData(
+            41, 3, 5, EncounterRarity.RARE, conditions={"time": TimeOfDay.NIGHT}))
+        table.encounters.append(EncounterData(
+            63, 3, 5, EncounterRarity.RARE, conditions={"requirement": "has_all_badges"}))
+
+        def species(time, player_data=None):
+            bucket = system._get_bucket(table, time, player_data)
+            self.assertEqual(len(bucket.alias_prob), len(bucket.encounters))
+            self.assertEqual(len(bucket.alias_index), len(bucket.encounters))
+            self.assertEqual(bucket.species_ids,
+                             tuple(enc.species_id for enc in bucket.encounters))
+            return set(bucket.species_ids)
+
+        self.assertEqual(species(TimeOfDay.DAY), {16, 19})
+        self.assertEqual(species(TimeOfDay.NIGHT), {16, 19, 41})
+        self.assertEqual(species(TimeOfDay.DAY, {"badge_count": 8}), {16, 19, 63})
+        self.assertEqual(species(TimeOfDay.DAY, {"badge_count": 3}), {16, 19})
+
+        with patch.object(system, 'get_time_of_day', return_value=TimeOfDay.DAY):
+            for _ in range(200):
+                self.assertIn(system.get_encounter("route_1").species_id, (16, 19))
+
+
+class TestSpecialEncounters(unittest.TestCase):
+    """Test IV rolls for starter, gift and legendary Pokemon."""
+
+    def _perfect_count(self, pokemon):
+        return sum(1 for iv in pokemon.ivs.values() if iv == 31)
+
+    def test_guaranteed_perfect_ivs(self):
+        """Test that each generator guarantees its perfect IV count."""
+        for _ in range(50):
+            self.assertGreaterEqual(self._perfect_count(generate_starter_encounter(1)), 3)
+            self.assertGreaterEqual(self._perfect_count(generate_legendary_encounter(7, 50)), 3)
+            self.assertGreaterEqual(self._perfect_count(generate_gift_pokemon(4, 5, 2)), 2)
+        self.assertEqual(self._perfect_count(generate_gift_pokemon(4, 5, 6)), 6)
+
+    def test_perfect_iv_masks(self):
+        """Test the perfect-IV mask tables cover every combination once."""
+        from math import comb
+        for k, masks in enumerate(_PERFECT_IV_MASKS):
+            self.assertEqual(len(set(masks)), comb(6, k))
+            self.assertTrue(all(bin(mask).count("1") == k for mask in masks))
+
+    def test_ivs_cover_every_stat(self):
+        """Test that rolled IVs cover all six stats within range."""
+        for pokemon in (generate_starter_encounter(1), generate_gift_pokemon(4, 5)):
+            self.assertEqual(set(pokemon.ivs),
+                             {"hp", "attack", "defense", "sp_attack", "sp_defense", "speed"})
+            for iv in pokemon.ivs.values():
+                self.assertTrue(0 <= iv <= 31)
+
 
 class TestGrassTileDetection(unittest.TestCase):
     """Test grass tile detection."""
@@ -0,0 +1,40 @@
+"""Tests for the menu UI's cached bag rows."""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+from src.player import Player
+from src.ui.menu_ui import MenuUI
+
+
+class TestBagEntries:
+    def setup_method(self):
+        pygame.init()
+        screen = pygame.display.set_mode((1280, 800))
+        font = pygame.font.Font(None, 20)
+        self.menu = MenuUI(screen, {}, font, font, font, font, font)
+        self.player = Player("Ash", 10, 10)
+
+    def _rows(self):
+        return [(item_id, qty) for item_id, qty, _, _ in
+                self.menu._get_bag_entries(self.player)]
+
+    def test_rows_follow_inventory_changes(self):
+        self.player.inventory = {"potion": 3}
+        assert self._rows() == [("potion", 3)]
+        self.player.inventory["potion"] = 1
+        assert self._rows() == [("potion", 1)]
+
+    def test_reloaded_inventory_not_served_stale_rows(self):
+        """A fresh bag at version 0 (e.g. a save load) must rebuild the rows,
+        even if it reuses the address of the one the rows came from."""
+        self.player.inventory = {"potion": 3, "super_potion": 1}
+        assert self._rows() == [("potion", 3), ("super_potion", 1)]
+        # Two loads in a row free the drawn bag and let the second one take
+        # its place in memory
+        self.player.inventory = {"potion": 41}
+        self.player.inventory = {"potion": 42}
+        assert self._rows() == [("potion", 42)]